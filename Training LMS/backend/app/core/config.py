@@ -20,6 +20,32 @@ class Settings(BaseSettings):
     UPLOAD_DIR: str = "./uploads"
     MAX_UPLOAD_SIZE: int = 10485760  # 10MB
 
+    # 答题自动保存（写缓冲）
+    AUTOSAVE_FLUSH_INTERVAL_SECONDS: float = 2.0  # 定时落库间隔
+    AUTOSAVE_FLUSH_MAX_ITEMS: int = 500  # 缓冲的答案数达到该值时立即落库
+
+    # 内容观看心跳（写缓冲）
+    CONTENT_HEARTBEAT_FLUSH_INTERVAL_SECONDS: float = 5.0  # 定时落库间隔
+    CONTENT_HEARTBEAT_FLUSH_MAX_ITEMS: int = 5000  # 缓冲的字段数达到该值时立即落库
+    CONTENT_HEARTBEAT_MAX_SECONDS: int = 60  # 单次心跳最多计入的观看时长（秒）
+    CONTENT_COMPLETE_RATIO: float = 0.9  # 播放位置或观看时长达到时长的该比例视为看完
+
+    # 限时考试到时自动交卷
+    EXAM_AUTO_SUBMIT_GRACE_SECONDS: int = 60  # 宽限期（网络延迟、交卷请求在途）
+    EXAM_AUTO_SUBMIT_BATCH_SIZE: int = 200  # 每个事务自动交卷的记录数
+
+    # 重新判分（修正答案、修改及格线后后台执行）
+    REGRADE_WORKERS: int = 2  # 后台线程数
+    REGRADE_BATCH_SIZE: int = 200  # 每个事务重新判分的记录数
+    REGRADE_STALE_SECONDS: int = 300  # 执行中的任务超过该时间没有进度视为中断，可重新认领
+
+    # 证书编号号段大小（每次从数据库预分配的号码数）
+    CERTIFICATE_NUMBER_BLOCK_SIZE: int = 100
+
+    # 每日随堂检测（夜间批量预生成）
+    DAILY_QUIZ_WRONG_QUESTIONS: int = 2  # 每套题优先从错题本抽取的题数
+    DAILY_QUIZ_BATCH_SIZE: int = 500  # 每批生成的用户数（一批一条INSERT）
+
     # CORS
     CORS_ORIGINS: List[str] = ["http://localhost:5173", "http://localhost:3000"]
 
@@ -23,3 +23,66 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# 方言相关的 INSERT ... ON CONFLICT（批量upsert）
+def dialect_insert(db):
+    """
+    返回当前数据库方言的 insert()，支持 on_conflict_do_update / on_conflict_do_nothing
+
+    参数可以是 Session、Engine 或 Connection（支持 SQLite 和 PostgreSQL）
+    """
+    bind = db.get_bind() if hasattr(db, "get_bind") else db
+    dialect = bind.dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f"不支持的数据库类型: {dialect}")
+    return insert
+
+
+# 增量结构升级：create_all 只创建缺失的表，不会给已有表补列/补索引
+def upgrade_schema(bind=None) -> list:
+    """
+    为已有表补充模型中新增的列和索引（可重复执行）
+
+    - 新增列必须可为空或带 server_default
+    - 唯一索引创建失败（存在重复数据）时跳过并返回提示，需先运行对应的数据清理脚本
+
+    返回执行的变更描述列表
+    """
+    from sqlalchemy import inspect
+    from sqlalchemy.exc import SQLAlchemyError
+    from sqlalchemy.schema import CreateColumn
+
+    bind = bind or engine
+    changes = []
+    inspector = inspect(bind)
+    existing_tables = set(inspector.get_table_names())
+
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+
+        existing_columns = {col["name"] for col in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing_columns:
+                continue
+            ddl = CreateColumn(column).compile(dialect=bind.dialect)
+            with bind.begin() as conn:
+                conn.exec_driver_sql(f"ALTER TABLE {table.name} ADD COLUMN {ddl}")
+            changes.append(f"新增列 {table.name}.{column.name}")
+
+        existing_indexes = {idx["name"] for idx in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing_indexes:
+                continue
+            try:
+                index.create(bind=bind)
+                changes.append(f"新增索引 {index.name}")
+            except SQLAlchemyError as e:
+                changes.append(f"⚠️ 索引 {index.name} 创建失败（请先清理重复数据）: {e.__class__.__name__}")
+
+    return changes
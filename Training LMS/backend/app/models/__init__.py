@@ -2,11 +2,14 @@ from .user import User, UserRole, DepartmentType
 from .organization import Region, Store
 from .position import Position
 from .course import Course, Chapter, Content, ContentType
-from .exam import Exam, Question, ExamType, QuestionType, QuestionCategory
+from .exam import Exam, Question, ExamQuestion, ExamType, QuestionType, QuestionCategory
 from .learning import (
     CourseProgress,
     ChapterProgress,
+    ContentProgress,
+    LearningSummary,
     ExamRecord,
+    ExamRecordQuestion,
     DailyQuizRecord,
     ValueAssessment,
     LearningStatus,
@@ -16,7 +19,10 @@ from .learning import (
 from .notification import Notification, NotificationType
 from .note import Note
 from .wrong_question import WrongQuestion
-from .certificate import Certificate
+from .certificate import Certificate, CertificateSequence
+from .question_stats import QuestionStats, QuestionOptionStats
+from .question_lsh import QuestionLshBand
+from .regrade import RegradeJob, RegradeReason, RegradeStatus
 
 __all__ = [
     "User",
@@ -31,12 +37,16 @@ __all__ = [
     "ContentType",
     "Exam",
     "Question",
+    "ExamQuestion",
     "ExamType",
     "QuestionType",
     "QuestionCategory",
     "CourseProgress",
     "ChapterProgress",
+    "ContentProgress",
+    "LearningSummary",
     "ExamRecord",
+    "ExamRecordQuestion",
     "DailyQuizRecord",
     "ValueAssessment",
     "LearningStatus",
@@ -47,4 +57,11 @@ __all__ = [
     "Note",
     "WrongQuestion",
     "Certificate",
+    "CertificateSequence",
+    "QuestionStats",
+    "QuestionOptionStats",
+    "QuestionLshBand",
+    "RegradeJob",
+    "RegradeReason",
+    "RegradeStatus",
 ]
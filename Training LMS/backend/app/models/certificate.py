@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from ..core.database import Base
@@ -35,5 +35,22 @@ class Certificate(Base):
     course = relationship("Course", backref="certificates")
     exam_record = relationship("ExamRecord", backref="certificates")
 
+    __table_args__ = (
+        # 每人每门课程一张证书（自动发证和补发脚本的冲突目标）
+        Index("uq_certificates_user_course", "user_id", "course_id", unique=True),
+    )
+
     def __repr__(self):
         return f"<Certificate {self.certificate_number} for User#{self.user_id}>"
+
+
+class CertificateSequence(Base):
+    """证书编号序列（按号段分配，进程在内存中逐个发放）"""
+    __tablename__ = "certificate_sequences"
+
+    name = Column(String(50), primary_key=True, comment="序列名称")
+    next_value = Column(Integer, nullable=False, default=1, comment="下一个未分配的号码")
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), comment="更新时间")
+
+    def __repr__(self):
+        return f"<CertificateSequence {self.name}: {self.next_value}>"
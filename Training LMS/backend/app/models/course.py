@@ -86,7 +86,7 @@ class Chapter(Base):
     id = Column(Integer, primary_key=True, index=True)
 
     # 所属课程
-    course_id = Column(Integer, ForeignKey("courses.id"), nullable=False, comment="所属课程ID")
+    course_id = Column(Integer, ForeignKey("courses.id"), nullable=False, index=True, comment="所属课程ID")
 
     # 基本信息
     title = Column(String(200), nullable=False, comment="章节标题")
@@ -1,7 +1,9 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, Enum as SQLEnum, ForeignKey, Float, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, Enum as SQLEnum, ForeignKey, Float, JSON, Index
+from sqlalchemy.orm import relationship, validates
+from sqlalchemy.orm.attributes import flag_modified
 from sqlalchemy.sql import func
 from ..core.database import Base
+from ..utils.question_options import flag_correct_options, normalize_options
 import enum
 
 
@@ -50,7 +52,7 @@ class Question(Base):
     # 难度等级
     difficulty = Column(String(20), nullable=True, comment="难度（简单/中等/困难）")
 
-    # 选项（JSON格式存储）
+    # 选项（JSON格式存储，写入时统一为标准格式，见 app/utils/question_options.py）
     # 格式：[{"label": "A", "content": "选项内容", "is_correct": true}, ...]
     options = Column(JSON, nullable=True, comment="选项列表（JSON）")
 
@@ -60,6 +62,9 @@ class Question(Base):
     # 解析
     explanation = Column(Text, nullable=True, comment="答案解析")
 
+    # 内容指纹（归一化题干+选项的SHA-1，批量导入按此去重，见 services/question_dedup_service.py）
+    content_hash = Column(String(40), nullable=True, index=True, comment="内容指纹")
+
     # 状态
     is_active = Column(Boolean, default=True, comment="是否启用")
 
@@ -75,6 +80,20 @@ class Question(Base):
     chapter = relationship("Chapter", foreign_keys=[chapter_id])
     creator = relationship("User", foreign_keys=[created_by])
 
+    @validates("options")
+    def validate_options(self, key, options):
+        """写入时统一选项格式（脚本直接创建题目也会经过这里），读取时无需再转换"""
+        options = normalize_options(options, self.correct_answer)
+        flag_correct_options(options, self.correct_answer)
+        return options
+
+    @validates("correct_answer")
+    def validate_correct_answer(self, key, correct_answer):
+        """修改正确答案时同步选项的 is_correct 标记（与 options 的赋值先后无关）"""
+        if flag_correct_options(self.options, correct_answer):
+            flag_modified(self, "options")
+        return correct_answer
+
     def __repr__(self):
         return f"<Question {self.id} ({self.question_type.value})>"
 
@@ -106,6 +125,7 @@ class Exam(Base):
 
     # 题目配置（JSON格式）
     # 格式：{"skill": 15, "value": 5} 表示技能题15道，价值观题5道
+    # 键后可加 ":难度" 限定难度，如 {"skill:困难": 3}（组卷逻辑见 services/paper_service.py）
     question_distribution = Column(JSON, nullable=True, comment="题目分布配置")
 
     # 题目ID列表（JSON格式，固定题目）
@@ -133,6 +153,19 @@ class Exam(Base):
     course = relationship("Course", foreign_keys=[course_id])
     chapter = relationship("Chapter", foreign_keys=[chapter_id])
     creator = relationship("User", foreign_keys=[created_by])
+    question_links = relationship(
+        "ExamQuestion", order_by="ExamQuestion.position", cascade="all, delete-orphan"
+    )
+
+    @validates("question_ids")
+    def sync_question_links(self, key, question_ids):
+        """写入固定考题时同步关联表（脚本直接创建考试也会经过这里）"""
+        question_ids = list(question_ids) if question_ids else None
+        self.question_links = [
+            ExamQuestion(position=position, question_id=question_id)
+            for position, question_id in enumerate(question_ids or [])
+        ]
+        return question_ids
 
     def __repr__(self):
         return f"<Exam {self.title} ({self.exam_type.value})>"
@@ -151,3 +184,23 @@ class Exam(Base):
     def is_formal_exam(self):
         """是否正式考试（周测/月考）"""
         return self.exam_type in [ExamType.WEEKLY_TEST, ExamType.MONTHLY_EXAM, ExamType.FINAL_EXAM]
+
+
+class ExamQuestion(Base):
+    """考试固定考题（有序关联表，Exam.question_ids 的规范数据）"""
+    __tablename__ = "exam_questions"
+
+    id = Column(Integer, primary_key=True)
+    exam_id = Column(Integer, ForeignKey("exams.id"), nullable=False, comment="考试ID")
+    position = Column(Integer, nullable=False, comment="题目顺序（从0开始）")
+    question_id = Column(Integer, ForeignKey("questions.id"), nullable=False, comment="题目ID")
+
+    __table_args__ = (
+        # 按考试取有序题目
+        Index("ix_exam_questions_exam_position", "exam_id", "position"),
+        # 反向：题目被哪些考试使用
+        Index("ix_exam_questions_question_exam", "question_id", "exam_id"),
+    )
+
+    def __repr__(self):
+        return f"<ExamQuestion Exam#{self.exam_id} #{self.position} Q#{self.question_id}>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, Enum as SQLEnum, ForeignKey, Float, JSON
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, Enum as SQLEnum, ForeignKey, Float, JSON, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from ..core.database import Base
@@ -59,6 +59,11 @@ class CourseProgress(Base):
     user = relationship("User")
     course = relationship("Course")
 
+    __table_args__ = (
+        # 每人每门课程一行（获取或创建按此冲突合并）
+        Index("uq_course_progress_user_course", "user_id", "course_id", unique=True),
+    )
+
     def __repr__(self):
         return f"<CourseProgress User#{self.user_id} Course#{self.course_id} ({self.progress_percentage}%)>"
 
@@ -98,10 +103,73 @@ class ChapterProgress(Base):
     chapter = relationship("Chapter")
     course = relationship("Course")
 
+    __table_args__ = (
+        # 每人每个章节一行（获取或创建按此冲突合并）
+        Index("uq_chapter_progress_user_chapter", "user_id", "chapter_id", unique=True),
+        # 按课程查询章节进度
+        Index("ix_chapter_progress_user_course", "user_id", "course_id"),
+    )
+
     def __repr__(self):
         return f"<ChapterProgress User#{self.user_id} Chapter#{self.chapter_id}>"
 
 
+class ContentProgress(Base):
+    """内容学习进度（视频/音频观看位置与时长，由心跳在内存中聚合后批量写入）"""
+    __tablename__ = "content_progress"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    # 关联信息
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, comment="学员ID")
+    content_id = Column(Integer, ForeignKey("contents.id"), nullable=False, comment="内容ID")
+    chapter_id = Column(Integer, ForeignKey("chapters.id"), nullable=False, comment="章节ID（冗余，便于统计章节进度）")
+
+    # 进度
+    position_seconds = Column(Integer, nullable=False, default=0, comment="最后播放位置（秒）")
+    watched_seconds = Column(Integer, nullable=False, default=0, comment="累计观看时长（秒）")
+    completed = Column(Boolean, nullable=False, default=False, comment="是否已完成")
+
+    # 时间记录
+    completed_at = Column(DateTime(timezone=True), nullable=True, comment="完成时间")
+    last_heartbeat_at = Column(DateTime(timezone=True), nullable=True, comment="最后心跳时间")
+
+    # 时间戳
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), comment="创建时间")
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), comment="更新时间")
+
+    __table_args__ = (
+        # 心跳批量写入按 (user_id, content_id) 冲突合并
+        Index("uq_content_progress_user_content", "user_id", "content_id", unique=True),
+        # 按章节统计已完成内容数
+        Index("ix_content_progress_user_chapter", "user_id", "chapter_id", "completed"),
+    )
+
+    def __repr__(self):
+        return f"<ContentProgress User#{self.user_id} Content#{self.content_id} ({self.watched_seconds}s)>"
+
+
+class LearningSummary(Base):
+    """用户学习汇总（学习统计），课程/章节进度写入时增量更新"""
+    __tablename__ = "learning_summaries"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True, comment="学员ID")
+
+    # 课程进度行数（按状态）
+    total_courses = Column(Integer, nullable=False, default=0, comment="课程数（有进度记录的）")
+    in_progress_courses = Column(Integer, nullable=False, default=0, comment="学习中课程数")
+    completed_courses = Column(Integer, nullable=False, default=0, comment="已完成课程数")
+
+    # 章节进度行数
+    total_chapters = Column(Integer, nullable=False, default=0, comment="章节数（有进度记录的）")
+    completed_chapters = Column(Integer, nullable=False, default=0, comment="已完成章节数")
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), comment="更新时间")
+
+    def __repr__(self):
+        return f"<LearningSummary User#{self.user_id} {self.completed_courses}/{self.total_courses}>"
+
+
 class ExamRecord(Base):
     """考试记录"""
     __tablename__ = "exam_records"
@@ -127,6 +195,15 @@ class ExamRecord(Base):
     # 格式：[{"question_id": 1, "user_answer": "A", "is_correct": true}, ...]
     answers = Column(JSON, nullable=True, comment="答题详情")
 
+    # 试卷快照（开考时冻结，判分只读快照，不再查询questions表）
+    # 格式：{"version": 2, "items": [{"id": 1, "type": "single_choice", "options": ["A", "B"], "keys": ["<答案键哈希>"],
+    #        "correct": ["B"], "answer": "B"}, ...]}（correct/answer 为成绩详情展示的答案，版本2起记录）
+    paper_snapshot = Column(JSON, nullable=True, comment="试卷快照")
+
+    # 答题草稿（考试中自动保存，交卷时与提交的答案合并后判分）
+    # 格式：{"<题目ID>": "用户答案", ...}
+    draft_answers = Column(JSON, nullable=True, comment="答题草稿")
+
     # 时间记录
     started_at = Column(DateTime(timezone=True), nullable=True, comment="开始考试时间")
     submitted_at = Column(DateTime(timezone=True), nullable=True, comment="提交时间")
@@ -143,6 +220,25 @@ class ExamRecord(Base):
     # 关联关系
     user = relationship("User")
     exam = relationship("Exam")
+    # 试卷包含的题目（反向索引，开考冻结快照时写入）
+    question_index = relationship("ExamRecordQuestion", cascade="all, delete-orphan")
+
+    __table_args__ = (
+        # 开考时的次数统计/冷却检查走此索引，不扫描历史记录
+        Index("ix_exam_records_user_exam_status_attempt", "user_id", "exam_id", "status", "attempt_number"),
+        # 按考试分批重新判分（修改及格线后）
+        Index("ix_exam_records_exam_id", "exam_id", "id"),
+        # 启动时重建自动交卷调度只读取进行中的记录
+        Index("ix_exam_records_status_started", "status", "started_at"),
+        # 每人每场考试最多一条进行中的记录（拦截重复点击产生的重复考试）
+        # 注意：status 按枚举名存储
+        Index(
+            "uq_exam_records_user_exam_in_progress", "user_id", "exam_id",
+            unique=True,
+            sqlite_where=text("status = 'IN_PROGRESS'"),
+            postgresql_where=text("status = 'IN_PROGRESS'")
+        ),
+    )
 
     def __repr__(self):
         return f"<ExamRecord User#{self.user_id} Exam#{self.exam_id} Attempt#{self.attempt_number} ({self.status.value})>"
@@ -158,6 +254,17 @@ class ExamRecord(Base):
         return self.attempt_number == 1
 
 
+class ExamRecordQuestion(Base):
+    """考试记录包含的题目（反向索引：修正答案后按题目找到受影响的考试记录，不扫描 paper_snapshot）"""
+    __tablename__ = "exam_record_questions"
+
+    question_id = Column(Integer, ForeignKey("questions.id"), primary_key=True, comment="题目ID")
+    exam_record_id = Column(Integer, ForeignKey("exam_records.id"), primary_key=True, comment="考试记录ID")
+
+    def __repr__(self):
+        return f"<ExamRecordQuestion Q#{self.question_id} Record#{self.exam_record_id}>"
+
+
 class DailyQuizRecord(Base):
     """随堂检测记录（每日5题，非强制）"""
     __tablename__ = "daily_quiz_records"
@@ -171,6 +278,9 @@ class DailyQuizRecord(Base):
     # 检测内容
     question_ids = Column(JSON, nullable=False, comment="题目ID列表（5题）")
 
+    # 试卷快照（生成时冻结，格式同 ExamRecord.paper_snapshot，判分只读快照）
+    paper_snapshot = Column(JSON, nullable=True, comment="试卷快照")
+
     # 成绩
     score = Column(Float, nullable=True, comment="成绩（0-100）")
     correct_answers = Column(Integer, default=0, comment="正确题数")
@@ -190,6 +300,11 @@ class DailyQuizRecord(Base):
     # 关联关系
     user = relationship("User")
 
+    __table_args__ = (
+        # 每人每天一套题；打开当日检测为一次索引查找
+        Index("uq_daily_quiz_records_user_date", "user_id", "quiz_date", unique=True),
+    )
+
     def __repr__(self):
         return f"<DailyQuizRecord User#{self.user_id} {self.quiz_date.date()}>"
 
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, BigInteger, ForeignKey, Index
+from ..core.database import Base
+
+
+class QuestionLshBand(Base):
+    """题目 MinHash 签名的 LSH 分段桶键（近似重复检测：新题只需按桶键查候选，不扫描题库）"""
+    __tablename__ = "question_lsh_bands"
+
+    question_id = Column(Integer, ForeignKey("questions.id"), primary_key=True, comment="题目ID")
+    band = Column(Integer, primary_key=True, comment="段号")
+    bucket = Column(BigInteger, nullable=False, comment="桶键（crc32，含段号）")
+
+    __table_args__ = (
+        Index("ix_question_lsh_bands_bucket", "bucket"),
+    )
+
+    def __repr__(self):
+        return f"<QuestionLshBand Q#{self.question_id} band={self.band}>"
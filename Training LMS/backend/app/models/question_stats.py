@@ -0,0 +1,49 @@
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Index
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from ..core.database import Base
+
+
+class QuestionStats(Base):
+    """题目统计（项目分析：难度、区分度），每次交卷增量更新"""
+    __tablename__ = "question_stats"
+
+    question_id = Column(Integer, ForeignKey("questions.id"), primary_key=True, comment="题目ID")
+
+    # 累计量（增量更新，派生指标由累计量计算）
+    attempts = Column(Integer, nullable=False, default=0, comment="作答次数")
+    correct_count = Column(Integer, nullable=False, default=0, comment="答对次数")
+    score_sum = Column(Float, nullable=False, default=0.0, comment="作答者考试总分之和")
+    score_sq_sum = Column(Float, nullable=False, default=0.0, comment="作答者考试总分平方和")
+    correct_score_sum = Column(Float, nullable=False, default=0.0, comment="答对者考试总分之和")
+
+    # 派生指标
+    p_value = Column(Float, nullable=True, comment="难度（答对率，0-1，越低越难）")
+    discrimination = Column(Float, nullable=True, comment="区分度（点二列相关系数，-1~1）")
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), comment="更新时间")
+
+    # 关联关系
+    question = relationship("Question")
+
+    __table_args__ = (
+        # 管理后台按难度/区分度排序筛选
+        Index("ix_question_stats_p_value", "p_value"),
+        Index("ix_question_stats_discrimination", "discrimination"),
+        Index("ix_question_stats_attempts", "attempts"),
+    )
+
+    def __repr__(self):
+        return f"<QuestionStats Q#{self.question_id} p={self.p_value} r={self.discrimination}>"
+
+
+class QuestionOptionStats(Base):
+    """题目选项选择次数（干扰项分析）"""
+    __tablename__ = "question_option_stats"
+
+    question_id = Column(Integer, ForeignKey("questions.id"), primary_key=True, comment="题目ID")
+    label = Column(String(20), primary_key=True, comment="选项标签（判断题为 true/false）")
+    picks = Column(Integer, nullable=False, default=0, comment="被选择次数")
+
+    def __repr__(self):
+        return f"<QuestionOptionStats Q#{self.question_id} {self.label} x{self.picks}>"
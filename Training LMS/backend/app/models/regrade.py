@@ -0,0 +1,53 @@
+from sqlalchemy import Column, Integer, DateTime, Text, Enum as SQLEnum, ForeignKey, Index
+from sqlalchemy.sql import func
+from ..core.database import Base
+import enum
+
+
+class RegradeReason(str, enum.Enum):
+    """重新判分原因"""
+    ANSWER_KEY = "answer_key"  # 题目答案修正
+    PASS_SCORE = "pass_score"  # 考试及格线/总题数/补考规则修改
+
+
+class RegradeStatus(str, enum.Enum):
+    """重新判分任务状态"""
+    PENDING = "pending"  # 等待执行
+    RUNNING = "running"  # 执行中
+    COMPLETED = "completed"  # 已完成
+    FAILED = "failed"  # 失败（可重新执行，从进度位置继续）
+
+
+class RegradeJob(Base):
+    """重新判分任务（分批执行，进度与判分结果同一事务提交，中断后从 last_record_id 继续）"""
+    __tablename__ = "regrade_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    reason = Column(SQLEnum(RegradeReason, values_callable=lambda x: [e.value for e in x]), nullable=False, comment="原因")
+    # 答案修正任务按题目查找记录，及格线任务按考试查找记录（不设外键，题目/考试删除后任务记录保留）
+    question_id = Column(Integer, nullable=True, comment="题目ID")
+    exam_id = Column(Integer, nullable=True, comment="考试ID")
+
+    status = Column(SQLEnum(RegradeStatus, values_callable=lambda x: [e.value for e in x]), nullable=False, default=RegradeStatus.PENDING, comment="状态")
+
+    # 进度
+    total_records = Column(Integer, nullable=False, default=0, comment="待处理记录数（开始时统计）")
+    processed_records = Column(Integer, nullable=False, default=0, comment="已处理记录数")
+    changed_records = Column(Integer, nullable=False, default=0, comment="成绩或状态有变化的记录数")
+    last_record_id = Column(Integer, nullable=False, default=0, comment="已处理到的考试记录ID（续跑位置）")
+    error = Column(Text, nullable=True, comment="失败原因")
+
+    created_by = Column(Integer, ForeignKey("users.id"), nullable=True, comment="触发人ID")
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), comment="创建时间")
+    started_at = Column(DateTime(timezone=True), nullable=True, comment="开始时间")
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True, comment="最近一批完成时间（判断执行进程是否中断）")
+    finished_at = Column(DateTime(timezone=True), nullable=True, comment="完成时间")
+
+    __table_args__ = (
+        # 启动时恢复未完成的任务
+        Index("ix_regrade_jobs_status", "status", "id"),
+    )
+
+    def __repr__(self):
+        return f"<RegradeJob {self.id} {self.reason.value} ({self.status.value})>"
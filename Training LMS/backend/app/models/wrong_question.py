@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, Float, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from ..core.database import Base
@@ -26,6 +26,13 @@ class WrongQuestion(Base):
     mastered = Column(Boolean, default=False, comment="是否已掌握")
     mastered_at = Column(DateTime(timezone=True), nullable=True, comment="掌握时间")
 
+    # 间隔复习（SM-2）：答错或复习后计算下次复习时间，已掌握的错题不再排期
+    ease_factor = Column(Float, nullable=True, default=2.5, comment="难易系数（SM-2，最低1.3）")
+    interval_days = Column(Integer, nullable=True, default=0, comment="当前复习间隔（天）")
+    repetitions = Column(Integer, nullable=True, default=0, comment="连续答对次数")
+    due_at = Column(DateTime(timezone=True), nullable=True, comment="下次复习时间（已掌握为空）")
+    last_reviewed_at = Column(DateTime(timezone=True), nullable=True, comment="最后复习时间")
+
     # 时间戳
     created_at = Column(DateTime(timezone=True), server_default=func.now(), comment="创建时间")
 
@@ -34,5 +41,12 @@ class WrongQuestion(Base):
     question = relationship("Question", backref="wrong_records")
     exam_record = relationship("ExamRecord", backref="wrong_questions")
 
+    __table_args__ = (
+        # 每人每题一条错题记录（交卷时批量 upsert 的冲突目标）
+        Index("uq_wrong_questions_user_question", "user_id", "question_id", unique=True),
+        # 待复习列表按 (due_at, id) 游标分页
+        Index("ix_wrong_questions_user_due", "user_id", "due_at", "id"),
+    )
+
     def __repr__(self):
         return f"<WrongQuestion User#{self.user_id} Q#{self.question_id} (x{self.wrong_count})>"
@@ -1,7 +1,12 @@
 """
 考试系统API路由
 """
-from fastapi import APIRouter, Depends, Query
+import csv
+import io
+import json
+from fastapi import APIRouter, Depends, File, Header, HTTPException, Query, Response, UploadFile, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from ..core.database import get_db
@@ -10,10 +15,11 @@ from ..models.user import User
 from ..schemas.exam import (
     ExamCreate, ExamUpdate, ExamResponse, ExamListResponse,
     QuestionCreate, QuestionUpdate, QuestionResponse,
-    ExamSubmit, ExamResult
+    ExamSubmit, ExamResult, AnswerAutosave
 )
 from ..schemas.learning import ExamRecordResponse
-from ..services import exam_service
+from ..services import exam_service, question_stats_service, question_import_service, regrade_service
+from ..models.regrade import RegradeReason
 
 router = APIRouter(prefix="/api/exams", tags=["exams"])
 
@@ -84,6 +90,7 @@ def get_my_exam_records_api(
 @router.post("/questions", response_model=QuestionResponse, status_code=201)
 def create_question_api(
     question_data: QuestionCreate,
+    allow_duplicate: bool = Query(False, description="跳过近似重复检查"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -96,8 +103,49 @@ def create_question_api(
     - **options**: 选项列表（选择题必填）
     - **correct_answer**: 正确答案（判断题必填）
     - **explanation**: 答案解析
+    - **allow_duplicate**: 题库中已有相似题目时默认返回409，确认不是重复题目时设为true
     """
-    return exam_service.create_question(db, question_data, current_user.id)
+    return exam_service.create_question(db, question_data, current_user.id, allow_duplicate)
+
+
+@router.post("/questions/import")
+def import_questions_api(
+    file: UploadFile = File(..., description="题包文件（.jsonl 或 .csv，UTF-8）"),
+    format: Optional[str] = Query(None, description="题包格式（jsonl/csv），默认按文件扩展名判断"),
+    chunk_size: int = Query(question_import_service.DEFAULT_CHUNK_SIZE, ge=1, le=5000, description="每批插入的题目数"),
+    dry_run: bool = Query(False, description="只校验和去重，不写入"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    批量导入题目（JSON Lines / CSV 题包）
+
+    - 逐行流式读取，按块校验（规则同 scripts/validate_question_data.py）、批量插入
+    - 按内容指纹幂等：题库中已有的相同题目跳过，重复上传同一题包不会产生重复题目
+    - 返回导入报告：总行数、新增、重复跳过、无效行（前100条错误含行号）、耗时和每秒行数
+    """
+    file_format = format or question_import_service.detect_format(file.filename)
+    if file_format not in question_import_service.IMPORT_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"不支持的题包格式 {file_format}，仅支持 jsonl/csv"
+        )
+
+    stream = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    try:
+        return question_import_service.import_questions(
+            db, stream, file_format,
+            creator_id=current_user.id,
+            chunk_size=chunk_size,
+            dry_run=dry_run
+        )
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="题包文件不是UTF-8编码"
+        )
+    finally:
+        stream.detach()
 
 
 @router.get("/questions/count")
@@ -137,6 +185,42 @@ def get_questions_api(
     return exam_service.get_questions(db, skip, limit, question_type, category, course_id, chapter_id)
 
 
+@router.get("/questions/stats")
+def get_question_stats_api(
+    course_id: Optional[int] = None,
+    min_attempts: int = Query(0, ge=0),
+    min_p_value: Optional[float] = Query(None, ge=0, le=1),
+    max_p_value: Optional[float] = Query(None, ge=0, le=1),
+    max_discrimination: Optional[float] = Query(None, ge=-1, le=1),
+    sort_by: str = Query("discrimination", pattern="^(p_value|discrimination|attempts)$"),
+    order: str = Query("asc", pattern="^(asc|desc)$"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=500),
+    exam_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    题目质量统计（项目分析，供内容团队复查和停用题目）
+
+    - **p_value**: 难度（答对率，0-1）
+    - **discrimination**: 区分度（点二列相关系数，低于0.2或为负的题目建议复查）
+    - **option_picks**: 各选项被选择次数（干扰项分析）
+
+    - **course_id**: 课程ID筛选
+    - **exam_id**: 只看某场考试的固定考题
+    - **min_attempts**: 最少作答次数（作答次数太少的统计不可靠）
+    - **min_p_value / max_p_value**: 难度范围
+    - **max_discrimination**: 区分度上限
+    - **sort_by**: 排序字段（p_value/discrimination/attempts），默认区分度从低到高
+    - **order**: asc/desc
+    """
+    return question_stats_service.list_question_stats(
+        db, course_id, min_attempts, min_p_value, max_p_value, max_discrimination,
+        sort_by, order == "desc", skip, limit, exam_id=exam_id
+    )
+
+
 @router.get("/questions/{question_id}", response_model=QuestionResponse)
 def get_question_api(
     question_id: int,
@@ -155,6 +239,18 @@ def get_question_api(
     return question
 
 
+@router.get("/questions/{question_id}/exams", response_model=List[ExamListResponse])
+def get_question_exams_api(
+    question_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    使用该题目作为固定考题的考试（删除或修改题目前确认影响范围）
+    """
+    return exam_service.get_question_exams(db, question_id)
+
+
 @router.put("/questions/{question_id}", response_model=QuestionResponse)
 def update_question_api(
     question_id: int,
@@ -185,6 +281,40 @@ def delete_question_api(
     return {"message": "题目删除成功"}
 
 
+@router.get("/regrade-jobs")
+def list_regrade_jobs_api(
+    status_filter: Optional[str] = Query(None, alias="status", pattern="^(pending|running|completed|failed)$"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    重新判分任务列表（新任务在前）
+
+    修正题目答案、修改考试及格线/补考规则后自动创建任务，后台分批重新判分
+    """
+    return [regrade_service.job_progress(job) for job in regrade_service.list_jobs(db, status_filter, skip, limit)]
+
+
+@router.get("/regrade-jobs/{job_id}")
+def get_regrade_job_api(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    重新判分任务进度
+
+    - **percent**: 已处理记录占比
+    - **changed_records**: 成绩或通过状态有变化的记录数
+    """
+    job = regrade_service.get_job(db, job_id)
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="重新判分任务不存在")
+    return regrade_service.job_progress(job)
+
+
 @router.get("/{exam_id}", response_model=ExamResponse)
 def get_exam_api(
     exam_id: int,
@@ -250,6 +380,25 @@ def publish_exam_api(
 
 # ========== 考试答题API ==========
 
+@router.post("/{exam_id}/regrade", status_code=202)
+def regrade_exam_api(
+    exam_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    手动重新判分该考试的已交卷记录（按试卷快照的答案键和当前考试设置，后台执行）
+
+    返回任务进度，之后用 GET /api/exams/regrade-jobs/{job_id} 查询
+    """
+    if not exam_service.get_exam_by_id(db, exam_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="考试不存在")
+    job = regrade_service.create_job(db, RegradeReason.PASS_SCORE, exam_id=exam_id, created_by=current_user.id)
+    db.commit()
+    regrade_service.submit_job(job.id)
+    return regrade_service.job_progress(job)
+
+
 @router.post("/{exam_id}/start")
 def start_exam_api(
     exam_id: int,
@@ -259,51 +408,101 @@ def start_exam_api(
     """
     开始考试
 
-    - 创建考试记录
+    - 创建考试记录（已有进行中的考试时继续该场考试）
     - 检查补考冷却期
     - 检查最大尝试次数
-    - 返回题目列表
+    - 返回题目列表（不含答案；未配置固定考题时按题目分布随机抽题）
+    - 冻结试卷快照，交卷判分只读快照，考试中编辑题目不影响本场判分
+    - 响应头 ETag 标识试卷内容，可用于 GET /{exam_id}/paper 的 If-None-Match
 
     - **exam_id**: 考试ID
     """
-    exam_record = exam_service.start_exam(db, current_user.id, exam_id)
+    exam_record, paper = exam_service.start_exam_with_paper(db, current_user.id, exam_id)
 
-    # 获取考试对象
-    exam = exam_service.get_exam_by_id(db, exam_id)
+    # 题目列表是缓存好的JSON字节，直接拼接进响应，不再逐题序列化
+    return _paper_response({
+        "exam_record_id": exam_record.id,
+        "exam_id": exam_record.exam_id,
+        "attempt_number": exam_record.attempt_number,
+        "started_at": exam_record.started_at,
+    }, paper, "考试已开始")
 
-    # 获取题目列表
-    questions = []
-    if exam and exam.question_ids:
-        from ..models.exam import Question
-        questions = db.query(Question).filter(Question.id.in_(exam.question_ids)).all()
-
-        # 转换 options 格式（从字典转为列表，并统一字段名）
-        for q in questions:
-            if q.options:
-                if isinstance(q.options, dict):
-                    # 字典格式: {'A': '选项内容', 'B': '...'}
-                    # 转换为列表格式: [{"label": "A", "content": "选项内容", "is_correct": False}, ...]
-                    q.options = [
-                        {"label": key, "content": value, "is_correct": False}
-                        for key, value in q.options.items()
-                    ]
-                elif isinstance(q.options, list):
-                    # 统一字段名：将 "text" 改为 "content"
-                    for option in q.options:
-                        if "text" in option and "content" not in option:
-                            option["content"] = option.pop("text")
-
-        # 转换为响应格式
-        from ..schemas.exam import QuestionResponse
-        questions = [QuestionResponse.from_orm(q) for q in questions]
 
-    return {
+@router.get("/{exam_id}/paper")
+def get_exam_paper_api(
+    exam_id: int,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    获取进行中考试的试卷（不含答案）
+
+    - 试卷未变化时（If-None-Match 与 ETag 一致）返回 304，不重复下发题目
+
+    - **exam_id**: 考试ID
+    """
+    exam_record, paper = exam_service.get_in_progress_paper(db, current_user.id, exam_id)
+    if if_none_match == paper.etag:
+        return Response(status_code=304, headers={"ETag": paper.etag})
+
+    return _paper_response({
         "exam_record_id": exam_record.id,
         "exam_id": exam_record.exam_id,
         "attempt_number": exam_record.attempt_number,
         "started_at": exam_record.started_at,
-        "questions": questions,
-        "message": "考试已开始"
+    }, paper, "考试进行中")
+
+
+def _paper_response(fields: dict, paper, message: str) -> Response:
+    """把缓存的题目JSON字节拼接进响应体"""
+    head = json.dumps(jsonable_encoder(fields), ensure_ascii=False)[:-1].encode("utf-8")
+    tail = json.dumps(message, ensure_ascii=False).encode("utf-8")
+    return Response(
+        content=head + b',"questions":' + paper.body + b',"message":' + tail + b"}",
+        media_type="application/json",
+        headers={"ETag": paper.etag}
+    )
+
+
+@router.patch("/{exam_id}/answers")
+def autosave_answers_api(
+    exam_id: int,
+    autosave: AnswerAutosave,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    自动保存答案（考试中每答一题或定时调用，只需提交有变化的题目）
+
+    - 答案先进入写缓冲，按时间间隔或数量阈值批量落库
+    - 交卷时与提交的答案合并判分，设备掉线后重新进入考试不会丢失已保存的答案
+
+    - **exam_id**: 考试ID
+    """
+    exam_record = exam_service.autosave_answers(db, current_user.id, exam_id, autosave.answers)
+    return {
+        "exam_record_id": exam_record.id,
+        "saved": len(autosave.answers),
+        "message": "答案已保存"
+    }
+
+
+@router.get("/{exam_id}/answers")
+def get_saved_answers_api(
+    exam_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    获取进行中考试已自动保存的答案（重新进入考试时恢复作答）
+
+    - **exam_id**: 考试ID
+    """
+    exam_record, answers = exam_service.get_saved_answers(db, current_user.id, exam_id)
+    return {
+        "exam_record_id": exam_record.id,
+        "answers": answers
     }
 
 
@@ -344,116 +543,73 @@ def get_exam_result_detail_api(
     - 总分、得分、是否通过
     - 每道题的详细信息（题目、选项、用户答案、正确答案、是否正确、解析）
 
+    已判分的记录不可变，渲染结果按考试记录缓存
+
     - **exam_id**: 考试ID
     """
-    from ..models.learning import ExamRecord
-    from ..models.exam import Question, Exam
-    from fastapi import HTTPException, status
-
-    # 获取用户最近一次的考试记录
-    record = (
-        db.query(ExamRecord)
-        .filter(
-            ExamRecord.exam_id == exam_id,
-            ExamRecord.user_id == current_user.id,
-            ExamRecord.status == "completed"
-        )
-        .order_by(ExamRecord.completed_at.desc())
-        .first()
-    )
-
-    if not record:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="未找到该考试的成绩记录"
-        )
-
-    # 获取考试信息
-    exam = db.query(Exam).filter(Exam.id == exam_id).first()
-    if not exam:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="考试不存在"
-        )
-
-    # 构建答题详情
-    question_details = []
-    if record.answers:
-        for answer_item in record.answers:
-            question_id = answer_item.get("question_id")
-            question = db.query(Question).filter(Question.id == question_id).first()
-
-            if question:
-                question_details.append({
-                    "question_id": question.id,
-                    "content": question.content,
-                    "question_type": question.question_type.value,
-                    "options": question.options,
-                    "user_answer": answer_item.get("user_answer"),
-                    "correct_answer": question.correct_answer,
-                    "is_correct": answer_item.get("is_correct", False),
-                    "explanation": question.explanation,
-                    "category": question.category,
-                })
-
-    return {
-        "exam_id": exam.id,
-        "exam_title": exam.title,
-        "user_id": current_user.id,
-        "username": current_user.username,
-        "score": record.score,
-        "total_score": exam.total_score,
-        "passed": record.passed,
-        "pass_score": exam.pass_score,
-        "attempt_number": record.attempt_number,
-        "total_questions": record.total_questions,
-        "correct_answers": record.correct_answers,
-        "started_at": record.started_at.isoformat() if record.started_at else None,
-        "submitted_at": record.submitted_at.isoformat() if record.submitted_at else None,
-        "time_spent_seconds": (
-            int((record.submitted_at - record.started_at).total_seconds())
-            if record.started_at and record.submitted_at
-            else None
-        ),
-        "question_details": question_details,
-        "can_retake": (
-            record.attempt_number < exam.max_attempts
-            if exam.allow_retake and exam.max_attempts
-            else False
-        ),
-        "next_retake_at": (
-            record.next_retake_at.isoformat() if record.next_retake_at else None
-        ),
-    }
+    return exam_service.get_exam_result_detail(db, current_user, exam_id)
 
 
 @router.get("/{exam_id}/results")
 def get_exam_results_api(
     exam_id: int,
+    format: str = Query("json", pattern="^(json|csv|ndjson)$"),
+    after_id: Optional[int] = Query(None, ge=0),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
-    获取考试成绩列表（用于管理后台导出）
+    获取考试成绩列表（用于管理后台导出，流式输出）
 
     - **exam_id**: 考试ID
+    - **format**: 输出格式 json（数组）/ csv / ndjson（每行一个JSON）
+    - **after_id**: 只导出考试记录ID大于该值的成绩（断点续传）
     """
-    from ..models.learning import ExamRecord
-    from ..models.user import User as UserModel
-
-    records = db.query(ExamRecord).filter(ExamRecord.exam_id == exam_id).all()
-
-    results = []
-    for record in records:
-        user = db.query(UserModel).filter(UserModel.id == record.user_id).first()
-        results.append({
-            "exam_id": record.exam_id,
-            "user_id": record.user_id,
-            "username": user.username if user else "Unknown",
-            "score": record.score,
-            "passed": record.passed,
-            "attempt_number": record.attempt_number,
-            "completed_at": record.completed_at.isoformat() if record.completed_at else None
-        })
-
-    return results
+    if not exam_service.get_exam_by_id(db, exam_id):
+        from fastapi import HTTPException, status
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="考试不存在")
+
+    rows = exam_service.iter_exam_results(exam_id, after_id)
+
+    if format == "csv":
+        return StreamingResponse(
+            _encode_csv(rows),
+            media_type="text/csv; charset=utf-8",
+            headers={"Content-Disposition": f'attachment; filename="exam_{exam_id}_results.csv"'}
+        )
+    if format == "ndjson":
+        return StreamingResponse(_encode_ndjson(rows), media_type="application/x-ndjson")
+    return StreamingResponse(_encode_json_array(rows), media_type="application/json")
+
+
+EXPORT_COLUMNS = [
+    "exam_record_id", "exam_id", "user_id", "username", "full_name", "attempt_number",
+    "status", "score", "passed", "started_at", "completed_at", "created_at",
+]
+
+
+def _encode_csv(rows):
+    """CSV（带BOM，Excel可直接打开中文）"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS)
+    buffer.write("\ufeff")
+    writer.writeheader()
+    for index, row in enumerate(rows, 1):
+        writer.writerow(row)
+        if index % exam_service.EXPORT_PAGE_SIZE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def _encode_ndjson(rows):
+    for row in rows:
+        yield json.dumps(row, ensure_ascii=False) + "\n"
+
+
+def _encode_json_array(rows):
+    yield "["
+    for index, row in enumerate(rows):
+        yield ("," if index else "") + json.dumps(row, ensure_ascii=False)
+    yield "]"
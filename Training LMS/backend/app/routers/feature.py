@@ -3,7 +3,7 @@
 包含: 通知、笔记、错题本、证书、排行榜、搜索、个人资料
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import desc, func, or_
 from typing import List, Optional
 from datetime import datetime
@@ -14,6 +14,8 @@ from ..models import (
     User, Notification, NotificationType, Note, WrongQuestion,
     Certificate, Question, Course, Chapter, ExamRecord
 )
+from ..schemas.wrong_question import WrongQuestionReviewBatch
+from ..services import wrong_question_service
 
 router = APIRouter(prefix="/api/features", tags=["辅助功能"])
 
@@ -220,7 +222,10 @@ def get_wrong_questions(
     current_user: User = Depends(get_current_user)
 ):
     """获取当前用户的错题列表"""
-    query = db.query(WrongQuestion).filter(WrongQuestion.user_id == current_user.id)
+    # 预加载题目和课程，避免逐条查询
+    query = db.query(WrongQuestion).options(
+        joinedload(WrongQuestion.question).joinedload(Question.course)
+    ).filter(WrongQuestion.user_id == current_user.id)
 
     if course_id:
         # 通过question的course_id筛选
@@ -232,23 +237,63 @@ def get_wrong_questions(
     wrong_questions = query.order_by(desc(WrongQuestion.last_wrong_date)).all()
 
     # 直接返回数组，使用蛇形命名，包含完整的显示信息
-    return [
-        {
-            "id": wq.id,
-            "question_id": wq.question_id,
-            "course_name": wq.question.course.title if wq.question and wq.question.course else "",
-            "question_type": wq.question.question_type.value if wq.question else "",
-            "content": wq.question.content if wq.question else "",
-            "options": wq.question.options if wq.question and wq.question.options else {},
-            "my_answer": wq.my_answer,
-            "correct_answer": wq.question.correct_answer if wq.question else "",
-            "explanation": wq.question.explanation if wq.question else "",
-            "wrong_count": wq.wrong_count,
-            "last_wrong_date": wq.last_wrong_date.isoformat() if wq.last_wrong_date else None,
-            "mastered": wq.mastered
-        }
-        for wq in wrong_questions
-    ]
+    return [_wrong_question_item(wq) for wq in wrong_questions]
+
+
+def _wrong_question_item(wq: WrongQuestion) -> dict:
+    """错题的显示信息（错题列表和待复习列表共用）"""
+    return {
+        "id": wq.id,
+        "question_id": wq.question_id,
+        "course_name": wq.question.course.title if wq.question and wq.question.course else "",
+        "question_type": wq.question.question_type.value if wq.question else "",
+        "content": wq.question.content if wq.question else "",
+        "options": wq.question.options if wq.question and wq.question.options else {},
+        "my_answer": wq.my_answer,
+        "correct_answer": wq.question.correct_answer if wq.question else "",
+        "explanation": wq.question.explanation if wq.question else "",
+        "wrong_count": wq.wrong_count,
+        "last_wrong_date": wq.last_wrong_date.isoformat() if wq.last_wrong_date else None,
+        "mastered": wq.mastered,
+        "due_at": wq.due_at.isoformat() if wq.due_at else None,
+        "interval_days": wq.interval_days or 0
+    }
+
+
+@router.get("/wrong-questions/review", summary="获取待复习错题")
+def get_due_wrong_questions(
+    cursor: Optional[str] = Query(None, description="分页游标（上一页返回的next_cursor）"),
+    limit: int = Query(wrong_question_service.REVIEW_PAGE_SIZE, ge=1, le=100, description="每页数量"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    获取到期待复习的错题（间隔复习，最早到期的在前）
+
+    每次只返回一页，next_cursor 为空表示没有更多到期错题
+    """
+    items, next_cursor = wrong_question_service.get_due_reviews(db, current_user.id, cursor, limit)
+    return {
+        "items": [_wrong_question_item(wq) for wq in items],
+        "next_cursor": next_cursor
+    }
+
+
+@router.post("/wrong-questions/reviews", summary="提交错题复习结果")
+def submit_wrong_question_reviews(
+    batch: WrongQuestionReviewBatch,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    复习结束后批量提交评分（quality 0-5，SM-2）
+
+    按评分计算每道错题的下次复习时间，复习间隔足够长的错题自动标记为已掌握
+    """
+    return wrong_question_service.apply_reviews(
+        db, current_user.id,
+        [(review.wrong_question_id, review.quality) for review in batch.reviews]
+    )
 
 
 @router.put("/wrong-questions/{wrong_question_id}/master", summary="标记错题为已掌握")
@@ -268,6 +313,7 @@ def mark_wrong_question_mastered(
 
     wq.mastered = True
     wq.mastered_at = datetime.utcnow()
+    wq.due_at = None  # 移出复习队列
     db.commit()
 
     return {"message": "已标记为掌握"}
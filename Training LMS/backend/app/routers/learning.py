@@ -1,7 +1,9 @@
 """
 学习进度API路由
 """
-from fastapi import APIRouter, Depends, Query
+import json
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi.encoders import jsonable_encoder
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from ..core.database import get_db
@@ -9,10 +11,11 @@ from ..core.security import get_current_user
 from ..models.user import User
 from ..schemas.learning import (
     CourseProgressResponse, ChapterProgressResponse,
-    ExamRecordResponse, DailyQuizRecordResponse,
-    ValueAssessmentResponse
+    ExamRecordResponse, DailyQuizRecordResponse, DailyQuizSubmit,
+    ValueAssessmentResponse, LearningEventSync, LearningEventSyncResponse,
+    ContentHeartbeat, ContentHeartbeatResponse, ContentProgressResponse
 )
-from ..services import learning_service
+from ..services import learning_service, daily_quiz_service
 
 router = APIRouter(prefix="/api/learning", tags=["learning"])
 
@@ -133,6 +136,112 @@ def get_chapter_progress_api(
     return progress
 
 
+# ========== 内容观看进度API ==========
+
+@router.post("/contents/{content_id}/heartbeat", response_model=ContentHeartbeatResponse, status_code=202)
+def content_heartbeat_api(
+    content_id: int,
+    heartbeat: ContentHeartbeat,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    上报视频/音频观看心跳（建议每10-30秒一次，暂停和离开页面时各补报一次）
+
+    - 服务器在内存中按学员和内容合并，每隔几秒批量写入
+    - 单次心跳计入的观看时长有上限
+    - 播放位置或累计观看时长接近内容时长时自动标记为已看完
+
+    - **content_id**: 内容ID
+    """
+    return learning_service.record_heartbeat(
+        db, current_user.id, content_id,
+        heartbeat.position_seconds, heartbeat.watched_seconds, heartbeat.completed
+    )
+
+
+@router.get("/chapters/{chapter_id}/contents/progress", response_model=List[ContentProgressResponse])
+def get_content_progress_api(
+    chapter_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    获取章节内各内容的观看进度（播放位置、累计观看时长、是否看完）
+
+    - **chapter_id**: 章节ID
+    """
+    return learning_service.get_content_progress(db, current_user.id, chapter_id)
+
+
+# ========== 学习事件批量同步API ==========
+
+@router.post("/events/sync", response_model=LearningEventSyncResponse)
+def sync_learning_events_api(
+    payload: LearningEventSync,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    批量同步学习事件（门店平板离线记录，联网后一次上报）
+
+    - 事件：开始/完成 课程或章节，附客户端发生时间
+    - 按发生时间依次应用，一个事务提交；重复上报同一批事件不会重复计数
+    - 课程/章节不存在的事件跳过，在 rejected 中返回
+    - 返回涉及课程的课程进度和章节进度（客户端据此覆盖本地状态）
+
+    示例:
+    ```json
+    {
+      "events": [
+        {"type": "start", "target": "chapter", "target_id": 3, "occurred_at": "2026-01-05T09:00:00+08:00"},
+        {"type": "complete", "target": "chapter", "target_id": 3, "occurred_at": "2026-01-05T09:20:00+08:00"}
+      ]
+    }
+    ```
+    """
+    return learning_service.sync_learning_events(db, current_user.id, payload.events)
+
+
+# ========== 每日随堂检测API ==========
+
+@router.get("/daily-quiz/today")
+def get_today_quiz_api(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    打开今日随堂检测（每日5题，非强制）
+
+    - 题目由夜间任务预生成（错题本优先，其余取自本部门课程题库）
+    - 返回检测记录和不含答案的题目列表（questions）
+    """
+    record = daily_quiz_service.open_daily_quiz(db, current_user.id)
+    paper = daily_quiz_service.render_daily_quiz(db, record)
+    fields = DailyQuizRecordResponse.model_validate(record).model_dump()
+    head = json.dumps(jsonable_encoder(fields), ensure_ascii=False)[:-1].encode("utf-8")
+    return Response(
+        content=head + b',"questions":' + paper.body + b"}",
+        media_type="application/json",
+        headers={"ETag": paper.etag}
+    )
+
+
+@router.post("/daily-quiz/today/submit", response_model=DailyQuizRecordResponse)
+def submit_today_quiz_api(
+    submission: DailyQuizSubmit,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    提交今日随堂检测
+
+    - 与考试共用判分引擎，答错的题目写入错题本
+    - 每天只能提交一次
+    """
+    return daily_quiz_service.submit_daily_quiz(db, current_user.id, submission.answers)
+
+
 # ========== 学习统计API ==========
 
 @router.get("/stats")
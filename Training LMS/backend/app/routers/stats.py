@@ -223,3 +223,36 @@ def get_exam_performance_api(
         })
 
     return {"exam_performance": exam_performance}
+
+
+@router.get("/runtime")
+def get_runtime_stats_api(
+    current_user: User = Depends(get_current_user)
+):
+    """
+    获取运行时指标（当前进程）
+
+    返回:
+    - answer_key_cache: 答案键缓存命中/未命中/淘汰统计
+    - question_pools: 组卷题库ID池规模
+    - result_detail_cache: 成绩详情缓存统计
+    - paper_cache: 试卷序列化缓存统计（整卷/单题）
+    - autosave_buffer: 答题自动保存缓冲区深度与落库耗时
+    - exam_deadlines: 限时考试自动交卷调度积压
+    - certificate_numbers: 证书编号号段余量
+    - chapter_counts: 课程章节数缓存统计
+    - content_heartbeats: 观看心跳缓冲区深度与落库耗时
+    """
+    from ..services import grading_service, paper_service, exam_service, certificate_service, course_service, learning_service
+
+    return {
+        "answer_key_cache": grading_service.get_answer_key_cache_stats(),
+        "question_pools": paper_service.get_pool_stats(),
+        "result_detail_cache": exam_service.get_result_detail_cache_stats(),
+        "paper_cache": paper_service.get_paper_cache_stats(),
+        "autosave_buffer": exam_service.get_autosave_stats(),
+        "exam_deadlines": exam_service.get_deadline_stats(),
+        "certificate_numbers": certificate_service.get_certificate_number_stats(),
+        "chapter_counts": course_service.get_chapter_count_cache_stats(),
+        "content_heartbeats": learning_service.get_heartbeat_stats(),
+    }
@@ -1,10 +1,11 @@
 """
 考试系统相关Schemas
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from ..models.exam import ExamType, QuestionType, QuestionCategory
+from ..utils.question_options import normalize_options
 
 
 # ========== Question Schemas ==========
@@ -32,7 +33,12 @@ class QuestionBase(BaseModel):
 
 class QuestionCreate(QuestionBase):
     """创建题目"""
-    pass
+
+    @field_validator("options")
+    @classmethod
+    def normalize_options(cls, v):
+        """选项统一为标准格式（label/content/is_correct）"""
+        return normalize_options(v)
 
 
 class QuestionUpdate(BaseModel):
@@ -48,6 +54,12 @@ class QuestionUpdate(BaseModel):
     explanation: Optional[str] = None
     is_active: Optional[bool] = None
 
+    @field_validator("options")
+    @classmethod
+    def normalize_options(cls, v):
+        """选项统一为标准格式（label/content/is_correct）"""
+        return normalize_options(v)
+
 
 class QuestionResponse(QuestionBase):
     """题目响应"""
@@ -155,10 +167,15 @@ class AnswerSubmit(BaseModel):
     user_answer: str = Field(..., description="用户答案")
 
 
+class AnswerAutosave(BaseModel):
+    """自动保存答案（只需提交有变化的题目）"""
+    answers: List[AnswerSubmit] = Field(..., min_length=1, description="答案补丁列表")
+
+
 class ExamSubmit(BaseModel):
     """提交考试"""
     exam_id: int = Field(..., gt=0, description="考试ID")
-    answers: List[AnswerSubmit] = Field(..., min_length=1, description="答案列表")
+    answers: List[AnswerSubmit] = Field(default_factory=list, description="答案列表（与已自动保存的答案合并，本次提交优先）")
     time_spent: Optional[int] = Field(None, ge=0, description="答题耗时（秒）")
 
 
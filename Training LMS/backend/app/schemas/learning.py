@@ -4,7 +4,9 @@
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
+import enum
 from ..models.learning import LearningStatus, ExamStatus, ValueScore
+from .exam import AnswerSubmit
 
 
 # ========== CourseProgress Schemas ==========
@@ -93,6 +95,79 @@ class ChapterProgressResponse(ChapterProgressBase):
         from_attributes = True
 
 
+# ========== ContentProgress Schemas ==========
+
+class ContentHeartbeat(BaseModel):
+    """观看心跳（播放中每隔一段时间上报）"""
+    position_seconds: int = Field(..., ge=0, description="当前播放位置（秒）")
+    watched_seconds: int = Field(default=0, ge=0, description="距上次心跳实际观看的时长（秒）")
+    completed: bool = Field(default=False, description="是否已看完（文档等没有时长的内容由客户端上报）")
+
+
+class ContentHeartbeatResponse(BaseModel):
+    """心跳受理结果（异步落库）"""
+    content_id: int
+    accepted_seconds: int = Field(..., description="本次计入的观看时长（秒）")
+    completed: bool
+
+
+class ContentProgressResponse(BaseModel):
+    """内容学习进度响应"""
+    id: int
+    user_id: int
+    content_id: int
+    chapter_id: int
+    position_seconds: int
+    watched_seconds: int
+    completed: bool
+    completed_at: Optional[datetime]
+    last_heartbeat_at: Optional[datetime]
+
+    class Config:
+        from_attributes = True
+
+
+# ========== 学习事件批量同步 ==========
+
+class LearningEventType(str, enum.Enum):
+    """学习事件类型"""
+    START = "start"  # 开始学习
+    COMPLETE = "complete"  # 完成学习
+
+
+class LearningEventTarget(str, enum.Enum):
+    """学习事件对象"""
+    COURSE = "course"
+    CHAPTER = "chapter"
+
+
+class LearningEvent(BaseModel):
+    """学习事件（客户端离线记录，联网后批量上报）"""
+    type: LearningEventType = Field(..., description="事件类型：start/complete")
+    target: LearningEventTarget = Field(..., description="对象：course/chapter")
+    target_id: int = Field(..., gt=0, description="课程ID或章节ID")
+    occurred_at: Optional[datetime] = Field(None, description="客户端发生时间（不传按服务器接收时间）")
+
+
+class LearningEventSync(BaseModel):
+    """批量同步学习事件"""
+    events: List[LearningEvent] = Field(..., min_length=1, max_length=500, description="事件列表（按发生顺序）")
+
+
+class LearningEventRejection(BaseModel):
+    """未能应用的事件"""
+    index: int = Field(..., description="事件在请求中的序号（从0开始）")
+    detail: str = Field(..., description="原因")
+
+
+class LearningEventSyncResponse(BaseModel):
+    """批量同步结果：应用后的课程和章节进度"""
+    accepted: int = Field(..., description="已应用的事件数（重复事件也计入）")
+    rejected: List[LearningEventRejection] = Field(default_factory=list)
+    courses: List[CourseProgressResponse] = Field(default_factory=list, description="涉及课程的进度")
+    chapters: List[ChapterProgressResponse] = Field(default_factory=list, description="涉及课程的章节进度")
+
+
 # ========== ExamRecord Schemas ==========
 
 class ExamRecordBase(BaseModel):
@@ -172,6 +247,11 @@ class DailyQuizRecordUpdate(BaseModel):
     completed_at: Optional[datetime] = None
 
 
+class DailyQuizSubmit(BaseModel):
+    """提交随堂检测"""
+    answers: List[AnswerSubmit] = Field(..., min_length=1, description="答案列表")
+
+
 class DailyQuizRecordResponse(DailyQuizRecordBase):
     """随堂检测记录响应"""
     id: int
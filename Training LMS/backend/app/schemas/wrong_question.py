@@ -0,0 +1,16 @@
+"""
+错题本相关Schemas
+"""
+from pydantic import BaseModel, Field
+from typing import List
+
+
+class WrongQuestionReview(BaseModel):
+    """单道错题的复习评分"""
+    wrong_question_id: int = Field(..., gt=0, description="错题记录ID")
+    quality: int = Field(..., ge=0, le=5, description="回忆质量（0-5，<3为没记住，SM-2评分）")
+
+
+class WrongQuestionReviewBatch(BaseModel):
+    """一次复习的评分（复习结束后批量提交）"""
+    reviews: List[WrongQuestionReview] = Field(..., min_length=1, max_length=200, description="评分列表")
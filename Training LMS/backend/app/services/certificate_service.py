@@ -0,0 +1,154 @@
+"""
+证书业务逻辑
+
+- 期末考试、试用期考核通过后自动发证（每人每门课程一张）
+- 证书编号按号段从 certificate_sequences 表预分配，进程内逐个发放：
+  发证时不需要查询编号是否已存在，也不需要唯一冲突重试
+- 号段在独立事务中分配并立即提交，发证事务回滚或进程重启只会留下编号空洞，不会重号
+"""
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+from ..core.config import settings
+from ..core.database import engine, dialect_insert
+from ..models.certificate import Certificate, CertificateSequence
+from ..models.exam import Exam, ExamType
+from ..models.learning import ExamRecord, ExamStatus
+
+# 通过后发证的考试类型
+CERTIFIED_EXAM_TYPES = (ExamType.FINAL_EXAM, ExamType.PROBATION_EXAM)
+
+CERTIFICATE_TITLES = {
+    ExamType.FINAL_EXAM: "{course}结业证书",
+    ExamType.PROBATION_EXAM: "{course}试用期考核证书",
+}
+
+
+class BlockSequence:
+    """号段序列：一次从数据库取一段号码，在内存中逐个发放（线程安全）"""
+
+    def __init__(self, name: str, block_size: int = 100):
+        self.name = name
+        self.block_size = block_size
+        self._next = 0
+        self._end = 0  # 当前号段 [_next, _end)
+        self._lock = threading.Lock()
+        self.blocks_allocated = 0
+
+    def next(self) -> int:
+        """发放一个号码（号段用完时分配新号段）"""
+        with self._lock:
+            if self._next >= self._end:
+                self._allocate(self.block_size)
+            value = self._next
+            self._next += 1
+            return value
+
+    def reserve(self, count: int) -> None:
+        """
+        确保内存中至少还有count个号码
+
+        SQLite同一时刻只允许一个写事务：批量发证前先预留，避免在已开始写入的事务中途再去分配号段
+        """
+        with self._lock:
+            if self._end - self._next < count:
+                self._allocate(max(self.block_size, count))
+
+    def _allocate(self, size: int) -> None:
+        """在独立事务中原子地推进序列（UPDATE ... RETURNING），立即提交"""
+        advance = update(CertificateSequence).where(
+            CertificateSequence.name == self.name
+        ).values(
+            next_value=CertificateSequence.next_value + size
+        ).returning(CertificateSequence.next_value)
+
+        with engine.begin() as conn:
+            end = conn.execute(advance).scalar()
+            if end is None:
+                # 首次使用：创建序列（并发创建时忽略冲突）
+                insert = dialect_insert(conn)
+                conn.execute(insert(CertificateSequence).values(name=self.name, next_value=1).on_conflict_do_nothing())
+                end = conn.execute(advance).scalar()
+
+        self._next, self._end = end - size, end
+        self.blocks_allocated += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "name": self.name,
+                "remaining": self._end - self._next,
+                "blocks_allocated": self.blocks_allocated,
+            }
+
+
+_certificate_numbers = BlockSequence("certificate", settings.CERTIFICATE_NUMBER_BLOCK_SIZE)
+
+
+def format_certificate_number(value: int, issued_at: datetime) -> str:
+    """证书编号：SC + 发证年份 + 8位序号，如 SC202600000123"""
+    return f"SC{issued_at:%Y}{value:08d}"
+
+
+def is_certified_exam(exam: Exam) -> bool:
+    """该考试通过后是否发证"""
+    return exam.exam_type in CERTIFIED_EXAM_TYPES and exam.course_id is not None
+
+
+def build_certificate_row(
+    exam: Exam,
+    exam_record: ExamRecord,
+    course_title: str,
+    issued_at: datetime
+) -> Dict[str, Any]:
+    """生成证书数据（分配编号）"""
+    return {
+        "user_id": exam_record.user_id,
+        "course_id": exam.course_id,
+        "exam_record_id": exam_record.id,
+        "certificate_number": format_certificate_number(_certificate_numbers.next(), issued_at),
+        "title": CERTIFICATE_TITLES[exam.exam_type].format(course=course_title),
+        "description": f"通过「{exam.title}」",
+        "score": round(exam_record.score) if exam_record.score is not None else None,
+        "issued_at": issued_at,
+        "issuer": "SmartIce培训管理系统",
+        "created_at": issued_at,
+    }
+
+
+def insert_certificates(db: Session, rows: List[Dict[str, Any]]) -> None:
+    """批量写入证书（一条INSERT，已有同课程证书的用户跳过），不提交事务"""
+    if not rows:
+        return
+    insert = dialect_insert(db)
+    db.execute(
+        insert(Certificate).values(rows).on_conflict_do_nothing(
+            index_elements=[Certificate.user_id, Certificate.course_id]
+        )
+    )
+
+
+def issue_for_record(db: Session, exam: Exam, exam_record: ExamRecord, issued_at: Optional[datetime] = None) -> bool:
+    """
+    判分后发证：通过期末考试/试用期考核时写入证书（不提交事务）
+
+    返回是否尝试发证（已有证书时由唯一索引跳过）
+    """
+    if exam_record.status != ExamStatus.PASSED or not is_certified_exam(exam):
+        return False
+
+    row = build_certificate_row(exam, exam_record, exam.course.title, issued_at or datetime.utcnow())
+    insert_certificates(db, [row])
+    return True
+
+
+def reserve_numbers(count: int) -> None:
+    """批量发证前预留编号"""
+    _certificate_numbers.reserve(count)
+
+
+def get_certificate_number_stats() -> Dict[str, Any]:
+    """证书编号号段统计"""
+    return _certificate_numbers.stats()
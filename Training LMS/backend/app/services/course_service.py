@@ -1,15 +1,18 @@
 """
 课程管理业务逻辑
 """
+from sqlalchemy import func
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from typing import Optional, List, Dict, Any, NamedTuple
 from fastapi import HTTPException, status
 from ..models.course import Course, Chapter, Content
+from ..models.learning import ContentProgress
 from ..schemas.course import (
     CourseCreate, CourseUpdate,
     ChapterCreate, ChapterUpdate,
     ContentCreate, ContentUpdate
 )
+from ..utils.cache import LRUCache
 
 
 # ========== Course CRUD ==========
@@ -101,6 +104,7 @@ def delete_course(db: Session, course_id: int) -> bool:
 
     db.delete(course)
     db.commit()
+    invalidate_chapter_count(course_id)
     return True
 
 
@@ -144,6 +148,7 @@ def create_chapter(db: Session, chapter_data: ChapterCreate) -> Chapter:
     db.add(chapter)
     db.commit()
     db.refresh(chapter)
+    invalidate_chapter_count(chapter.course_id)
     return chapter
 
 
@@ -186,11 +191,40 @@ def delete_chapter(db: Session, chapter_id: int) -> bool:
             detail=f"章节 ID {chapter_id} 不存在"
         )
 
+    course_id = chapter.course_id
     db.delete(chapter)
     db.commit()
+    invalidate_chapter_count(course_id)
+    _content_info_cache.discard_items_if(lambda content_id, info: info.chapter_id == chapter_id)
     return True
 
 
+# ========== 章节数缓存 ==========
+
+# 课程章节总数（学习进度计算用，进程内缓存；新增/删除章节时失效）
+CHAPTER_COUNT_CACHE_SIZE = 4096
+_chapter_count_cache = LRUCache(maxsize=CHAPTER_COUNT_CACHE_SIZE)
+
+
+def get_chapter_count(db: Session, course_id: int) -> int:
+    """课程章节总数（与 Course.chapters 一致，含停用章节）"""
+    count = _chapter_count_cache.get(course_id)
+    if count is None:
+        count = db.query(func.count(Chapter.id)).filter(Chapter.course_id == course_id).scalar()
+        _chapter_count_cache.set(course_id, count)
+    return count
+
+
+def invalidate_chapter_count(course_id: int) -> None:
+    """课程章节增删后清除缓存"""
+    _chapter_count_cache.pop(course_id)
+
+
+def get_chapter_count_cache_stats() -> Dict[str, Any]:
+    """章节数缓存统计"""
+    return _chapter_count_cache.stats()
+
+
 # ========== Content CRUD ==========
 
 def create_content(db: Session, content_data: ContentCreate) -> Content:
@@ -237,6 +271,7 @@ def update_content(db: Session, content_id: int, content_data: ContentUpdate) ->
 
     db.commit()
     db.refresh(content)
+    invalidate_content_info(content_id)
     return content
 
 
@@ -249,6 +284,41 @@ def delete_content(db: Session, content_id: int) -> bool:
             detail=f"内容 ID {content_id} 不存在"
         )
 
+    db.query(ContentProgress).filter(ContentProgress.content_id == content_id).delete(synchronize_session=False)
     db.delete(content)
     db.commit()
+    invalidate_content_info(content_id)
     return True
+
+
+# ========== 内容信息缓存 ==========
+
+class ContentInfo(NamedTuple):
+    """观看心跳需要的内容信息"""
+    chapter_id: int
+    duration: Optional[int]  # 时长（秒），文档/图片为空
+
+
+# 心跳频率高，按内容ID缓存所属章节和时长；内容修改/删除时失效
+CONTENT_INFO_CACHE_SIZE = 8192
+_content_info_cache = LRUCache(maxsize=CONTENT_INFO_CACHE_SIZE)
+
+
+def get_content_info(db: Session, content_id: int) -> Optional[ContentInfo]:
+    """已启用内容的章节和时长，内容不存在或已停用时返回None"""
+    info = _content_info_cache.get(content_id)
+    if info is None:
+        row = db.query(Content.chapter_id, Content.duration).filter(
+            Content.id == content_id,
+            Content.is_active == True
+        ).first()
+        if row is None:
+            return None
+        info = ContentInfo(chapter_id=row.chapter_id, duration=row.duration)
+        _content_info_cache.set(content_id, info)
+    return info
+
+
+def invalidate_content_info(content_id: int) -> None:
+    """内容修改/删除后清除缓存"""
+    _content_info_cache.pop(content_id)
@@ -0,0 +1,326 @@
+"""
+每日随堂检测业务逻辑
+
+- 夜间批量为所有在职学员预生成当天的5道题（按用户ID分批，一批一条INSERT）
+- 抽题优先错题本（按答错次数加权），其余从本部门课程题库抽取，不足时用全题库补齐
+- 生成时冻结试卷快照，交卷复用考试判分引擎，只读快照判分
+- 早上打开当日检测按 (user_id, quiz_date) 唯一索引查找一次；未预生成的（如当天新入职）即时补生成
+
+检测日期按UTC日期计算，与系统其他时间字段一致
+"""
+import random
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Set
+from sqlalchemy import exists
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from ..core.config import settings
+from ..core.database import dialect_insert
+from ..models.course import Course
+from ..models.exam import Question
+from ..models.learning import DailyQuizRecord
+from ..models.user import User, DepartmentType
+from ..models.wrong_question import WrongQuestion
+from ..schemas.exam import AnswerSubmit
+from . import paper_service, wrong_question_service
+from .grading_service import load_questions, grade_answer_sheet, grade_with_snapshot, SNAPSHOT_VERSION
+
+DAILY_QUIZ_SIZE = 5
+
+
+def quiz_day(value: Optional[Any] = None) -> datetime:
+    """检测日期统一为当天零点（不传则为今天）"""
+    value = value or datetime.utcnow()
+    if isinstance(value, datetime):
+        value = value.date()
+    if not isinstance(value, date):
+        raise ValueError("检测日期格式无效")
+    return datetime(value.year, value.month, value.day)
+
+
+# ========== 批量预生成 ==========
+
+def _department_course_ids(db: Session) -> Dict[Any, Set[int]]:
+    """各部门的课程池：已发布且启用的本部门课程 + 不限部门的课程"""
+    rows = db.query(Course.id, Course.department_type).filter(
+        Course.is_active == True,
+        Course.is_published == True
+    ).all()
+
+    shared = {course_id for course_id, department in rows if department is None}
+    pools = {}
+    for department in DepartmentType:
+        if department == DepartmentType.HEADQUARTERS:
+            continue  # 总部人员不限部门
+        pools[department] = shared | {course_id for course_id, d in rows if d == department}
+    return pools
+
+
+def _load_wrong_questions(db: Session, user_ids: List[int]) -> Dict[int, List[tuple]]:
+    """一次查询加载一批用户未掌握的错题 → {用户ID: [(题目ID, 答错次数), ...]}"""
+    rows = db.query(
+        WrongQuestion.user_id, WrongQuestion.question_id, WrongQuestion.wrong_count
+    ).join(Question, Question.id == WrongQuestion.question_id).filter(
+        WrongQuestion.user_id.in_(user_ids),
+        WrongQuestion.mastered == False,
+        Question.is_active == True
+    ).all()
+
+    wrong = defaultdict(list)
+    for user_id, question_id, wrong_count in rows:
+        wrong[user_id].append((question_id, wrong_count or 1))
+    return wrong
+
+
+def weighted_sample(items: List[tuple], k: int) -> List[int]:
+    """按权重无放回抽取k个（items 为 [(ID, 权重), ...]，权重越大越容易被抽中）"""
+    if k <= 0 or not items:
+        return []
+    keyed = sorted(items, key=lambda item: random.random() ** (1.0 / max(item[1], 1)), reverse=True)
+    return [item_id for item_id, _ in keyed[:k]]
+
+
+def pick_questions(
+    db: Session,
+    wrong_items: List[tuple],
+    course_ids: Optional[Set[int]],
+    size: int = DAILY_QUIZ_SIZE,
+    wrong_quota: Optional[int] = None
+) -> List[int]:
+    """
+    为一名学员抽题
+
+    1. 错题本按答错次数加权抽取 wrong_quota 道
+    2. 部门课程池补足
+    3. 仍不足时依次用剩余错题、全题库补齐
+    """
+    wrong_quota = settings.DAILY_QUIZ_WRONG_QUESTIONS if wrong_quota is None else wrong_quota
+    picked = weighted_sample(wrong_items, min(wrong_quota, size))
+    chosen = set(picked)
+
+    def fill(question_ids: List[int]) -> None:
+        for question_id in question_ids:
+            if len(picked) < size and question_id not in chosen:
+                picked.append(question_id)
+                chosen.add(question_id)
+
+    if course_ids is None or course_ids:
+        fill(paper_service.sample_questions(db, size - len(picked), course_ids=course_ids, exclude=chosen))
+    if len(picked) < size:
+        fill(weighted_sample([item for item in wrong_items if item[0] not in chosen], size - len(picked)))
+    if len(picked) < size:
+        fill(paper_service.sample_questions(db, size - len(picked), exclude=chosen))
+
+    random.shuffle(picked)
+    return picked
+
+
+def _complete_paper(
+    db: Session,
+    question_ids: List[int],
+    questions: Dict[int, Question],
+    course_ids: Optional[Set[int]],
+    size: int = DAILY_QUIZ_SIZE
+) -> Optional[List[int]]:
+    """
+    去掉已删除/停用的题目并补抽（题库ID池是进程内缓存，其他进程删除的题目可能仍在池中）
+
+    - 不可用的题目同时移出题库ID池，避免再次抽中
+    - 先从部门课程池补抽，不足时用全题库；补抽的题目加载后并入 questions
+    - 仍不足 size 道时返回None
+    """
+    def usable(question_id: int) -> bool:
+        return question_id in questions and questions[question_id].is_active
+
+    for question_id in question_ids:
+        if not usable(question_id):
+            paper_service.remove_question(question_id)
+    kept = [qid for qid in question_ids if usable(qid)]
+
+    for pool in (course_ids, None) if course_ids is not None else (None,):
+        if len(kept) >= size:
+            break
+        if pool is not None and not pool:
+            continue
+        extra = paper_service.sample_questions(db, size - len(kept), course_ids=pool, exclude=set(kept))
+        questions.update(load_questions(db, extra))
+        for question_id in extra:
+            if usable(question_id):
+                kept.append(question_id)
+            else:
+                paper_service.remove_question(question_id)
+
+    return kept if len(kept) >= size else None
+
+
+def generate_daily_quizzes(
+    db: Session,
+    quiz_date: Optional[Any] = None,
+    user_ids: Optional[Iterable[int]] = None,
+    batch_size: Optional[int] = None
+) -> Dict[str, int]:
+    """
+    为在职学员批量生成指定日期的随堂检测（可重复执行，已生成的跳过）
+
+    - 按用户ID分批：每批一次查询错题、一次加载题目、一条 INSERT ... ON CONFLICT DO NOTHING
+    - 每批提交一次事务
+    - user_ids 不为空时只为这些用户生成
+
+    返回 {"users": 扫描用户数, "generated": 生成数, "insufficient": 题库不足跳过数}
+    """
+    day = quiz_day(quiz_date)
+    batch_size = batch_size or settings.DAILY_QUIZ_BATCH_SIZE
+    department_courses = _department_course_ids(db)
+    result = {"users": 0, "generated": 0, "insufficient": 0}
+    last_id = 0
+
+    while True:
+        query = db.query(User.id, User.department_type).filter(
+            User.id > last_id,
+            User.is_active == True,
+            ~exists().where(
+                DailyQuizRecord.user_id == User.id,
+                DailyQuizRecord.quiz_date == day
+            )
+        )
+        if user_ids is not None:
+            query = query.filter(User.id.in_(list(user_ids)))
+        users = query.order_by(User.id).limit(batch_size).all()
+        if not users:
+            break
+
+        wrong = _load_wrong_questions(db, [user_id for user_id, _ in users])
+        papers = {}
+        for user_id, department in users:
+            question_ids = pick_questions(db, wrong.get(user_id, []), department_courses.get(department))
+            if len(question_ids) < DAILY_QUIZ_SIZE:
+                result["insufficient"] += 1
+                continue
+            papers[user_id] = question_ids
+
+        # 整批题目一次加载，生成快照（同时预热单题JSON缓存，早上打开检测直接复用）
+        questions = load_questions(db, (qid for ids in papers.values() for qid in ids))
+        departments = dict(users)
+        for user_id, question_ids in list(papers.items()):
+            if all(qid in questions and questions[qid].is_active for qid in question_ids):
+                continue
+            # 抽到了已删除/停用的题目：补抽，补不足时跳过该学员（不中断整批）
+            completed = _complete_paper(db, question_ids, questions, department_courses.get(departments[user_id]))
+            if completed is None:
+                result["insufficient"] += 1
+                del papers[user_id]
+            else:
+                papers[user_id] = completed
+        now = datetime.utcnow()
+        rows = [
+            {
+                "user_id": user_id,
+                "quiz_date": day,
+                "question_ids": question_ids,
+                "paper_snapshot": {
+                    "version": SNAPSHOT_VERSION,
+                    "items": [paper_service.render_question(questions[qid])[1] for qid in question_ids],
+                },
+                "total_questions": len(question_ids),
+                "correct_answers": 0,
+                "is_completed": False,
+                "created_at": now,
+            }
+            for user_id, question_ids in papers.items()
+        ]
+        if rows:
+            insert = dialect_insert(db)
+            stmt = insert(DailyQuizRecord).values(rows).on_conflict_do_nothing(
+                index_elements=[DailyQuizRecord.user_id, DailyQuizRecord.quiz_date]
+            )
+            db.execute(stmt)
+        db.commit()
+
+        result["users"] += len(users)
+        result["generated"] += len(rows)
+        last_id = users[-1][0]
+
+    return result
+
+
+# ========== 学员答题 ==========
+
+def get_daily_quiz(db: Session, user_id: int, quiz_date: Optional[Any] = None) -> Optional[DailyQuizRecord]:
+    """按 (user_id, quiz_date) 唯一索引查找当日检测"""
+    return db.query(DailyQuizRecord).filter(
+        DailyQuizRecord.user_id == user_id,
+        DailyQuizRecord.quiz_date == quiz_day(quiz_date)
+    ).first()
+
+
+def open_daily_quiz(db: Session, user_id: int) -> DailyQuizRecord:
+    """打开今日检测（夜间任务未覆盖到的学员即时补生成）"""
+    record = get_daily_quiz(db, user_id)
+    if record is None:
+        generate_daily_quizzes(db, user_ids=[user_id])
+        record = get_daily_quiz(db, user_id)
+    if record is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="题库题目不足，今日暂无随堂检测"
+        )
+    return record
+
+
+def render_daily_quiz(db: Session, record: DailyQuizRecord) -> paper_service.RenderedPaper:
+    """当日检测的题目（不含答案，单题JSON走缓存）"""
+    return paper_service.render_questions(db, list(record.question_ids))
+
+
+def submit_daily_quiz(db: Session, user_id: int, answers: List[AnswerSubmit]) -> DailyQuizRecord:
+    """
+    提交今日检测
+
+    - 按生成时冻结的快照判分（与考试共用判分引擎）
+    - 只判本套题目，答错的题目写入错题本
+    - 条件更新 is_completed，重复提交返回400
+    """
+    record = get_daily_quiz(db, user_id)
+    if record is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="今日随堂检测不存在"
+        )
+    if record.is_completed:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="今日随堂检测已提交"
+        )
+
+    if record.paper_snapshot:
+        correct_count, answer_details = grade_with_snapshot(record.paper_snapshot, answers)
+    else:
+        quiz_question_ids = set(record.question_ids)
+        correct_count, answer_details = grade_answer_sheet(
+            db, [answer for answer in answers if answer.question_id in quiz_question_ids]
+        )
+
+    now = datetime.utcnow()
+    total = record.total_questions or len(record.question_ids)
+    updated = db.query(DailyQuizRecord).filter(
+        DailyQuizRecord.id == record.id,
+        DailyQuizRecord.is_completed == False
+    ).update({
+        "score": round(correct_count / total * 100, 1) if total else 0,
+        "correct_answers": correct_count,
+        "answers": answer_details,
+        "is_completed": True,
+        "completed_at": now,
+    }, synchronize_session=False)
+    if not updated:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="今日随堂检测已提交"
+        )
+
+    wrong_question_service.record_wrong_answers(db, user_id, answer_details, wrong_at=now)
+    db.commit()
+    db.refresh(record)
+    return record
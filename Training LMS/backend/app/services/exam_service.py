@@ -1,23 +1,87 @@
 """
 考试系统业务逻辑（含补考逻辑）
 """
+from sqlalchemy import func, case, insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime, timedelta
 from fastapi import HTTPException, status
-from ..models.exam import Exam, Question
-from ..models.learning import ExamRecord, ExamStatus
+from ..models.exam import Exam, ExamQuestion, Question
+from ..models.learning import ExamRecord, ExamRecordQuestion, ExamStatus
 from ..schemas.exam import (
     ExamCreate, ExamUpdate,
     QuestionCreate, QuestionUpdate,
     ExamSubmit, AnswerSubmit
 )
+from .grading_service import (
+    grade_answer_sheet, invalidate_answer_key, compile_answer_key,
+    load_questions, grade_with_snapshot, apply_score, snapshot_question_ids, snapshot_options
+)
+from . import paper_service, wrong_question_service, certificate_service, question_stats_service, question_dedup_service
+from . import regrade_service
+from ..models.regrade import RegradeReason
+from ..models.user import User
+from ..core.config import settings
+from ..core.database import SessionLocal
+from ..utils.cache import LRUCache
+from ..utils.write_behind import WriteBehindBuffer
+from ..utils.deadline import DeadlineScheduler
+from ..utils.question_options import read_options
 
 
 # ========== Exam CRUD ==========
 
+def _ensure_questions_exist(db: Session, question_ids: Optional[List[int]]) -> None:
+    """固定考题中的题目必须存在（一次查询）"""
+    if not question_ids:
+        return
+    found = {question_id for (question_id,) in db.query(Question.id).filter(Question.id.in_(set(question_ids)))}
+    missing = [question_id for question_id in question_ids if question_id not in found]
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"题目 ID {', '.join(map(str, missing[:10]))} 不存在"
+        )
+
+
+def backfill_question_links(db: Session, batch_size: int = 500) -> int:
+    """
+    为没有关联表数据的固定考题考试补建 exam_questions（按ID分批提交，可重复执行），返回补建的考试数
+
+    关联表上线前创建的考试只有 Exam.question_ids，组卷、判分都按关联表取题，应用启动时补建；
+    按 question_ids 的顺序写入，已删除的题目跳过。顺序不一致等情况用 scripts/migrate_exam_questions.py 全量校对
+    """
+    backfilled = 0
+    last_id = 0
+    while True:
+        exams = db.query(Exam.id, Exam.question_ids).filter(
+            Exam.id > last_id,
+            Exam.question_ids.isnot(None),
+            ~db.query(ExamQuestion.id).filter(ExamQuestion.exam_id == Exam.id).exists()
+        ).order_by(Exam.id).limit(batch_size).all()
+        if not exams:
+            return backfilled
+
+        referenced = {question_id for _, question_ids in exams for question_id in question_ids or []}
+        existing = {question_id for (question_id,) in db.query(Question.id).filter(Question.id.in_(referenced))}
+        rows = [
+            {"exam_id": exam_id, "position": position, "question_id": question_id}
+            for exam_id, question_ids in exams
+            for position, question_id in enumerate(
+                question_id for question_id in question_ids or [] if question_id in existing
+            )
+        ]
+        if rows:
+            db.execute(insert(ExamQuestion.__table__), rows)
+            backfilled += len({row["exam_id"] for row in rows})
+        db.commit()
+        last_id = exams[-1].id
+
+
 def create_exam(db: Session, exam_data: ExamCreate, creator_id: int) -> Exam:
-    """创建考试"""
+    """创建考试（固定考题写入 question_ids 时同步到 exam_questions 关联表）"""
+    _ensure_questions_exist(db, exam_data.question_ids)
     exam = Exam(
         **exam_data.model_dump(),
         created_by=creator_id
@@ -66,14 +130,32 @@ def update_exam(db: Session, exam_id: int, exam_data: ExamUpdate) -> Exam:
             detail=f"考试 ID {exam_id} 不存在"
         )
 
-    for field, value in exam_data.model_dump(exclude_unset=True).items():
+    changes = exam_data.model_dump(exclude_unset=True)
+    if "question_ids" in changes:
+        _ensure_questions_exist(db, changes["question_ids"])
+    scoring_before = _scoring_rules(exam)
+    for field, value in changes.items():
         setattr(exam, field, value)
 
+    # 判分规则修改后，已交卷的记录后台重新判分
+    job = None
+    if _scoring_rules(exam) != scoring_before:
+        job = regrade_service.create_job(db, RegradeReason.PASS_SCORE, exam_id=exam_id)
     db.commit()
     db.refresh(exam)
+    if job is not None:
+        regrade_service.submit_job(job.id)
+
+    # 考题可能已修改，清除整卷缓存
+    paper_service.invalidate_exam_paper(exam_id)
     return exam
 
 
+def _scoring_rules(exam: Exam) -> Tuple:
+    """影响成绩和补考状态的考试设置"""
+    return (exam.pass_score, exam.total_questions, exam.allow_retake, exam.max_attempts, exam.retake_cooldown_days)
+
+
 def delete_exam(db: Session, exam_id: int) -> bool:
     """删除考试"""
     exam = get_exam_by_id(db, exam_id)
@@ -85,6 +167,8 @@ def delete_exam(db: Session, exam_id: int) -> bool:
 
     db.delete(exam)
     db.commit()
+
+    paper_service.invalidate_exam_paper(exam_id)
     return True
 
 
@@ -112,18 +196,37 @@ def publish_exam(db: Session, exam_id: int) -> Exam:
 
 # ========== Question CRUD ==========
 
-def create_question(db: Session, question_data: QuestionCreate, creator_id: int) -> Question:
-    """创建题目"""
+def create_question(db: Session, question_data: QuestionCreate, creator_id: int, allow_duplicate: bool = False) -> Question:
+    """
+    创建题目
+
+    创建前检查题库中是否已有近似重复的题目（MinHash 文本相似且答案相同），有则返回409，allow_duplicate=True 时跳过检查
+    """
     question = Question(
         **question_data.model_dump(),
         created_by=creator_id
     )
+    if not allow_duplicate:
+        question_dedup_service.ensure_not_duplicate(db, question)
+
+    question.content_hash = question_dedup_service.content_hash(question.content, question.options)
     db.add(question)
+    db.flush()
+    question_dedup_service.index_question(db, question)
     db.commit()
     db.refresh(question)
+
+    paper_service.refresh_question(question)
     return question
 
 
+def get_question_exams(db: Session, question_id: int) -> List[Exam]:
+    """使用该题目作为固定考题的考试（走 exam_questions 的 question_id 索引）"""
+    return db.query(Exam).filter(
+        Exam.id.in_(db.query(ExamQuestion.exam_id).filter(ExamQuestion.question_id == question_id))
+    ).order_by(Exam.id).all()
+
+
 def get_question_by_id(db: Session, question_id: int) -> Optional[Question]:
     """根据ID获取题目"""
     return db.query(Question).filter(Question.id == question_id).first()
@@ -162,11 +265,28 @@ def update_question(db: Session, question_id: int, question_data: QuestionUpdate
             detail=f"题目 ID {question_id} 不存在"
         )
 
-    for field, value in question_data.model_dump(exclude_unset=True).items():
+    changes = question_data.model_dump(exclude_unset=True)
+    answer_key_before = compile_answer_key(question)
+    for field, value in changes.items():
         setattr(question, field, value)
 
+    if "content" in changes or "options" in changes:
+        question.content_hash = question_dedup_service.content_hash(question.content, question.options)
+        question_dedup_service.index_question(db, question)
+    # 答案修正后，包含该题的考试记录后台重新判分
+    job = None
+    if compile_answer_key(question) != answer_key_before:
+        job = regrade_service.create_job(db, RegradeReason.ANSWER_KEY, question_id=question_id)
     db.commit()
     db.refresh(question)
+    if job is not None:
+        regrade_service.submit_job(job.id)
+
+    # 答案可能已修改，清除旧的答案键缓存和试卷缓存
+    invalidate_answer_key(question_id)
+    paper_service.invalidate_question_paper(question_id)
+    # 分类/难度/启用状态可能已修改，更新组卷题库
+    paper_service.refresh_question(question)
     return question
 
 
@@ -179,15 +299,49 @@ def delete_question(db: Session, question_id: int) -> bool:
             detail=f"题目 ID {question_id} 不存在"
         )
 
+    # 固定考题引用的题目不能删除（索引查询，不解析考试的JSON列）
+    exam_ids = [exam_id for (exam_id,) in db.query(ExamQuestion.exam_id).filter(
+        ExamQuestion.question_id == question_id
+    ).distinct().order_by(ExamQuestion.exam_id).limit(10)]
+    if exam_ids:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"题目已被考试 {', '.join(map(str, exam_ids))} 使用，不能删除，可改为停用"
+        )
+
+    question_stats_service.delete_for_question(db, question_id)
+    question_dedup_service.remove_question(db, question_id)
+    db.query(ExamRecordQuestion).filter(
+        ExamRecordQuestion.question_id == question_id
+    ).delete(synchronize_session=False)
     db.delete(question)
     db.commit()
+
+    invalidate_answer_key(question_id)
+    paper_service.invalidate_question_paper(question_id)
+    paper_service.remove_question(question_id)
     return True
 
 
 # ========== 考试答题相关 ==========
 
+# 已提交（已判分）的考试状态
+SUBMITTED_STATUSES = [ExamStatus.PASSED, ExamStatus.FAILED, ExamStatus.PENDING_RETAKE]
+
 def start_exam(db: Session, user_id: int, exam_id: int) -> ExamRecord:
     """开始考试"""
+    exam_record, _ = start_exam_with_paper(db, user_id, exam_id)
+    return exam_record
+
+
+def start_exam_with_paper(db: Session, user_id: int, exam_id: int) -> Tuple[ExamRecord, paper_service.RenderedPaper]:
+    """
+    开始考试并组卷
+
+    - 固定考题或按题目分布随机抽题
+    - 在考试记录上冻结试卷快照（题目ID、选项顺序、答案键哈希），交卷时只读快照判分
+    - 返回 (考试记录, 编码好的试卷)，试卷不含答案，固定考题所有考生共用同一份缓存
+    """
     exam = get_exam_by_id(db, exam_id)
     if not exam:
         raise HTTPException(
@@ -201,21 +355,15 @@ def start_exam(db: Session, user_id: int, exam_id: int) -> ExamRecord:
             detail="考试未发布或已禁用"
         )
 
-    # 检查用户是否可以参加考试
-    # 注意：只统计已完成的考试（PASSED或FAILED），IN_PROGRESS不算
-    existing_records = db.query(ExamRecord).filter(
-        ExamRecord.user_id == user_id,
-        ExamRecord.exam_id == exam_id
-    ).order_by(ExamRecord.attempt_number.desc()).all()
+    # 一次聚合查询统计考试次数（走复合索引，不加载历史记录）
+    summary = get_attempt_summary(db, user_id, exam_id)
 
-    # 只统计已提交的考试记录（通过或失败）
-    completed_attempts = [
-        r for r in existing_records
-        if r.status in [ExamStatus.PASSED, ExamStatus.FAILED]
-    ]
+    # 已有进行中的考试（重复点击、刷新页面）：继续该场考试，不新建记录
+    if summary["in_progress_id"]:
+        return resume_exam(db, exam, summary["in_progress_id"])
 
-    # 计算当前是第几次考试（基于已完成的考试数）
-    attempt_number = len(completed_attempts) + 1
+    # 计算当前是第几次考试（基于已提交的考试数，IN_PROGRESS不算）
+    attempt_number = summary["submitted_count"] + 1
 
     # 检查是否超过最大尝试次数
     if attempt_number > exam.max_attempts:
@@ -224,30 +372,184 @@ def start_exam(db: Session, user_id: int, exam_id: int) -> ExamRecord:
             detail=f"已达到最大考试次数 {exam.max_attempts}"
         )
 
-    # 检查是否在补考冷却期内（只检查已完成的考试）
-    if completed_attempts:
-        last_completed = completed_attempts[0]  # 最近一次已完成的考试
-        if last_completed.next_retake_at and last_completed.next_retake_at > datetime.utcnow():
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"补考冷却期未过，下次可考时间：{last_completed.next_retake_at}"
-            )
+    # 检查是否在补考冷却期内（只检查已提交的考试）
+    next_retake_at = summary["next_retake_at"]
+    if next_retake_at and next_retake_at > datetime.utcnow():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"补考冷却期未过，下次可考时间：{next_retake_at}"
+        )
 
-    # 创建考试记录
+    # 组卷：固定考题或按题目分布随机抽题
+    paper = paper_service.build_exam_paper(db, exam)
+
+    # 创建考试记录（附带试卷快照）
     exam_record = ExamRecord(
         user_id=user_id,
         exam_id=exam_id,
         attempt_number=attempt_number,
         status=ExamStatus.IN_PROGRESS,
         total_questions=exam.total_questions,
-        started_at=datetime.utcnow()
+        paper_snapshot=paper.snapshot,
+        started_at=datetime.utcnow(),
+        # 题目 → 考试记录的反向索引（修正答案后重新判分按此查找记录）
+        question_index=[
+            ExamRecordQuestion(question_id=question_id)
+            for question_id in dict.fromkeys(snapshot_question_ids(paper.snapshot))
+        ]
     )
     db.add(exam_record)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        # 并发请求已创建进行中的考试（唯一索引拦截）：回滚并继续那一场
+        db.rollback()
+        in_progress = get_in_progress_record(db, user_id, exam_id)
+        if not in_progress:
+            raise
+        return resume_exam(db, exam, in_progress.id)
+
     db.refresh(exam_record)
+
+    # 限时考试：登记自动交卷时间
+    deadline = get_exam_deadline(exam, exam_record)
+    if deadline:
+        _deadline_scheduler.schedule(exam_record.id, deadline)
+    return exam_record, paper
+
+
+def get_attempt_summary(db: Session, user_id: int, exam_id: int) -> Dict[str, Any]:
+    """
+    统计用户某场考试的作答情况（一次聚合查询）
+
+    返回：
+    - submitted_count: 已提交次数
+    - next_retake_at: 补考冷却截止时间（已提交记录中的最大值）
+    - in_progress_id: 进行中的考试记录ID（没有则为None）
+    """
+    submitted = ExamRecord.status.in_(SUBMITTED_STATUSES)
+    submitted_count, next_retake_at, in_progress_id = db.query(
+        func.count(case((submitted, 1))),
+        func.max(case((submitted, ExamRecord.next_retake_at))),
+        func.max(case((ExamRecord.status == ExamStatus.IN_PROGRESS, ExamRecord.id)))
+    ).filter(
+        ExamRecord.user_id == user_id,
+        ExamRecord.exam_id == exam_id
+    ).one()
+
+    return {
+        "submitted_count": submitted_count or 0,
+        "next_retake_at": next_retake_at,
+        "in_progress_id": in_progress_id,
+    }
+
+
+def get_in_progress_record(db: Session, user_id: int, exam_id: int) -> Optional[ExamRecord]:
+    """获取进行中的考试记录（每人每场考试最多一条，由唯一索引保证）"""
+    return db.query(ExamRecord).filter(
+        ExamRecord.user_id == user_id,
+        ExamRecord.exam_id == exam_id,
+        ExamRecord.status == ExamStatus.IN_PROGRESS
+    ).first()
+
+
+def resume_exam(db: Session, exam: Exam, exam_record_id: int) -> Tuple[ExamRecord, paper_service.RenderedPaper]:
+    """继续进行中的考试：按开考时冻结的快照返回原试卷（题目和顺序不变）"""
+    exam_record = db.query(ExamRecord).filter(ExamRecord.id == exam_record_id).first()
+    return exam_record, paper_service.render_record_paper(db, exam, exam_record.paper_snapshot)
+
+
+def get_in_progress_paper(db: Session, user_id: int, exam_id: int) -> Tuple[ExamRecord, paper_service.RenderedPaper]:
+    """获取进行中考试的试卷（刷新页面时重新拉取）"""
+    exam = get_exam_by_id(db, exam_id)
+    exam_record = get_in_progress_record(db, user_id, exam_id) if exam else None
+    if not exam_record:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="未找到进行中的考试记录"
+        )
+    return exam_record, paper_service.render_record_paper(db, exam, exam_record.paper_snapshot)
+
+
+# ========== 答题自动保存 ==========
+
+def autosave_answers(db: Session, user_id: int, exam_id: int, answers: List[AnswerSubmit]) -> ExamRecord:
+    """
+    自动保存答案补丁（写入缓冲区，由后台线程合并后批量落库）
+
+    同一场考试的多次保存在缓冲区中按题目合并，刷新间隔内只落库一次
+    """
+    exam_record = get_in_progress_record(db, user_id, exam_id)
+    if not exam_record:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="未找到进行中的考试记录"
+        )
+
+    _autosave_buffer.put(exam_record.id, {str(a.question_id): a.user_answer for a in answers})
     return exam_record
 
 
+def get_saved_answers(db: Session, user_id: int, exam_id: int) -> Tuple[ExamRecord, Dict[str, str]]:
+    """获取进行中考试已保存的答案（含缓冲区中尚未落库的部分）"""
+    exam_record = get_in_progress_record(db, user_id, exam_id)
+    if not exam_record:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="未找到进行中的考试记录"
+        )
+
+    _autosave_buffer.flush([exam_record.id])
+    db.refresh(exam_record, ["draft_answers"])
+    return exam_record, exam_record.draft_answers or {}
+
+
+def flush_draft_answers(batch: Dict[int, Dict[str, str]]) -> None:
+    """把缓冲区中的答案补丁合并写入 ExamRecord.draft_answers（一次查询 + 一个事务）"""
+    db = SessionLocal()
+    try:
+        records = db.query(ExamRecord).filter(
+            ExamRecord.id.in_(batch.keys()),
+            ExamRecord.status == ExamStatus.IN_PROGRESS
+        ).all()
+        # 已交卷的记录直接丢弃补丁
+        for record in records:
+            record.draft_answers = {**(record.draft_answers or {}), **batch[record.id]}
+        db.commit()
+    finally:
+        db.close()
+
+
+def merge_saved_answers(exam_record: ExamRecord, answers: List[AnswerSubmit]) -> List[AnswerSubmit]:
+    """合并已保存的草稿和本次提交的答案（本次提交优先）"""
+    merged = {int(qid): answer for qid, answer in (exam_record.draft_answers or {}).items()}
+    merged.update((a.question_id, a.user_answer) for a in answers)
+    return [AnswerSubmit(question_id=qid, user_answer=answer) for qid, answer in merged.items()]
+
+
+_autosave_buffer = WriteBehindBuffer(
+    flush_draft_answers,
+    interval_seconds=settings.AUTOSAVE_FLUSH_INTERVAL_SECONDS,
+    max_items=settings.AUTOSAVE_FLUSH_MAX_ITEMS,
+    name="exam-autosave"
+)
+
+
+def start_autosave() -> None:
+    """启动自动保存后台落库线程（应用启动时调用）"""
+    _autosave_buffer.start()
+
+
+def stop_autosave() -> None:
+    """停止后台线程并落库剩余答案（应用关闭时调用）"""
+    _autosave_buffer.stop()
+
+
+def get_autosave_stats() -> Dict[str, Any]:
+    """自动保存缓冲区深度与落库耗时"""
+    return _autosave_buffer.stats()
+
+
 def submit_exam(db: Session, user_id: int, exam_submit: ExamSubmit) -> Dict[str, Any]:
     """提交考试并自动判分（含补考逻辑）"""
     exam = get_exam_by_id(db, exam_submit.exam_id)
@@ -258,11 +560,7 @@ def submit_exam(db: Session, user_id: int, exam_submit: ExamSubmit) -> Dict[str,
         )
 
     # 获取当前考试记录
-    exam_record = db.query(ExamRecord).filter(
-        ExamRecord.user_id == user_id,
-        ExamRecord.exam_id == exam_submit.exam_id,
-        ExamRecord.status == ExamStatus.IN_PROGRESS
-    ).order_by(ExamRecord.attempt_number.desc()).first()
+    exam_record = get_in_progress_record(db, user_id, exam_submit.exam_id)
 
     if not exam_record:
         raise HTTPException(
@@ -270,51 +568,18 @@ def submit_exam(db: Session, user_id: int, exam_submit: ExamSubmit) -> Dict[str,
             detail="未找到进行中的考试记录"
         )
 
-    # 自动判分
-    correct_count = 0
-    answer_details = []
-
-    for answer in exam_submit.answers:
-        question = get_question_by_id(db, answer.question_id)
-        if not question:
-            continue
-
-        is_correct = check_answer(question, answer.user_answer)
-        if is_correct:
-            correct_count += 1
-
-        answer_details.append({
-            "question_id": answer.question_id,
-            "user_answer": answer.user_answer,
-            "is_correct": is_correct
-        })
+    # 先落库本场考试缓冲中的自动保存答案，再与本次提交的答案合并
+    _autosave_buffer.flush([exam_record.id])
+    db.refresh(exam_record, ["draft_answers"])
+    answers = merge_saved_answers(exam_record, exam_submit.answers)
+    if not answers:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="答案列表为空"
+        )
 
-    # 计算成绩
-    score = (correct_count / exam.total_questions) * 100 if exam.total_questions > 0 else 0
-    passed = score >= exam.pass_score
-
-    # 更新考试记录
-    exam_record.score = score
-    exam_record.correct_answers = correct_count
-    exam_record.answers = answer_details
-    exam_record.submitted_at = datetime.utcnow()
-    exam_record.graded_at = datetime.utcnow()
-    exam_record.status = ExamStatus.PASSED if passed else ExamStatus.FAILED
-
-    # ========== 补考逻辑 ==========
-    if not passed and exam.allow_retake:
-        # 检查是否还有补考机会
-        if exam_record.attempt_number < exam.max_attempts:
-            exam_record.can_retake = True
-            # 计算下次可补考时间 = 当前时间 + 冷却期
-            exam_record.next_retake_at = datetime.utcnow() + timedelta(days=exam.retake_cooldown_days)
-            exam_record.status = ExamStatus.PENDING_RETAKE
-        else:
-            exam_record.can_retake = False
-            exam_record.next_retake_at = None
-    else:
-        exam_record.can_retake = False
-        exam_record.next_retake_at = None
+    grade_exam_record(db, exam, exam_record, answers)
+    _deadline_scheduler.cancel(exam_record.id)
 
     db.commit()
     db.refresh(exam_record)
@@ -323,61 +588,132 @@ def submit_exam(db: Session, user_id: int, exam_submit: ExamSubmit) -> Dict[str,
         "exam_record_id": exam_record.id,
         "exam_id": exam.id,
         "exam_title": exam.title,
-        "score": score,
-        "passed": passed,
+        "score": exam_record.score,
+        "passed": exam_record.status == ExamStatus.PASSED,
         "attempt_number": exam_record.attempt_number,
         "max_attempts": exam.max_attempts,
         "can_retake": exam_record.can_retake,
         "next_retake_at": exam_record.next_retake_at,
-        "correct_count": correct_count,
+        "correct_count": exam_record.correct_answers,
         "total_questions": exam.total_questions,
         "time_spent": exam_submit.time_spent
     }
 
 
-def check_answer(question: Question, user_answer: str) -> bool:
-    """检查答案是否正确"""
-    # 统一处理options格式（字典 → 列表）
-    options = question.options
-    if options and isinstance(options, dict):
-        # 字典格式：{'A': '内容', 'B': '...'}
-        # 转换为列表格式
-        options = [
-            {"label": key, "content": value, "is_correct": False}
-            for key, value in options.items()
-        ]
+def grade_exam_record(db: Session, exam: Exam, exam_record: ExamRecord, answers: List[AnswerSubmit]) -> None:
+    """
+    判分并更新考试记录（含补考逻辑，不提交事务）
 
-    if question.question_type.value == "single_choice":
-        # 单选题：从options中找正确答案
-        # 注意：字典格式的options没有is_correct，需要用correct_answer字段
-        if question.correct_answer:
-            return question.correct_answer == user_answer
-        elif options:
-            for option in options:
-                if option.get("is_correct") and option.get("label") == user_answer:
-                    return True
-        return False
-
-    elif question.question_type.value == "multiple_choice":
-        # 多选题：用户答案需要完全匹配所有正确选项
-        if question.correct_answer:
-            # 如果有correct_answer，使用它
-            user_labels = sorted(user_answer.split(","))
-            correct_labels = sorted(question.correct_answer.split(","))
-            return user_labels == correct_labels
-        elif options:
-            correct_labels = [opt["label"] for opt in options if opt.get("is_correct")]
-            user_labels = sorted(user_answer.split(","))
-            return sorted(correct_labels) == user_labels
-        return False
-
-    elif question.question_type.value == "true_false":
-        # 判断题：使用correct_answer字段
-        return question.correct_answer == user_answer
+    交卷和到时自动交卷共用
+    """
+    now = datetime.utcnow()
 
+    # 自动判分：优先按开考时冻结的试卷快照判分（不查询题目表）
+    if exam_record.paper_snapshot:
+        correct_count, answer_details = grade_with_snapshot(exam_record.paper_snapshot, answers)
     else:
-        # 简答题暂不支持自动判分
-        return False
+        # 无快照的旧记录：批量加载题目，内存中整卷判分（固定考题只判卷内题目）
+        if exam.question_ids:
+            exam_question_ids = set(paper_service.fixed_question_ids(db, exam.id))
+            answers = [answer for answer in answers if answer.question_id in exam_question_ids]
+        correct_count, answer_details = grade_answer_sheet(db, answers)
+
+    # 更新考试记录（成绩、通过状态、补考字段）
+    exam_record.answers = answer_details
+    exam_record.submitted_at = now
+    exam_record.graded_at = now
+    apply_score(exam, exam_record, correct_count, now)
+    score = exam_record.score
+
+    # 通过期末考试/试用期考核时发证
+    # 注意：需在本事务第一次写入之前调用（发证可能在独立事务中分配编号号段，SQLite不允许两个写事务并存）
+    certificate_service.issue_for_record(db, exam, exam_record, issued_at=now)
+
+    # 答错的题目批量写入错题本（与判分同一事务）
+    wrong_question_service.record_wrong_answers(
+        db, exam_record.user_id, answer_details, exam_record_id=exam_record.id, wrong_at=now
+    )
+
+    # 累加题目统计（难度、区分度、选项选择次数）
+    question_stats_service.record_submission(db, answer_details, score, exam_record.paper_snapshot)
+
+
+# ========== 考试限时（到时自动交卷） ==========
+
+def get_exam_deadline(exam: Exam, exam_record: ExamRecord) -> Optional[datetime]:
+    """自动交卷时间 = 开考时间 + 考试时长 + 宽限期（不限时返回None）"""
+    if not exam.time_limit or not exam_record.started_at:
+        return None
+    return exam_record.started_at + timedelta(minutes=exam.time_limit, seconds=settings.EXAM_AUTO_SUBMIT_GRACE_SECONDS)
+
+
+def load_exam_deadlines() -> List[Tuple[int, datetime]]:
+    """加载所有限时考试中进行中记录的截止时间（走 status 索引，只读进行中的记录）"""
+    db = SessionLocal()
+    try:
+        rows = db.query(
+            ExamRecord.id, ExamRecord.started_at, Exam.time_limit
+        ).join(Exam, Exam.id == ExamRecord.exam_id).filter(
+            ExamRecord.status == ExamStatus.IN_PROGRESS,
+            ExamRecord.started_at.isnot(None),
+            Exam.time_limit.isnot(None)
+        ).all()
+        grace = timedelta(seconds=settings.EXAM_AUTO_SUBMIT_GRACE_SECONDS)
+        return [(record_id, started_at + timedelta(minutes=time_limit) + grace) for record_id, started_at, time_limit in rows]
+    finally:
+        db.close()
+
+
+def auto_submit_expired(record_ids: List[int]) -> None:
+    """
+    到时自动交卷（一批一个事务）
+
+    按已自动保存的答案判分；已交卷的记录跳过
+    """
+    _autosave_buffer.flush(record_ids)
+
+    db = SessionLocal()
+    try:
+        records = db.query(ExamRecord).filter(
+            ExamRecord.id.in_(record_ids),
+            ExamRecord.status == ExamStatus.IN_PROGRESS
+        ).with_for_update(skip_locked=True).all()
+        if not records:
+            return
+
+        exams = {
+            exam.id: exam
+            for exam in db.query(Exam).filter(Exam.id.in_({r.exam_id for r in records}))
+        }
+        # 先预留证书编号，批量判分过程中不再分配号段
+        certificate_service.reserve_numbers(len(records))
+        for record in records:
+            grade_exam_record(db, exams[record.exam_id], record, merge_saved_answers(record, []))
+        db.commit()
+    finally:
+        db.close()
+
+
+_deadline_scheduler = DeadlineScheduler(
+    auto_submit_expired,
+    load_exam_deadlines,
+    batch_size=settings.EXAM_AUTO_SUBMIT_BATCH_SIZE,
+    name="exam-deadline"
+)
+
+
+def start_deadline_scheduler() -> None:
+    """从数据库重建截止时间并启动自动交卷线程（应用启动时调用）"""
+    _deadline_scheduler.start()
+
+
+def stop_deadline_scheduler() -> None:
+    _deadline_scheduler.stop()
+
+
+def get_deadline_stats() -> Dict[str, Any]:
+    """自动交卷积压统计"""
+    return _deadline_scheduler.stats()
 
 
 def get_exam_records(db: Session, user_id: int, exam_id: Optional[int] = None) -> List[ExamRecord]:
@@ -388,3 +724,174 @@ def get_exam_records(db: Session, user_id: int, exam_id: Optional[int] = None) -
         query = query.filter(ExamRecord.exam_id == exam_id)
 
     return query.order_by(ExamRecord.created_at.desc()).all()
+
+
+# ========== 考试成绩详情 ==========
+
+# 已判分的考试记录不可变，渲染结果按 (考试记录ID, graded_at) 缓存；重新判分会更新graded_at，旧缓存自然失效
+RESULT_DETAIL_CACHE_SIZE = 2048
+_result_detail_cache = LRUCache(maxsize=RESULT_DETAIL_CACHE_SIZE)
+
+
+def get_latest_submitted_record(db: Session, user_id: int, exam_id: int) -> Optional[ExamRecord]:
+    """获取用户某场考试最近一次已提交的考试记录"""
+    return db.query(ExamRecord).filter(
+        ExamRecord.user_id == user_id,
+        ExamRecord.exam_id == exam_id,
+        ExamRecord.status.in_(SUBMITTED_STATUSES)
+    ).order_by(ExamRecord.submitted_at.desc(), ExamRecord.id.desc()).first()
+
+
+def get_exam_result_detail(db: Session, user: User, exam_id: int) -> Dict[str, Any]:
+    """获取用户最近一次考试的详细成绩（命中缓存时只需一次查询）"""
+    record = get_latest_submitted_record(db, user.id, exam_id)
+    if not record:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="未找到该考试的成绩记录"
+        )
+
+    cache_key = (record.id, record.graded_at)
+    detail = _result_detail_cache.get(cache_key)
+    if detail is None:
+        detail = render_exam_result_detail(db, user, record)
+        _result_detail_cache.set(cache_key, detail)
+    return detail
+
+
+def render_exam_result_detail(db: Session, user: User, record: ExamRecord) -> Dict[str, Any]:
+    """
+    渲染考试成绩详情（题目一次批量加载）
+
+    题型、选项顺序和正确答案取自试卷快照（与判分口径一致），题目表只提供题干、选项内容和解析；
+    快照版本1及更早没有快照的记录按题目当前答案展示
+    """
+    exam = get_exam_by_id(db, record.exam_id)
+    if not exam:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="考试不存在"
+        )
+
+    # 构建答题详情
+    answer_items = record.answers or []
+    questions = load_questions(db, (item.get("question_id") for item in answer_items))
+    snapshot_items = {item["id"]: item for item in (record.paper_snapshot or {}).get("items", [])}
+
+    question_details = []
+    for answer_item in answer_items:
+        question = questions.get(answer_item.get("question_id"))
+        if not question:
+            continue
+
+        snapshot_item = snapshot_items.get(question.id)
+        if snapshot_item and "answer" in snapshot_item:
+            question_type = snapshot_item["type"]
+            options = snapshot_options(snapshot_item, question.options) if question.options else question.options
+            correct_answer = snapshot_item["answer"]
+        else:
+            question_type = question.question_type.value
+            options = read_options(question.options, question.correct_answer)
+            correct_answer = question.correct_answer
+
+        question_details.append({
+            "question_id": question.id,
+            "content": question.content,
+            "question_type": question_type,
+            "options": options,
+            "user_answer": answer_item.get("user_answer"),
+            "correct_answer": correct_answer,
+            "is_correct": answer_item.get("is_correct", False),
+            "explanation": question.explanation,
+            "category": question.category.value if question.category else None,
+        })
+
+    return {
+        "exam_id": exam.id,
+        "exam_title": exam.title,
+        "user_id": user.id,
+        "username": user.username,
+        "score": record.score,
+        "total_score": 100,
+        "passed": record.is_passed,
+        "pass_score": exam.pass_score,
+        "attempt_number": record.attempt_number,
+        "total_questions": record.total_questions,
+        "correct_answers": record.correct_answers,
+        "started_at": record.started_at.isoformat() if record.started_at else None,
+        "submitted_at": record.submitted_at.isoformat() if record.submitted_at else None,
+        "time_spent_seconds": (
+            int((record.submitted_at - record.started_at).total_seconds())
+            if record.started_at and record.submitted_at
+            else None
+        ),
+        "question_details": question_details,
+        "can_retake": (
+            record.attempt_number < exam.max_attempts
+            if exam.allow_retake and exam.max_attempts
+            else False
+        ),
+        "next_retake_at": (
+            record.next_retake_at.isoformat() if record.next_retake_at else None
+        ),
+    }
+
+
+def get_result_detail_cache_stats() -> Dict[str, Any]:
+    """成绩详情缓存统计"""
+    return _result_detail_cache.stats()
+
+
+# ========== 考试成绩导出 ==========
+
+EXPORT_PAGE_SIZE = 500
+
+
+def iter_exam_results(exam_id: int, after_id: Optional[int] = None, page_size: int = EXPORT_PAGE_SIZE):
+    """
+    逐行迭代考试成绩（用于流式导出）
+
+    - 用户信息在SQL中JOIN，不再逐条查询用户
+    - 按考试记录ID做键集分页，每页一个短事务，不长时间占用读锁
+    - 每页内用 yield_per 服务端游标流式读取，内存占用与考试规模无关
+    - 使用独立会话：流式响应发送期间请求依赖的会话可能已关闭
+    """
+    db = SessionLocal()
+    try:
+        last_id = after_id or 0
+        while True:
+            rows = db.query(
+                ExamRecord.id, ExamRecord.exam_id, ExamRecord.user_id,
+                User.username, User.full_name,
+                ExamRecord.attempt_number, ExamRecord.status, ExamRecord.score,
+                ExamRecord.started_at, ExamRecord.submitted_at, ExamRecord.created_at
+            ).outerjoin(User, User.id == ExamRecord.user_id).filter(
+                ExamRecord.exam_id == exam_id,
+                ExamRecord.id > last_id
+            ).order_by(ExamRecord.id).limit(page_size).yield_per(page_size)
+
+            count = 0
+            for row in rows:
+                count += 1
+                last_id = row.id
+                yield {
+                    "exam_record_id": row.id,
+                    "exam_id": row.exam_id,
+                    "user_id": row.user_id,
+                    "username": row.username or "Unknown",
+                    "full_name": row.full_name,
+                    "attempt_number": row.attempt_number,
+                    "status": row.status.value if row.status else None,
+                    "score": row.score,
+                    "passed": row.status == ExamStatus.PASSED,
+                    "started_at": row.started_at.isoformat() if row.started_at else None,
+                    "completed_at": row.submitted_at.isoformat() if row.submitted_at else None,
+                    "created_at": row.created_at.isoformat() if row.created_at else None,
+                }
+
+            # 结束本页事务，释放读锁
+            db.rollback()
+            if count < page_size:
+                break
+    finally:
+        db.close()
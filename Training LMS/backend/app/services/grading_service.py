@@ -0,0 +1,298 @@
+"""
+考试判分引擎
+
+- 一次查询批量加载整张答卷涉及的题目
+- 在内存中完成整卷判分，不再逐题查库
+- 答案键编译后按 (题目ID, updated_at) 缓存，判分时无需重复解析选项
+- 开考时冻结试卷快照（题目ID、选项顺序、答案键哈希），交卷只读快照判分
+"""
+import hashlib
+from datetime import datetime, timedelta
+from sqlalchemy.orm import Session
+from typing import Dict, List, Iterable, Tuple, Any, Optional, FrozenSet, NamedTuple
+from ..models.exam import Exam, Question
+from ..models.learning import ExamRecord, ExamStatus
+from ..schemas.exam import AnswerSubmit
+from ..utils.cache import LRUCache
+from ..utils.question_options import read_options
+
+
+def load_questions(db: Session, question_ids: Iterable[int]) -> Dict[int, Question]:
+    """批量加载题目（一次查询），返回 {题目ID: 题目}"""
+    ids = set(question_ids)
+    if not ids:
+        return {}
+
+    questions = db.query(Question).filter(Question.id.in_(ids)).all()
+    return {q.id: q for q in questions}
+
+
+def grade_answer_sheet(db: Session, answers: List[AnswerSubmit]) -> Tuple[int, List[Dict[str, Any]]]:
+    """
+    整卷判分
+
+    返回 (正确题数, 答题详情)，答题详情格式与 ExamRecord.answers 一致：
+    [{"question_id": 1, "user_answer": "A", "is_correct": true}, ...]
+    """
+    questions = load_questions(db, (answer.question_id for answer in answers))
+
+    correct_count = 0
+    answer_details = []
+
+    for answer in answers:
+        question = questions.get(answer.question_id)
+        if not question:
+            continue
+
+        is_correct = check_answer(question, answer.user_answer)
+        if is_correct:
+            correct_count += 1
+
+        answer_details.append({
+            "question_id": answer.question_id,
+            "user_answer": answer.user_answer,
+            "is_correct": is_correct
+        })
+
+    return correct_count, answer_details
+
+
+def check_answer(question: Question, user_answer: str) -> bool:
+    """检查答案是否正确（使用编译后的答案键）"""
+    return match_answer_key(get_answer_key(question), user_answer)
+
+
+# ========== 答案键编译与缓存 ==========
+
+# 判断题答案归一化（兼容中英文写法）
+TRUE_TOKENS = {"true", "t", "1", "yes", "y", "对", "正确", "是", "√"}
+FALSE_TOKENS = {"false", "f", "0", "no", "n", "错", "错误", "否", "×"}
+
+# 进程级答案键缓存：键为 (题目ID, updated_at)，题目编辑后自然失效
+ANSWER_KEY_CACHE_SIZE = 4096
+_answer_key_cache = LRUCache(maxsize=ANSWER_KEY_CACHE_SIZE)
+
+
+class AnswerKey(NamedTuple):
+    """编译后的答案键"""
+    question_type: str
+    labels: FrozenSet[str]  # 正确答案集合（选项标签 / 判断题归一化结果）
+
+
+def normalize_true_false(answer: Optional[str]) -> str:
+    """判断题答案归一化为 "true" / "false"，无法识别时原样返回（去空格、小写）"""
+    token = (answer or "").strip().lower()
+    if token in TRUE_TOKENS:
+        return "true"
+    if token in FALSE_TOKENS:
+        return "false"
+    return token
+
+
+def parse_labels(answer: Optional[str]) -> FrozenSet[str]:
+    """解析选项标签答案（"A,C" → {"A", "C"}）"""
+    return frozenset(label.strip() for label in (answer or "").split(",") if label.strip())
+
+
+def compile_answer_key(question: Question) -> AnswerKey:
+    """编译题目的答案键（不查缓存）"""
+    question_type = question.question_type.value
+
+    # 选项写入时已统一为标准格式，未迁移的旧数据读取时转换（见 app/utils/question_options.py）
+    options = read_options(question.options, question.correct_answer) or []
+    flagged = frozenset(opt["label"] for opt in options if opt["is_correct"])
+
+    if question_type in ("single_choice", "multiple_choice"):
+        # 优先使用correct_answer，否则使用选项中的is_correct标记
+        labels = parse_labels(question.correct_answer) if question.correct_answer else flagged
+    elif question_type == "true_false":
+        labels = frozenset([normalize_true_false(question.correct_answer)]) if question.correct_answer else frozenset()
+    else:
+        # 简答题暂不支持自动判分
+        labels = frozenset()
+
+    return AnswerKey(question_type=question_type, labels=labels)
+
+
+def get_answer_key(question: Question) -> AnswerKey:
+    """获取题目的答案键（优先读取缓存）"""
+    cache_key = (question.id, question.updated_at)
+    answer_key = _answer_key_cache.get(cache_key)
+    if answer_key is None:
+        answer_key = compile_answer_key(question)
+        _answer_key_cache.set(cache_key, answer_key)
+    return answer_key
+
+
+def match_answer_key(answer_key: AnswerKey, user_answer: Optional[str]) -> bool:
+    """用答案键判定用户答案"""
+    if not answer_key.labels:
+        return False
+
+    if answer_key.question_type == "single_choice":
+        return (user_answer or "").strip() in answer_key.labels
+    elif answer_key.question_type == "multiple_choice":
+        # 多选题：用户答案需要完全匹配所有正确选项
+        return parse_labels(user_answer) == answer_key.labels
+    elif answer_key.question_type == "true_false":
+        return normalize_true_false(user_answer) in answer_key.labels
+    return False
+
+
+def invalidate_answer_key(question_id: int) -> int:
+    """题目编辑/删除后清除该题的所有缓存版本"""
+    return _answer_key_cache.discard_if(lambda key: key[0] == question_id)
+
+
+def get_answer_key_cache_stats() -> Dict[str, Any]:
+    """答案键缓存统计（命中/未命中/淘汰）"""
+    return _answer_key_cache.stats()
+
+
+# ========== 试卷快照 ==========
+
+# 版本2：单题快照增加正确答案标签和答案显示文本，成绩详情按快照展示答案
+SNAPSHOT_VERSION = 2
+
+
+def option_labels(options: Optional[List[Dict[str, Any]]]) -> List[str]:
+    """选项标签顺序"""
+    return [opt["label"] for opt in options or []]
+
+
+def answer_digest(question_id: int, question_type: str, labels: FrozenSet[str]) -> str:
+    """答案哈希（题目ID + 题型 + 排序后的答案标签）"""
+    raw = f"{question_id}:{question_type}:{','.join(sorted(labels))}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def user_answer_labels(question_type: str, user_answer: Optional[str]) -> FrozenSet[str]:
+    """按题型把用户答案归一化为标签集合（与答案键同口径）"""
+    if question_type == "single_choice":
+        answer = (user_answer or "").strip()
+        return frozenset([answer]) if answer else frozenset()
+    elif question_type == "multiple_choice":
+        return parse_labels(user_answer)
+    elif question_type == "true_false":
+        return frozenset([normalize_true_false(user_answer)])
+    return frozenset()
+
+
+def build_snapshot_item(question: Question) -> Dict[str, Any]:
+    """
+    单题快照
+
+    - keys: 可接受答案的哈希列表（单选题每个正确选项各一个，其余题型一个），判分用
+    - correct / answer: 正确答案标签和显示文本，成绩详情用（开考后修改题目不影响已开考的记录）
+    """
+    answer_key = get_answer_key(question)
+    if not answer_key.labels:
+        keys = []
+    elif answer_key.question_type == "single_choice":
+        keys = [answer_digest(question.id, answer_key.question_type, frozenset([label])) for label in sorted(answer_key.labels)]
+    else:
+        keys = [answer_digest(question.id, answer_key.question_type, answer_key.labels)]
+
+    return {
+        "id": question.id,
+        "type": answer_key.question_type,
+        "options": option_labels(read_options(question.options, question.correct_answer)),
+        "keys": keys,
+        "correct": sorted(answer_key.labels),
+        "answer": question.correct_answer or ",".join(sorted(answer_key.labels)) or None,
+    }
+
+
+def build_paper_snapshot(questions: List[Question]) -> Dict[str, Any]:
+    """生成试卷快照（题目顺序即出题顺序）"""
+    return {
+        "version": SNAPSHOT_VERSION,
+        "items": [build_snapshot_item(q) for q in questions],
+    }
+
+
+def snapshot_question_ids(snapshot: Optional[Dict[str, Any]]) -> List[int]:
+    """快照中的题目ID列表（按出题顺序）"""
+    return [item["id"] for item in (snapshot or {}).get("items", [])]
+
+
+def snapshot_options(item: Dict[str, Any], options: Optional[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """按快照的选项顺序和正确答案展示选项（选项内容取题目当前内容，已删除的选项内容为空）"""
+    contents = {opt["label"]: opt["content"] for opt in read_options(options) or []}
+    correct = set(item.get("correct") or [])
+    return [
+        {"label": label, "content": contents.get(label, ""), "is_correct": label in correct}
+        for label in item.get("options", [])
+    ]
+
+
+def match_snapshot_item(item: Dict[str, Any], user_answer: Optional[str]) -> bool:
+    """用快照中的答案哈希判定用户答案"""
+    if not item.get("keys"):
+        return False
+    labels = user_answer_labels(item["type"], user_answer)
+    if not labels:
+        return False
+    return answer_digest(item["id"], item["type"], labels) in item["keys"]
+
+
+def grade_with_snapshot(snapshot: Dict[str, Any], answers: List[AnswerSubmit]) -> Tuple[int, List[Dict[str, Any]]]:
+    """
+    按试卷快照判分（不查询题目表）
+
+    - 只判试卷中的题目，快照外的题目ID忽略
+    - 同一题重复提交时以最后一次为准
+    - 答题详情按出题顺序排列
+    """
+    submitted = {answer.question_id: answer.user_answer for answer in answers}
+
+    correct_count = 0
+    answer_details = []
+
+    for item in snapshot.get("items", []):
+        if item["id"] not in submitted:
+            continue
+
+        user_answer = submitted[item["id"]]
+        is_correct = match_snapshot_item(item, user_answer)
+        if is_correct:
+            correct_count += 1
+
+        answer_details.append({
+            "question_id": item["id"],
+            "user_answer": user_answer,
+            "is_correct": is_correct
+        })
+
+    return correct_count, answer_details
+
+
+# ========== 成绩与补考状态 ==========
+
+def apply_score(exam: Exam, exam_record: ExamRecord, correct_count: int, graded_at: datetime) -> None:
+    """
+    按正确题数写入成绩、通过状态和补考字段（交卷判分和重新判分共用）
+
+    补考冷却期从 graded_at 起算（交卷时为当前时间，重新判分时为原交卷时间）
+    """
+    score = (correct_count / exam.total_questions) * 100 if exam.total_questions > 0 else 0
+    passed = score >= exam.pass_score
+
+    exam_record.score = score
+    exam_record.correct_answers = correct_count
+    exam_record.status = ExamStatus.PASSED if passed else ExamStatus.FAILED
+
+    # ========== 补考逻辑 ==========
+    if not passed and exam.allow_retake:
+        # 检查是否还有补考机会
+        if exam_record.attempt_number < exam.max_attempts:
+            exam_record.can_retake = True
+            # 计算下次可补考时间 = 判分时间 + 冷却期
+            exam_record.next_retake_at = graded_at + timedelta(days=exam.retake_cooldown_days)
+            exam_record.status = ExamStatus.PENDING_RETAKE
+        else:
+            exam_record.can_retake = False
+            exam_record.next_retake_at = None
+    else:
+        exam_record.can_retake = False
+        exam_record.next_retake_at = None
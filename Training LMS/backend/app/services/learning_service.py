@@ -1,48 +1,67 @@
 """
 学习进度业务逻辑
 """
+from sqlalchemy import case, false, func, literal, or_, select, tuple_, update
 from sqlalchemy.orm import Session
-from typing import Optional, List
-from datetime import datetime
+from typing import Optional, List, Tuple, Dict, Any, Hashable
+from datetime import datetime, timezone
 from fastapi import HTTPException, status
-from ..models.learning import CourseProgress, ChapterProgress, LearningStatus
-from ..models.course import Course, Chapter
+from ..core.config import settings
+from ..core.database import SessionLocal, dialect_insert
+from ..models.learning import CourseProgress, ChapterProgress, ContentProgress, LearningStatus, LearningSummary
+from ..models.course import Course, Chapter, Content
+from ..utils.write_behind import WriteBehindBuffer
 from ..schemas.learning import (
     CourseProgressCreate, CourseProgressUpdate,
-    ChapterProgressCreate, ChapterProgressUpdate
+    ChapterProgressCreate, ChapterProgressUpdate,
+    LearningEvent, LearningEventTarget, LearningEventType
 )
+from . import course_service
 
 
 # ========== CourseProgress CRUD ==========
 
-def get_or_create_course_progress(db: Session, user_id: int, course_id: int) -> CourseProgress:
-    """获取或创建课程学习进度"""
-    # 先尝试获取
-    progress = db.query(CourseProgress).filter(
-        CourseProgress.user_id == user_id,
-        CourseProgress.course_id == course_id
-    ).first()
-
-    if progress:
-        return progress
-
-    # 不存在则创建
-    course = db.query(Course).filter(Course.id == course_id).first()
-    if not course:
+def _get_or_create_course_progress(db: Session, user_id: int, course_id: int) -> CourseProgress:
+    """
+    获取或创建课程学习进度（一条 INSERT ... SELECT ... ON CONFLICT ... RETURNING，不提交事务）
+
+    - 课程不存在时 SELECT 不产生行，返回404
+    - 已有进度时冲突分支做一次空更新，RETURNING 返回已有的行；并发请求不会产生重复行
+    - 新插入的行 updated_at 为空（冲突分支把它补为 created_at），据此累加学习汇总的课程数
+    """
+    # 先写入会话中未提交的修改，RETURNING 的结果会覆盖会话中的对象
+    db.flush()
+    insert = dialect_insert(db)
+    stmt = insert(CourseProgress).from_select(
+        ["user_id", "course_id", "status", "total_chapters", "completed_chapters", "progress_percentage"],
+        select(
+            literal(user_id),
+            Course.id,
+            literal(LearningStatus.NOT_STARTED, CourseProgress.status.type),
+            literal(course_service.get_chapter_count(db, course_id)),
+            literal(0),
+            literal(0.0)
+        ).where(Course.id == course_id)
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[CourseProgress.user_id, CourseProgress.course_id],
+        set_={"updated_at": func.coalesce(CourseProgress.updated_at, CourseProgress.created_at, func.now())}
+    ).returning(CourseProgress)
+
+    progress = db.scalars(stmt, execution_options={"populate_existing": True}).first()
+    if progress is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"课程 ID {course_id} 不存在"
         )
+    if progress.updated_at is None:
+        _update_learning_summary(db, user_id, total_courses=1)
+    return progress
 
-    progress = CourseProgress(
-        user_id=user_id,
-        course_id=course_id,
-        status=LearningStatus.NOT_STARTED,
-        total_chapters=len(course.chapters),
-        completed_chapters=0,
-        progress_percentage=0.0
-    )
-    db.add(progress)
+
+def get_or_create_course_progress(db: Session, user_id: int, course_id: int) -> CourseProgress:
+    """获取或创建课程学习进度"""
+    progress = _get_or_create_course_progress(db, user_id, course_id)
     db.commit()
     db.refresh(progress)
     return progress
@@ -50,7 +69,8 @@ def get_or_create_course_progress(db: Session, user_id: int, course_id: int) ->
 
 def update_course_progress(db: Session, user_id: int, course_id: int, update_data: CourseProgressUpdate) -> CourseProgress:
     """更新课程学习进度"""
-    progress = get_or_create_course_progress(db, user_id, course_id)
+    progress = _get_or_create_course_progress(db, user_id, course_id)
+    old_status = progress.status
 
     for field, value in update_data.model_dump(exclude_unset=True).items():
         setattr(progress, field, value)
@@ -62,22 +82,31 @@ def update_course_progress(db: Session, user_id: int, course_id: int, update_dat
     if progress.status == LearningStatus.COMPLETED and not progress.completed_at:
         progress.completed_at = datetime.utcnow()
 
+    _update_learning_summary(db, user_id, **_course_status_deltas(old_status, progress.status))
     db.commit()
     db.refresh(progress)
     return progress
 
 
-def start_course(db: Session, user_id: int, course_id: int) -> CourseProgress:
-    """开始学习课程"""
-    progress = get_or_create_course_progress(db, user_id, course_id)
+def _start_course(db: Session, user_id: int, course_id: int, at: datetime) -> CourseProgress:
+    """课程进度标记为学习中（不提交事务），开始时间取最早的一次"""
+    progress = _get_or_create_course_progress(db, user_id, course_id)
 
     if progress.status == LearningStatus.NOT_STARTED:
         progress.status = LearningStatus.IN_PROGRESS
-        progress.started_at = datetime.utcnow()
-        progress.last_accessed_at = datetime.utcnow()
-        db.commit()
-        db.refresh(progress)
+        _update_learning_summary(db, user_id, in_progress_courses=1)
+    if progress.started_at is None or at < progress.started_at:
+        progress.started_at = at
+    if progress.last_accessed_at is None or at > progress.last_accessed_at:
+        progress.last_accessed_at = at
+    return progress
+
 
+def start_course(db: Session, user_id: int, course_id: int) -> CourseProgress:
+    """开始学习课程"""
+    progress = _start_course(db, user_id, course_id, datetime.utcnow())
+    db.commit()
+    db.refresh(progress)
     return progress
 
 
@@ -91,130 +120,210 @@ def get_user_course_progress(db: Session, user_id: int, course_id: Optional[int]
     return query.all()
 
 
+def _apply_completed_chapters(db: Session, user_id: int, course_id: int, delta: int, at: datetime) -> None:
+    """
+    已完成章节数增减后更新课程进度（一条UPDATE，不提交事务）
+
+    - 在数据库当前值上加减，并发完成同一课程的不同章节不会互相覆盖
+    - 章节总数取自缓存，同时修正进度行中的 total_chapters
+    - 全部章节完成时标记课程为已完成；有已完成章节时为学习中，状态变化计入学习汇总
+    """
+    progress = _get_or_create_course_progress(db, user_id, course_id)
+    # 获取或创建时冲突分支已锁定该行，提交前状态不会被其他事务修改
+    old_status = progress.status
+    total = course_service.get_chapter_count(db, course_id)
+
+    completed = case(
+        (CourseProgress.completed_chapters + delta < 0, 0),
+        else_=CourseProgress.completed_chapters + delta
+    )
+    finished = completed >= total if total > 0 else false()
+    status_type = CourseProgress.status.type
+
+    new_status = db.execute(
+        update(CourseProgress).where(
+            CourseProgress.user_id == user_id,
+            CourseProgress.course_id == course_id
+        ).values(
+            completed_chapters=completed,
+            total_chapters=total,
+            progress_percentage=case((finished, 100.0), else_=completed * 100.0 / total) if total > 0 else 0.0,
+            status=case(
+                (finished, literal(LearningStatus.COMPLETED, status_type)),
+                (completed > 0, literal(LearningStatus.IN_PROGRESS, status_type)),
+                (CourseProgress.status == LearningStatus.COMPLETED, literal(LearningStatus.IN_PROGRESS, status_type)),
+                else_=CourseProgress.status
+            ),
+            started_at=func.coalesce(CourseProgress.started_at, at),
+            completed_at=case((finished, func.coalesce(CourseProgress.completed_at, at)), else_=CourseProgress.completed_at),
+            last_accessed_at=case(
+                (or_(CourseProgress.last_accessed_at.is_(None), CourseProgress.last_accessed_at < at), at),
+                else_=CourseProgress.last_accessed_at
+            )
+        ).returning(CourseProgress.status).execution_options(synchronize_session=False)
+    ).scalar_one()
+    # 会话中的对象已过期，之后访问时重新读取
+    db.expire(progress)
+    _update_learning_summary(db, user_id, **_course_status_deltas(old_status, new_status))
+
+
 # ========== ChapterProgress CRUD ==========
 
-def get_or_create_chapter_progress(db: Session, user_id: int, chapter_id: int) -> ChapterProgress:
-    """获取或创建章节学习进度"""
-    # 先尝试获取
-    progress = db.query(ChapterProgress).filter(
-        ChapterProgress.user_id == user_id,
-        ChapterProgress.chapter_id == chapter_id
-    ).first()
-
-    if progress:
-        return progress
-
-    # 不存在则创建
-    chapter = db.query(Chapter).filter(Chapter.id == chapter_id).first()
-    if not chapter:
+def _get_or_create_chapter_progress(db: Session, user_id: int, chapter_id: int) -> ChapterProgress:
+    """
+    获取或创建章节学习进度（一条 INSERT ... SELECT ... ON CONFLICT ... RETURNING，不提交事务）
+
+    所属课程和内容数在同一条语句中从章节表取得；章节不存在时返回404。
+    新插入的行 updated_at 为空（同课程进度），据此累加学习汇总的章节数
+    """
+    db.flush()
+    total_contents = select(func.count(Content.id)).where(Content.chapter_id == Chapter.id).scalar_subquery()
+    insert = dialect_insert(db)
+    stmt = insert(ChapterProgress).from_select(
+        ["user_id", "chapter_id", "course_id", "status", "total_contents", "completed_contents", "quiz_passed"],
+        select(
+            literal(user_id),
+            Chapter.id,
+            Chapter.course_id,
+            literal(LearningStatus.NOT_STARTED, ChapterProgress.status.type),
+            total_contents,
+            literal(0),
+            false()
+        ).where(Chapter.id == chapter_id)
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ChapterProgress.user_id, ChapterProgress.chapter_id],
+        set_={"updated_at": func.coalesce(ChapterProgress.updated_at, ChapterProgress.created_at, func.now())}
+    ).returning(ChapterProgress)
+
+    progress = db.scalars(stmt, execution_options={"populate_existing": True}).first()
+    if progress is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"章节 ID {chapter_id} 不存在"
         )
+    if progress.updated_at is None:
+        _update_learning_summary(db, user_id, total_chapters=1)
+    return progress
 
-    progress = ChapterProgress(
-        user_id=user_id,
-        chapter_id=chapter_id,
-        course_id=chapter.course_id,
-        status=LearningStatus.NOT_STARTED,
-        total_contents=len(chapter.contents),
-        completed_contents=0,
-        quiz_passed=False
-    )
-    db.add(progress)
+
+def get_or_create_chapter_progress(db: Session, user_id: int, chapter_id: int) -> ChapterProgress:
+    """获取或创建章节学习进度"""
+    progress = _get_or_create_chapter_progress(db, user_id, chapter_id)
     db.commit()
     db.refresh(progress)
     return progress
 
 
 def update_chapter_progress(db: Session, user_id: int, chapter_id: int, update_data: ChapterProgressUpdate) -> ChapterProgress:
-    """更新章节学习进度"""
-    progress = get_or_create_chapter_progress(db, user_id, chapter_id)
+    """更新章节学习进度（章节和课程进度同一事务提交）"""
+    now = datetime.utcnow()
+    progress = _get_or_create_chapter_progress(db, user_id, chapter_id)
+    was_completed = progress.status == LearningStatus.COMPLETED
 
     for field, value in update_data.model_dump(exclude_unset=True).items():
         setattr(progress, field, value)
 
     # 如果状态变为已完成，设置completed_at
-    if progress.status == LearningStatus.COMPLETED and not progress.completed_at:
-        progress.completed_at = datetime.utcnow()
+    is_completed = progress.status == LearningStatus.COMPLETED
+    if is_completed and not progress.completed_at:
+        progress.completed_at = now
+
+    # 完成状态变化时增减课程的已完成章节数
+    if is_completed != was_completed:
+        _update_learning_summary(db, user_id, completed_chapters=1 if is_completed else -1)
+        _apply_completed_chapters(db, user_id, progress.course_id, 1 if is_completed else -1, now)
 
     db.commit()
     db.refresh(progress)
-
-    # 更新课程进度
-    update_course_progress_by_chapter(db, user_id, progress.course_id)
-
     return progress
 
 
-def start_chapter(db: Session, user_id: int, chapter_id: int) -> ChapterProgress:
-    """开始学习章节"""
-    progress = get_or_create_chapter_progress(db, user_id, chapter_id)
+def _start_chapter(db: Session, user_id: int, chapter_id: int, at: datetime) -> ChapterProgress:
+    """章节和课程进度标记为学习中（不提交事务），开始时间取最早的一次"""
+    progress = _get_or_create_chapter_progress(db, user_id, chapter_id)
 
     if progress.status == LearningStatus.NOT_STARTED:
         progress.status = LearningStatus.IN_PROGRESS
-        progress.started_at = datetime.utcnow()
-        db.commit()
-        db.refresh(progress)
-
-        # 同时更新课程进度为学习中
-        start_course(db, user_id, progress.course_id)
+    if progress.started_at is None or at < progress.started_at:
+        progress.started_at = at
 
+    # 同时更新课程进度为学习中
+    _start_course(db, user_id, progress.course_id, at)
     return progress
 
 
-def complete_chapter(db: Session, user_id: int, chapter_id: int) -> ChapterProgress:
-    """完成章节学习"""
-    progress = get_or_create_chapter_progress(db, user_id, chapter_id)
-
-    progress.status = LearningStatus.COMPLETED
-    progress.completed_at = datetime.utcnow()
-    progress.completed_contents = progress.total_contents
-
+def start_chapter(db: Session, user_id: int, chapter_id: int) -> ChapterProgress:
+    """开始学习章节（章节和课程进度同一事务提交）"""
+    progress = _start_chapter(db, user_id, chapter_id, datetime.utcnow())
     db.commit()
     db.refresh(progress)
+    return progress
 
-    # 更新课程进度
-    update_course_progress_by_chapter(db, user_id, progress.course_id)
 
-    return progress
+def _complete_chapter(db: Session, user_id: int, chapter_id: int, at: datetime) -> Tuple[ChapterProgress, bool]:
+    """
+    章节标记为已完成并累加课程进度（不提交事务），返回 (进度, 是否本次完成)
+
+    章节状态用条件UPDATE切换为已完成，只有实际切换的请求累加课程的已完成章节数，
+    重复提交或并发提交同一章节不会重复计数
+    """
+    progress = _get_or_create_chapter_progress(db, user_id, chapter_id)
+
+    result = db.execute(
+        update(ChapterProgress).where(
+            ChapterProgress.id == progress.id,
+            ChapterProgress.status != LearningStatus.COMPLETED
+        ).values(
+            status=LearningStatus.COMPLETED,
+            started_at=func.coalesce(ChapterProgress.started_at, at),
+            completed_at=at,
+            completed_contents=ChapterProgress.total_contents
+        ).execution_options(synchronize_session=False)
+    )
+    db.expire(progress)
+    if not result.rowcount:
+        return progress, False
 
+    _update_learning_summary(db, user_id, completed_chapters=1)
+    _apply_completed_chapters(db, user_id, progress.course_id, 1, at)
+    return progress, True
 
-def update_course_progress_by_chapter(db: Session, user_id: int, course_id: int):
-    """根据章节进度更新课程进度"""
-    # 获取课程的所有章节进度
-    chapter_progresses = db.query(ChapterProgress).filter(
-        ChapterProgress.user_id == user_id,
-        ChapterProgress.course_id == course_id
-    ).all()
 
-    if not chapter_progresses:
-        return
+def complete_chapter(db: Session, user_id: int, chapter_id: int) -> ChapterProgress:
+    """完成章节学习（章节和课程进度同一事务提交）"""
+    progress, _ = _complete_chapter(db, user_id, chapter_id, datetime.utcnow())
+    db.commit()
+    db.refresh(progress)
+    return progress
 
-    # 获取课程实际的章节总数
-    course = db.query(Course).filter(Course.id == course_id).first()
-    if not course:
-        return
-    total_chapters = len(course.chapters)
 
-    # 计算已完成章节数
-    completed_count = sum(1 for p in chapter_progresses if p.status == LearningStatus.COMPLETED)
+def _complete_course(db: Session, user_id: int, course_id: int, at: datetime) -> bool:
+    """
+    课程标记为已完成（不提交事务），返回是否有变化
 
-    # 更新课程进度
-    course_progress = get_or_create_course_progress(db, user_id, course_id)
-    course_progress.completed_chapters = completed_count
-    course_progress.total_chapters = total_chapters
-    course_progress.progress_percentage = (completed_count / total_chapters * 100) if total_chapters > 0 else 0
+    逐个完成尚未完成的章节，课程的已完成章节数和状态随之更新；没有章节的课程直接标记为已完成
+    """
+    progress = _get_or_create_course_progress(db, user_id, course_id)
+    chapter_ids = [chapter_id for (chapter_id,) in db.query(Chapter.id).filter(
+        Chapter.course_id == course_id
+    ).order_by(Chapter.order, Chapter.id)]
 
-    # 如果所有章节都完成，标记课程为已完成
-    if completed_count == total_chapters and total_chapters > 0:
-        course_progress.status = LearningStatus.COMPLETED
-        if not course_progress.completed_at:
-            course_progress.completed_at = datetime.utcnow()
-    elif completed_count > 0:
-        course_progress.status = LearningStatus.IN_PROGRESS
+    if not chapter_ids:
+        if progress.status == LearningStatus.COMPLETED:
+            return False
+        old_status = progress.status
+        progress.status = LearningStatus.COMPLETED
+        progress.progress_percentage = 100.0
+        progress.started_at = progress.started_at or at
+        progress.completed_at = progress.completed_at or at
+        _update_learning_summary(db, user_id, **_course_status_deltas(old_status, LearningStatus.COMPLETED))
+        return True
 
-    db.commit()
+    changed = False
+    for chapter_id in chapter_ids:
+        changed = _complete_chapter(db, user_id, chapter_id, at)[1] or changed
+    return changed
 
 
 def get_user_chapter_progress(db: Session, user_id: int, course_id: Optional[int] = None) -> List[ChapterProgress]:
@@ -227,26 +336,369 @@ def get_user_chapter_progress(db: Session, user_id: int, course_id: Optional[int
     return query.all()
 
 
+# ========== 内容观看进度 ==========
+
+# 每条 INSERT/UPDATE 语句最多包含的行数（绑定参数数量限制）
+HEARTBEAT_STATEMENT_ROWS = 500
+
+
+def record_heartbeat(
+    db: Session,
+    user_id: int,
+    content_id: int,
+    position_seconds: int,
+    watched_seconds: int = 0,
+    completed: bool = False
+) -> Dict[str, Any]:
+    """
+    记录观看心跳（写入缓冲区，由后台线程合并后批量落库）
+
+    - 同一学员同一内容在刷新间隔内的多次心跳合并为一行写入：观看时长累加，播放位置取最后一次
+    - 单次心跳计入的观看时长不超过 CONTENT_HEARTBEAT_MAX_SECONDS，也不超过距上一次心跳经过的时间
+      （缓冲区内按上一次心跳的接收时间、落库时按 last_heartbeat_at 截断），连续快速上报不会刷时长；
+      返回的 accepted_seconds 只按单次上限截断
+    - 播放位置或累计观看时长达到内容时长的 CONTENT_COMPLETE_RATIO 时标记为已完成；
+      文档等没有时长的内容由客户端上报 completed
+    """
+    info = course_service.get_content_info(db, content_id)
+    if info is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"内容 ID {content_id} 不存在"
+        )
+
+    watched = min(watched_seconds, settings.CONTENT_HEARTBEAT_MAX_SECONDS)
+    position = min(position_seconds, info.duration) if info.duration else position_seconds
+    if info.duration and position >= info.duration * settings.CONTENT_COMPLETE_RATIO:
+        completed = True
+
+    now = datetime.utcnow()
+    _heartbeat_buffer.put((user_id, content_id), {
+        "chapter_id": info.chapter_id,
+        "position": position,
+        "watched": watched,
+        "completed": completed,
+        "at": now,
+        # 缓冲区内第一次心跳：落库时按数据库中的上一次心跳时间截断
+        "first_at": now,
+        "first_watched": watched,
+    })
+    return {"content_id": content_id, "accepted_seconds": watched, "completed": completed}
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """转为不带时区的UTC时间（PostgreSQL 读出的时间带时区）"""
+    return value.astimezone(timezone.utc).replace(tzinfo=None) if value.tzinfo is not None else value
+
+
+def _credited_seconds(watched: int, since: Optional[datetime], at: datetime) -> int:
+    """心跳计入的观看时长：不超过距上一次心跳经过的时间（没有上一次心跳时不限）"""
+    if since is None:
+        return watched
+    return min(watched, max(0, round((at - _naive_utc(since)).total_seconds())))
+
+
+def _merge_heartbeats(older: Dict[str, Any], newer: Dict[str, Any]) -> Dict[str, Any]:
+    """合并同一内容的心跳：观看时长按两次心跳的间隔截断后累加，完成状态取或，第一次心跳保留，其余取后一次"""
+    return {
+        **newer,
+        "watched": older["watched"] + _credited_seconds(newer["watched"], older["at"], newer["at"]),
+        "completed": older["completed"] or newer["completed"],
+        "first_at": older["first_at"],
+        "first_watched": older["first_watched"],
+    }
+
+
+def _chunked(items: List[Any], size: int = HEARTBEAT_STATEMENT_ROWS):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def flush_content_heartbeats(batch: Dict[Hashable, Dict[str, Any]]) -> None:
+    """
+    把缓冲区中的心跳批量写入 content_progress（一个事务）
+
+    - 缓冲区内第一次心跳的时长按数据库中的上一次心跳时间（last_heartbeat_at）截断
+    - INSERT ... ON CONFLICT (user_id, content_id) DO UPDATE：观看时长在数据库当前值上累加
+    - 累计时长达到完成比例的标记为已完成
+    - 同步章节进度的已完成内容数（只增不减，完成章节时已置为总数）
+    - 已删除内容的心跳丢弃
+    """
+    db = SessionLocal()
+    try:
+        existing = {content_id for (content_id,) in db.query(Content.id).filter(
+            Content.id.in_({content_id for _, content_id in batch})
+        )}
+        last_heartbeats = {}
+        for chunk in _chunked(list(batch)):
+            last_heartbeats.update(
+                ((user_id, content_id), last_heartbeat_at)
+                for user_id, content_id, last_heartbeat_at in db.query(
+                    ContentProgress.user_id, ContentProgress.content_id, ContentProgress.last_heartbeat_at
+                ).filter(tuple_(ContentProgress.user_id, ContentProgress.content_id).in_(chunk))
+            )
+
+        def credited(key, patch):
+            first = _credited_seconds(patch["first_watched"], last_heartbeats.get(key), patch["first_at"])
+            return patch["watched"] - patch["first_watched"] + first
+
+        rows = [
+            {
+                "user_id": user_id,
+                "content_id": content_id,
+                "chapter_id": patch["chapter_id"],
+                "position_seconds": patch["position"],
+                "watched_seconds": credited((user_id, content_id), patch),
+                "completed": patch["completed"],
+                "completed_at": patch["at"] if patch["completed"] else None,
+                "last_heartbeat_at": patch["at"],
+            }
+            for (user_id, content_id), patch in batch.items() if content_id in existing
+        ]
+        if not rows:
+            return
+
+        table = ContentProgress.__table__
+        insert = dialect_insert(db)
+        for chunk in _chunked(rows):
+            stmt = insert(table).values(chunk)
+            db.execute(stmt.on_conflict_do_update(
+                index_elements=[table.c.user_id, table.c.content_id],
+                set_={
+                    "position_seconds": stmt.excluded.position_seconds,
+                    "watched_seconds": table.c.watched_seconds + stmt.excluded.watched_seconds,
+                    "completed": or_(table.c.completed, stmt.excluded.completed),
+                    "completed_at": func.coalesce(table.c.completed_at, stmt.excluded.completed_at),
+                    "last_heartbeat_at": stmt.excluded.last_heartbeat_at,
+                    "updated_at": func.now(),
+                }
+            ))
+
+        now = datetime.utcnow()
+        complete_after = select(Content.duration * settings.CONTENT_COMPLETE_RATIO).where(
+            Content.id == ContentProgress.content_id
+        ).scalar_subquery()
+        for chunk in _chunked([(row["user_id"], row["content_id"]) for row in rows]):
+            db.execute(
+                update(ContentProgress).where(
+                    tuple_(ContentProgress.user_id, ContentProgress.content_id).in_(chunk),
+                    ContentProgress.completed == False,
+                    ContentProgress.watched_seconds >= complete_after
+                ).values(completed=True, completed_at=now).execution_options(synchronize_session=False)
+            )
+
+        completed_count = select(func.count(ContentProgress.id)).where(
+            ContentProgress.user_id == ChapterProgress.user_id,
+            ContentProgress.chapter_id == ChapterProgress.chapter_id,
+            ContentProgress.completed == True
+        ).scalar_subquery()
+        chapter_keys = sorted({(row["user_id"], row["chapter_id"]) for row in rows})
+        for chunk in _chunked(chapter_keys):
+            db.execute(
+                update(ChapterProgress).where(
+                    tuple_(ChapterProgress.user_id, ChapterProgress.chapter_id).in_(chunk),
+                    completed_count > ChapterProgress.completed_contents
+                ).values(completed_contents=completed_count).execution_options(synchronize_session=False)
+            )
+        db.commit()
+    finally:
+        db.close()
+
+
+_heartbeat_buffer = WriteBehindBuffer(
+    flush_content_heartbeats,
+    interval_seconds=settings.CONTENT_HEARTBEAT_FLUSH_INTERVAL_SECONDS,
+    max_items=settings.CONTENT_HEARTBEAT_FLUSH_MAX_ITEMS,
+    name="content-heartbeat",
+    merge_fn=_merge_heartbeats
+)
+
+
+def get_content_progress(db: Session, user_id: int, chapter_id: int) -> List[ContentProgress]:
+    """章节内各内容的观看进度（先落库缓冲区中该章节的心跳）"""
+    content_ids = [content_id for (content_id,) in db.query(Content.id).filter(Content.chapter_id == chapter_id)]
+    _heartbeat_buffer.flush([(user_id, content_id) for content_id in content_ids])
+    return db.query(ContentProgress).filter(
+        ContentProgress.user_id == user_id,
+        ContentProgress.chapter_id == chapter_id
+    ).order_by(ContentProgress.content_id).all()
+
+
+def start_heartbeats() -> None:
+    """启动观看心跳后台落库线程（应用启动时调用）"""
+    _heartbeat_buffer.start()
+
+
+def stop_heartbeats() -> None:
+    """停止后台线程并落库剩余心跳（应用关闭时调用）"""
+    _heartbeat_buffer.stop()
+
+
+def get_heartbeat_stats() -> Dict[str, Any]:
+    """观看心跳缓冲区深度与落库耗时"""
+    return _heartbeat_buffer.stats()
+
+
+# ========== 学习事件批量同步 ==========
+
+def _event_time(occurred_at: Optional[datetime], now: datetime) -> datetime:
+    """客户端时间转为UTC（与其他时间字段一致，不带时区）；未传或晚于服务器时间的按服务器时间"""
+    if occurred_at is None:
+        return now
+    return min(_naive_utc(occurred_at), now)
+
+
+def sync_learning_events(db: Session, user_id: int, events: List[LearningEvent]) -> Dict[str, Any]:
+    """
+    批量应用学习事件（一个事务），返回应用后的课程和章节进度
+
+    - 按客户端时间排序后依次应用（时间相同按提交顺序），网络乱序到达的事件结果一致
+    - 事件幂等：已开始的再开始、已完成的再完成不会改变进度，重传整批是安全的；
+      开始时间取最早的一次，完成只计一次
+    - 课程/章节不存在的事件跳过并在 rejected 中返回，不影响其他事件
+    """
+    now = datetime.utcnow()
+    ordered = sorted(enumerate(events), key=lambda item: _event_time(item[1].occurred_at, now))
+
+    accepted = 0
+    rejected = []
+    course_ids = set()
+    for index, event in ordered:
+        at = _event_time(event.occurred_at, now)
+        try:
+            if event.target == LearningEventTarget.CHAPTER:
+                if event.type == LearningEventType.START:
+                    progress = _start_chapter(db, user_id, event.target_id, at)
+                else:
+                    progress, _ = _complete_chapter(db, user_id, event.target_id, at)
+                course_ids.add(progress.course_id)
+            else:
+                if event.type == LearningEventType.START:
+                    _start_course(db, user_id, event.target_id, at)
+                else:
+                    _complete_course(db, user_id, event.target_id, at)
+                course_ids.add(event.target_id)
+        except HTTPException as e:
+            # 不存在的课程/章节在写入前就会报错，跳过该事件
+            rejected.append({"index": index, "detail": e.detail})
+            continue
+        accepted += 1
+
+    db.commit()
+
+    courses = chapters = []
+    if course_ids:
+        courses = db.query(CourseProgress).filter(
+            CourseProgress.user_id == user_id,
+            CourseProgress.course_id.in_(course_ids)
+        ).order_by(CourseProgress.course_id).all()
+        chapters = db.query(ChapterProgress).filter(
+            ChapterProgress.user_id == user_id,
+            ChapterProgress.course_id.in_(course_ids)
+        ).order_by(ChapterProgress.course_id, ChapterProgress.chapter_id).all()
+
+    return {
+        "accepted": accepted,
+        "rejected": sorted(rejected, key=lambda item: item["index"]),
+        "courses": courses,
+        "chapters": chapters,
+    }
+
+
 # ========== 学习统计 ==========
 
+# 汇总行中的计数字段
+SUMMARY_FIELDS = ("total_courses", "in_progress_courses", "completed_courses", "total_chapters", "completed_chapters")
+
+
+def count_learning_summaries(db: Session, user_ids: List[int]) -> Dict[int, Dict[str, int]]:
+    """
+    按进度表统计用户学习汇总：{用户ID: {计数字段}}（课程、章节各一条条件聚合查询）
+
+    汇总行首次写入和 scripts/rebuild_learning_summaries.py 重建时使用
+    """
+    counts = {user_id: dict.fromkeys(SUMMARY_FIELDS, 0) for user_id in user_ids}
+    if not counts:
+        return counts
+
+    def count_status(column, value):
+        return func.coalesce(func.sum(case((column == value, 1), else_=0)), 0)
+
+    for user_id, total, in_progress, completed in db.query(
+        CourseProgress.user_id,
+        func.count(CourseProgress.id),
+        count_status(CourseProgress.status, LearningStatus.IN_PROGRESS),
+        count_status(CourseProgress.status, LearningStatus.COMPLETED)
+    ).filter(CourseProgress.user_id.in_(user_ids)).group_by(CourseProgress.user_id):
+        counts[user_id].update(total_courses=total, in_progress_courses=in_progress, completed_courses=completed)
+
+    for user_id, total, completed in db.query(
+        ChapterProgress.user_id,
+        func.count(ChapterProgress.id),
+        count_status(ChapterProgress.status, LearningStatus.COMPLETED)
+    ).filter(ChapterProgress.user_id.in_(user_ids)).group_by(ChapterProgress.user_id):
+        counts[user_id].update(total_chapters=total, completed_chapters=completed)
+    return counts
+
+
+def _seed_learning_summary(db: Session, user_id: int) -> bool:
+    """按进度表当前数据写入汇总行（不提交事务），已有汇总行时不写入，返回是否写入"""
+    insert = dialect_insert(db)
+    result = db.execute(
+        insert(LearningSummary).values(user_id=user_id, **count_learning_summaries(db, [user_id])[user_id])
+        .on_conflict_do_nothing(index_elements=[LearningSummary.user_id])
+    )
+    return bool(result.rowcount)
+
+
+def _update_learning_summary(db: Session, user_id: int, **deltas: int) -> None:
+    """
+    增减用户学习汇总的计数（不提交事务），在进度修改之后调用
+
+    - 已有汇总行时在数据库当前值上加减，并发写入不会互相覆盖
+    - 没有汇总行时（新用户、汇总上线前的用户）按进度表统计写入，统计结果已包含本次修改，不再加减
+    """
+    values = {field: getattr(LearningSummary, field) + delta for field, delta in deltas.items() if delta}
+    if not values:
+        return
+
+    # 本次的进度修改先写入数据库（统计时需要包含）
+    db.flush()
+    stmt = update(LearningSummary).where(LearningSummary.user_id == user_id).values(**values)
+    if db.execute(stmt).rowcount or _seed_learning_summary(db, user_id):
+        return
+    # 其他事务同时写入了汇总行（统计中不含本次修改）
+    db.execute(stmt)
+
+
+def _course_status_deltas(old: LearningStatus, new: LearningStatus) -> Dict[str, int]:
+    """课程状态变化对应的汇总计数增减"""
+    deltas = dict.fromkeys(("in_progress_courses", "completed_courses"), 0)
+    for value, sign in ((old, -1), (new, 1)):
+        if value == LearningStatus.IN_PROGRESS:
+            deltas["in_progress_courses"] += sign
+        elif value == LearningStatus.COMPLETED:
+            deltas["completed_courses"] += sign
+    return deltas
+
+
 def get_learning_stats(db: Session, user_id: int) -> dict:
-    """获取用户学习统计"""
-    # 课程统计
-    course_progresses = get_user_course_progress(db, user_id)
-    total_courses = len(course_progresses)
-    completed_courses = sum(1 for p in course_progresses if p.status == LearningStatus.COMPLETED)
-    in_progress_courses = sum(1 for p in course_progresses if p.status == LearningStatus.IN_PROGRESS)
-
-    # 章节统计
-    chapter_progresses = get_user_chapter_progress(db, user_id)
-    total_chapters = len(chapter_progresses)
-    completed_chapters = sum(1 for p in chapter_progresses if p.status == LearningStatus.COMPLETED)
+    """
+    获取用户学习统计
+
+    读取汇总行（按主键一次查询）；没有汇总行时按进度表统计一次并写入
+    """
+    summary = db.get(LearningSummary, user_id)
+    if summary is None:
+        _seed_learning_summary(db, user_id)
+        db.commit()
+        summary = db.get(LearningSummary, user_id)
 
     return {
-        "total_courses": total_courses,
-        "completed_courses": completed_courses,
-        "in_progress_courses": in_progress_courses,
-        "total_chapters": total_chapters,
-        "completed_chapters": completed_chapters,
-        "overall_progress": (completed_courses / total_courses * 100) if total_courses > 0 else 0
+        "total_courses": summary.total_courses,
+        "completed_courses": summary.completed_courses,
+        "in_progress_courses": summary.in_progress_courses,
+        "total_chapters": summary.total_chapters,
+        "completed_chapters": summary.completed_chapters,
+        "overall_progress": (summary.completed_courses / summary.total_courses * 100) if summary.total_courses > 0 else 0
     }
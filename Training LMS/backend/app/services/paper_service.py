@@ -0,0 +1,384 @@
+"""
+组卷引擎（按 Exam.question_distribution 随机抽题）
+
+- 题库ID按 (course_id, chapter_id, category, difficulty) 预先分桶，常驻内存
+- 每次抽题只在匹配的桶上做 O(k) 抽样，不再对整张 questions 表 ORDER BY RANDOM()
+- 题目新增/编辑/停用/删除时增量更新对应的桶
+- 下发给考生的试卷（不含答案）预先编码为JSON字节并缓存，所有考生共用一次序列化
+
+question_distribution 格式：
+    {"skill": 15, "value": 5}            按分类抽题，"value" 表示所有价值观分类
+    {"skill:困难": 3, "skill": 12}        分类后可加 ":难度" 限定难度
+"""
+import hashlib
+import random
+import threading
+import time
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple, Iterable
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from ..models.exam import Exam, ExamQuestion, Question, QuestionCategory
+from ..schemas.exam import QuestionResponseWithoutAnswer
+from ..utils.cache import LRUCache
+from ..utils.question_options import read_options
+from .grading_service import load_questions, build_snapshot_item, snapshot_question_ids, SNAPSHOT_VERSION
+
+
+# 桶键：(course_id, chapter_id, category, difficulty)
+PoolKey = Tuple[Optional[int], Optional[int], str, Optional[str]]
+
+# 全量重建间隔（秒），兜底脚本直接写库等未经过API的题目变更
+POOL_MAX_AGE_SECONDS = 600
+
+VALUE_CATEGORIES = frozenset(c.value for c in QuestionCategory if c != QuestionCategory.SKILL)
+
+
+class QuestionPools:
+    """题库ID池（进程内）"""
+
+    def __init__(self):
+        self._pools: Dict[PoolKey, List[int]] = {}
+        self._positions: Dict[int, PoolKey] = {}
+        self._index: Dict[int, int] = {}  # 题目ID → 在桶内的下标（用于O(1)删除）
+        self._lock = threading.RLock()
+        self._loaded_at: Optional[float] = None
+
+    # ---------- 构建与增量维护 ----------
+
+    def ensure_loaded(self, db: Session) -> None:
+        """首次使用或超过最大存活时间时全量重建"""
+        if self._loaded_at is None or time.monotonic() - self._loaded_at > POOL_MAX_AGE_SECONDS:
+            self.rebuild(db)
+
+    def rebuild(self, db: Session) -> None:
+        """全量重建（只查询分桶所需的列）"""
+        rows = db.query(
+            Question.id, Question.course_id, Question.chapter_id,
+            Question.category, Question.difficulty
+        ).filter(Question.is_active == True).all()
+
+        with self._lock:
+            self._pools = {}
+            self._positions = {}
+            self._index = {}
+            for question_id, course_id, chapter_id, category, difficulty in rows:
+                self._add(question_id, (course_id, chapter_id, _category_value(category), difficulty))
+            self._loaded_at = time.monotonic()
+
+    def refresh_question(self, question: Question) -> None:
+        """题目新增/编辑后增量更新（停用的题目移出题库）"""
+        with self._lock:
+            if self._loaded_at is None:
+                return  # 尚未加载，首次抽题时会全量构建
+            self._remove(question.id)
+            if question.is_active:
+                key = (question.course_id, question.chapter_id, _category_value(question.category), question.difficulty)
+                self._add(question.id, key)
+
+    def remove_question(self, question_id: int) -> None:
+        """题目删除后移出题库"""
+        with self._lock:
+            self._remove(question_id)
+
+    def invalidate(self) -> None:
+        """标记失效，下次抽题时全量重建"""
+        with self._lock:
+            self._loaded_at = None
+
+    def _add(self, question_id: int, key: PoolKey) -> None:
+        pool = self._pools.setdefault(key, [])
+        self._positions[question_id] = key
+        self._index[question_id] = len(pool)
+        pool.append(question_id)
+
+    def _remove(self, question_id: int) -> None:
+        key = self._positions.pop(question_id, None)
+        if key is None:
+            return
+        pool = self._pools[key]
+        index = self._index.pop(question_id)
+        # 与末尾元素交换后弹出，O(1)
+        last_id = pool.pop()
+        if last_id != question_id:
+            pool[index] = last_id
+            self._index[last_id] = index
+        if not pool:
+            del self._pools[key]
+
+    # ---------- 抽题 ----------
+
+    def sample(
+        self,
+        k: int,
+        course_id: Optional[int] = None,
+        chapter_id: Optional[int] = None,
+        categories: Optional[Iterable[str]] = None,
+        difficulty: Optional[str] = None,
+        exclude: Optional[Set[int]] = None,
+        course_ids: Optional[Set[int]] = None
+    ) -> List[int]:
+        """
+        从所有匹配的桶中无放回抽取k道题（不足k道时返回全部可用题目）
+
+        course_ids 限定多门课程（如部门课程池），与 course_id 同时传入时两者都需满足
+        """
+        category_set = set(categories) if categories else None
+        exclude = exclude or set()
+
+        with self._lock:
+            pools = [
+                pool for (c_id, ch_id, category, diff), pool in self._pools.items()
+                if (course_id is None or c_id == course_id)
+                and (course_ids is None or c_id in course_ids)
+                and (chapter_id is None or ch_id == chapter_id)
+                and (category_set is None or category in category_set)
+                and (difficulty is None or diff == difficulty)
+            ]
+            if not pools or k <= 0:
+                return []
+
+            # 把多个桶视为一个虚拟序列，random.sample(range) 只生成k个下标
+            bounds = list(accumulate(len(pool) for pool in pools))
+            total = bounds[-1]
+            draw = min(total, k + len(exclude))
+
+            result = []
+            for offset in random.sample(range(total), draw):
+                pool_index = bisect_right(bounds, offset)
+                start = bounds[pool_index - 1] if pool_index else 0
+                question_id = pools[pool_index][offset - start]
+                if question_id not in exclude:
+                    result.append(question_id)
+                    if len(result) == k:
+                        break
+            return result
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"pools": len(self._pools), "questions": len(self._positions)}
+
+
+_pools = QuestionPools()
+
+
+def _category_value(category) -> str:
+    return category.value if hasattr(category, "value") else category
+
+
+def parse_distribution_key(key: str) -> Tuple[Set[str], Optional[str]]:
+    """解析分布配置键 → (分类集合, 难度)"""
+    category, _, difficulty = key.partition(":")
+    category = category.strip()
+    if category == "value":
+        categories = set(VALUE_CATEGORIES)
+    elif category in VALUE_CATEGORIES or category == QuestionCategory.SKILL.value:
+        categories = {category}
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"题目分布配置无效：未知的题目分类 {category}"
+        )
+    return categories, (difficulty.strip() or None)
+
+
+def assemble_paper(db: Session, exam: Exam) -> List[int]:
+    """按考试的题目分布随机组卷，返回题目ID列表（按抽取顺序）"""
+    _pools.ensure_loaded(db)
+
+    question_ids: List[int] = []
+    chosen: Set[int] = set()
+    for key, count in (exam.question_distribution or {}).items():
+        categories, difficulty = parse_distribution_key(key)
+        drawn = _pools.sample(
+            count,
+            course_id=exam.course_id,
+            chapter_id=exam.chapter_id,
+            categories=categories,
+            difficulty=difficulty,
+            exclude=chosen
+        )
+        if len(drawn) < count:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"题库题目不足：{key} 需要 {count} 道，可用 {len(drawn)} 道"
+            )
+        question_ids.extend(drawn)
+        chosen.update(drawn)
+
+    return question_ids
+
+
+def get_paper_question_ids(db: Session, exam: Exam) -> List[int]:
+    """获取考试题目：固定考题直接返回，否则按题目分布随机抽题"""
+    if exam.question_ids:
+        return fixed_question_ids(db, exam.id)
+    if exam.question_distribution:
+        return assemble_paper(db, exam)
+    return []
+
+
+def fixed_question_ids(db: Session, exam_id: int) -> List[int]:
+    """考试的固定考题ID（按顺序，走 exam_questions 的 (exam_id, position) 索引）"""
+    return [
+        question_id for (question_id,) in db.query(ExamQuestion.question_id)
+        .filter(ExamQuestion.exam_id == exam_id)
+        .order_by(ExamQuestion.position)
+    ]
+
+
+def sample_questions(
+    db: Session,
+    k: int,
+    course_ids: Optional[Set[int]] = None,
+    exclude: Optional[Set[int]] = None
+) -> List[int]:
+    """从题库ID池随机抽题（不限分类和难度，course_ids 为空时从全题库抽取）"""
+    _pools.ensure_loaded(db)
+    return _pools.sample(k, exclude=exclude, course_ids=course_ids)
+
+
+def refresh_question(question: Question) -> None:
+    """题目新增/编辑/停用后更新题库ID池"""
+    _pools.refresh_question(question)
+
+
+def remove_question(question_id: int) -> None:
+    """题目删除后更新题库ID池"""
+    _pools.remove_question(question_id)
+
+
+def invalidate_pools() -> None:
+    """批量写入题目后标记题库ID池失效，下次抽题时全量重建"""
+    _pools.invalidate()
+
+
+def get_pool_stats() -> Dict[str, int]:
+    """题库ID池统计"""
+    return _pools.stats()
+
+
+# ========== 试卷序列化缓存 ==========
+
+# 单题缓存：键为 (题目ID, updated_at)，值为 (不含答案的题目JSON, 快照条目)
+QUESTION_RENDER_CACHE_SIZE = 8192
+_question_render_cache = LRUCache(maxsize=QUESTION_RENDER_CACHE_SIZE)
+
+# 固定考题整卷缓存：键为考试ID，值带版本号 (考试updated_at, 题目数, 题目最大updated_at)
+PAPER_CACHE_SIZE = 256
+_paper_cache = LRUCache(maxsize=PAPER_CACHE_SIZE)
+
+
+class RenderedPaper(NamedTuple):
+    """编码好的试卷"""
+    question_ids: List[int]
+    body: bytes                          # 题目列表JSON数组（不含答案、解析）
+    etag: str
+    snapshot: Optional[Dict[str, Any]]   # 试卷快照（含答案键哈希，只存库不下发）
+    revision: Any = None
+
+
+def render_question(question: Question) -> Tuple[bytes, Dict[str, Any]]:
+    """单题编码：(不含答案的JSON字节, 快照条目)，按 (题目ID, updated_at) 缓存"""
+    cache_key = (question.id, question.updated_at)
+    rendered = _question_render_cache.get(cache_key)
+    if rendered is None:
+        options = read_options(question.options, question.correct_answer)
+        data = QuestionResponseWithoutAnswer.model_validate({
+            "id": question.id,
+            "content": question.content,
+            "question_type": question.question_type,
+            "category": question.category,
+            "difficulty": question.difficulty,
+            "options": None if options is None else [
+                {"label": opt["label"], "content": opt["content"]}
+                for opt in options
+            ],
+        })
+        rendered = (data.model_dump_json().encode("utf-8"), build_snapshot_item(question))
+        _question_render_cache.set(cache_key, rendered)
+    return rendered
+
+
+def render_paper(questions: List[Question], revision: Any = None) -> RenderedPaper:
+    """拼接整卷（题目顺序即出题顺序）"""
+    parts = [render_question(q) for q in questions]
+    body = b"[" + b",".join(part[0] for part in parts) + b"]"
+    return RenderedPaper(
+        question_ids=[q.id for q in questions],
+        body=body,
+        etag='"' + hashlib.sha1(body).hexdigest()[:20] + '"',
+        snapshot={"version": SNAPSHOT_VERSION, "items": [part[1] for part in parts]} if parts else None,
+        revision=revision
+    )
+
+
+def _fixed_paper_revision(db: Session, exam: Exam) -> Tuple:
+    """固定考题的版本号（一次按关联表索引的聚合查询，不加载题目）"""
+    count, last_updated = db.query(
+        func.count(Question.id), func.max(Question.updated_at)
+    ).join(ExamQuestion, ExamQuestion.question_id == Question.id).filter(ExamQuestion.exam_id == exam.id).one()
+    return exam.updated_at, count, last_updated
+
+
+def _load_ordered(db: Session, question_ids: List[int]) -> List[Question]:
+    questions_by_id = load_questions(db, question_ids)
+    return [questions_by_id[qid] for qid in question_ids if qid in questions_by_id]
+
+
+def _load_fixed(db: Session, exam_id: int) -> List[Question]:
+    """按关联表顺序加载固定考题（一次连接查询）"""
+    return db.query(Question).join(
+        ExamQuestion, ExamQuestion.question_id == Question.id
+    ).filter(ExamQuestion.exam_id == exam_id).order_by(ExamQuestion.position).all()
+
+
+def get_fixed_paper(db: Session, exam: Exam) -> RenderedPaper:
+    """固定考题试卷（版本号未变时直接复用缓存的字节）"""
+    revision = _fixed_paper_revision(db, exam)
+    paper = _paper_cache.get(exam.id)
+    if paper is None or paper.revision != revision:
+        paper = render_paper(_load_fixed(db, exam.id), revision)
+        _paper_cache.set(exam.id, paper)
+    return paper
+
+
+def build_exam_paper(db: Session, exam: Exam) -> RenderedPaper:
+    """开考组卷：固定考题走整卷缓存，随机组卷按题拼接缓存的单题JSON"""
+    if exam.question_ids:
+        return get_fixed_paper(db, exam)
+    return render_paper(_load_ordered(db, get_paper_question_ids(db, exam)))
+
+
+def render_record_paper(db: Session, exam: Exam, snapshot: Optional[Dict[str, Any]]) -> RenderedPaper:
+    """按考试记录的快照还原试卷（继续考试时使用，题目和顺序不变）"""
+    question_ids = snapshot_question_ids(snapshot) or list(exam.question_ids or [])
+    if exam.question_ids and question_ids == list(exam.question_ids):
+        return get_fixed_paper(db, exam)
+    return render_questions(db, question_ids)
+
+
+def render_questions(db: Session, question_ids: List[int]) -> RenderedPaper:
+    """按给定题目ID顺序拼接试卷（单题JSON走缓存）"""
+    return render_paper(_load_ordered(db, question_ids))
+
+
+def invalidate_exam_paper(exam_id: int) -> None:
+    """考试编辑/删除后清除整卷缓存"""
+    _paper_cache.pop(exam_id)
+
+
+def invalidate_question_paper(question_id: int) -> None:
+    """题目编辑/删除后清除单题缓存和包含该题的整卷缓存"""
+    _question_render_cache.discard_if(lambda key: key[0] == question_id)
+    _paper_cache.discard_items_if(lambda key, paper: question_id in paper.question_ids)
+
+
+def get_paper_cache_stats() -> Dict[str, Any]:
+    """试卷缓存统计"""
+    return {
+        "papers": _paper_cache.stats(),
+        "questions": _question_render_cache.stats(),
+    }
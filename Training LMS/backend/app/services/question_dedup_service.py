@@ -0,0 +1,218 @@
+"""
+题库近似重复检测（MinHash + LSH）
+
+- 题目文本 = 题干 + 各选项内容（选项按内容排序，选项顺序不同视为同一题）
+- 答案不同的题目不算重复：文本相似且答案相同（正确选项的内容 / 判断题结果 / 答案文本）才判为重复，
+  避免“绿色/蓝色砧板用于？”这类选项相同、答案不同的题目被归为一组
+- 每道题的 LSH 分段桶键存入 question_lsh_bands，新建题目时按桶键一次索引查询得到候选，
+  只对候选题目计算相似度
+- 全库扫描（scripts/find_duplicate_questions.py）在内存中逐段分桶、并查集聚类，不做两两比较
+- 内容指纹 content_hash：归一化题目文本的SHA-1，批量导入按指纹精确去重（重复导入同一题包不产生新题目）
+"""
+import hashlib
+from array import array
+from collections import defaultdict
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from ..models.exam import Question
+from ..models.question_lsh import QuestionLshBand
+from ..utils.minhash import BANDS, band_keys, find_clusters, match_similar, normalize_text, signature
+from .grading_service import normalize_true_false, parse_labels
+
+DUPLICATE_THRESHOLD = 0.8
+SCAN_BATCH_SIZE = 2000
+
+
+def question_text(content: Optional[str], options: Optional[List[Dict[str, Any]]]) -> str:
+    """参与比较的题目文本"""
+    option_texts = sorted(str(opt.get("content", "")) for opt in options or [] if isinstance(opt, dict))
+    return " ".join([content or "", *option_texts])
+
+
+def content_hash(content: Optional[str], options: Optional[List[Dict[str, Any]]]) -> str:
+    """题目内容指纹（标点、空白、全半角和选项顺序不同视为同一题）"""
+    return hashlib.sha1(normalize_text(question_text(content, options)).encode("utf-8")).hexdigest()
+
+
+def answer_text(question_type: Any, options: Optional[List[Dict[str, Any]]], correct_answer: Optional[str]) -> str:
+    """
+    参与比较的答案（与选项标签无关，归一化后比较）
+
+    选择题为正确选项的内容（口径同判分：优先 correct_answer，否则取 is_correct 标记），
+    判断题为 true/false，其他题型为答案文本
+    """
+    question_type = getattr(question_type, "value", question_type)
+    if question_type in ("single_choice", "multiple_choice"):
+        options = [opt for opt in options or [] if isinstance(opt, dict)]
+        labels = parse_labels(correct_answer) if correct_answer else {opt.get("label") for opt in options if opt.get("is_correct")}
+        return "|".join(sorted(normalize_text(str(opt.get("content", ""))) for opt in options if opt.get("label") in labels))
+    if question_type == "true_false":
+        return normalize_true_false(correct_answer) if correct_answer else ""
+    return normalize_text(correct_answer or "")
+
+
+def question_signature(content: Optional[str], options: Optional[List[Dict[str, Any]]]) -> Optional[array]:
+    """题目签名（归一化后为空文本时返回None，不参与比较）"""
+    text = normalize_text(question_text(content, options))
+    if not text:
+        return None
+    return signature(text, normalized=True)
+
+
+# ========== 桶键索引 ==========
+
+def band_rows(question_id: int, sig: array) -> List[Dict[str, int]]:
+    """题目的桶键行"""
+    return [
+        {"question_id": question_id, "band": band, "bucket": bucket}
+        for band, bucket in enumerate(band_keys(sig))
+    ]
+
+
+def index_question(db: Session, question: Question) -> None:
+    """写入/更新题目的桶键（题目需已 flush 获得ID，不提交事务）"""
+    remove_question(db, question.id)
+    sig = question_signature(question.content, question.options)
+    if sig is None:
+        return
+    db.execute(insert(QuestionLshBand), band_rows(question.id, sig))
+
+
+def remove_question(db: Session, question_id: int) -> None:
+    """删除题目的桶键（不提交事务）"""
+    db.query(QuestionLshBand).filter(QuestionLshBand.question_id == question_id).delete(synchronize_session=False)
+
+
+def find_similar_questions(
+    db: Session,
+    question: Question,
+    threshold: float = DUPLICATE_THRESHOLD,
+    exclude_id: Optional[int] = None
+) -> List[Tuple[int, float]]:
+    """
+    查找与给定题目近似重复的已启用题目 → [(题目ID, 相似度), ...]
+
+    一次按桶键的索引查询取候选，答案相同的候选再计算文本相似度
+    """
+    sig = question_signature(question.content, question.options)
+    if sig is None:
+        return []
+    answer = answer_text(question.question_type, question.options, question.correct_answer)
+
+    candidates = db.query(
+        Question.id, Question.content, Question.options, Question.question_type, Question.correct_answer
+    ).filter(
+        Question.id.in_(
+            db.query(QuestionLshBand.question_id).filter(QuestionLshBand.bucket.in_(band_keys(sig)))
+        ),
+        Question.is_active == True
+    )
+    if exclude_id is not None:
+        candidates = candidates.filter(Question.id != exclude_id)
+
+    scored = []
+    for question_id, other_content, other_options, question_type, correct_answer in candidates:
+        if answer_text(question_type, other_options, correct_answer) != answer:
+            continue
+        other = question_signature(other_content, other_options)
+        if other is not None:
+            scored.append((question_id, other))
+    return match_similar(sig, scored, threshold)
+
+
+def ensure_not_duplicate(db: Session, question: Question, exclude_id: Optional[int] = None) -> None:
+    """存在近似重复（文本相似且答案相同）的题目时返回409"""
+    similar = find_similar_questions(db, question, exclude_id=exclude_id)
+    if similar:
+        summary = "、".join(f"{question_id}（相似度{score:.0%}）" for question_id, score in similar[:5])
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"题库中已有相似题目：{summary}。确认不是重复题目请设置 allow_duplicate=true"
+        )
+
+
+# ========== 全库扫描 ==========
+
+class QuestionFingerprint(NamedTuple):
+    """全库扫描用的题目指纹"""
+    signature: array
+    answer: str
+    content_hash: str
+
+
+def load_fingerprints(db: Session, active_only: bool = True, batch_size: int = SCAN_BATCH_SIZE) -> Dict[int, QuestionFingerprint]:
+    """流式读取题库并计算签名、答案和内容指纹 → {题目ID: 指纹}（归一化后为空文本的题目不参与）"""
+    query = db.query(Question.id, Question.content, Question.options, Question.question_type, Question.correct_answer)
+    if active_only:
+        query = query.filter(Question.is_active == True)
+
+    fingerprints = {}
+    for question_id, content, options, question_type, correct_answer in query.order_by(Question.id).yield_per(batch_size):
+        sig = question_signature(content, options)
+        if sig is not None:
+            fingerprints[question_id] = QuestionFingerprint(
+                sig, answer_text(question_type, options, correct_answer), content_hash(content, options)
+            )
+    return fingerprints
+
+
+def cluster_fingerprints(fingerprints: Dict[int, QuestionFingerprint], threshold: float = DUPLICATE_THRESHOLD) -> List[List[int]]:
+    """按答案分组后在组内聚类（每簇按题目ID升序，簇按首个ID排序）"""
+    groups: Dict[str, Dict[int, array]] = defaultdict(dict)
+    for question_id, fingerprint in fingerprints.items():
+        groups[fingerprint.answer][question_id] = fingerprint.signature
+    return sorted(cluster for signatures in groups.values() for cluster in find_clusters(signatures, threshold))
+
+
+def exact_duplicates(cluster: List[int], fingerprints: Dict[int, QuestionFingerprint]) -> List[int]:
+    """簇内与更早的题目内容指纹、答案都相同的题目ID（完全重复，可直接停用）"""
+    seen = set()
+    duplicates = []
+    for question_id in cluster:
+        key = (fingerprints[question_id].content_hash, fingerprints[question_id].answer)
+        if key in seen:
+            duplicates.append(question_id)
+        seen.add(key)
+    return duplicates
+
+
+def find_duplicate_clusters(db: Session, threshold: float = DUPLICATE_THRESHOLD, active_only: bool = True) -> List[List[int]]:
+    """全库近似重复聚类（每簇按题目ID升序）"""
+    return cluster_fingerprints(load_fingerprints(db, active_only), threshold)
+
+
+def rebuild_index(db: Session, signatures: Dict[int, array], batch_size: int = SCAN_BATCH_SIZE) -> int:
+    """按签名全量重建桶键表（提交事务），返回写入的题目数"""
+    db.query(QuestionLshBand).delete(synchronize_session=False)
+    rows = []
+    for question_id, sig in signatures.items():
+        rows.extend(band_rows(question_id, sig))
+        if len(rows) >= batch_size * BANDS:
+            db.execute(insert(QuestionLshBand), rows)
+            rows = []
+    if rows:
+        db.execute(insert(QuestionLshBand), rows)
+    db.commit()
+    return len(signatures)
+
+
+def backfill_content_hashes(db: Session, batch_size: int = SCAN_BATCH_SIZE) -> int:
+    """补齐缺失的内容指纹（按ID分批提交），返回更新的题目数"""
+    updated = 0
+    last_id = 0
+    while True:
+        rows = db.query(Question.id, Question.content, Question.options).filter(
+            Question.id > last_id,
+            Question.content_hash.is_(None)
+        ).order_by(Question.id).limit(batch_size).all()
+        if not rows:
+            return updated
+        db.execute(update(Question), [
+            {"id": question_id, "content_hash": content_hash(content, options)}
+            for question_id, content, options in rows
+        ])
+        db.commit()
+        updated += len(rows)
+        last_id = rows[-1].id
@@ -0,0 +1,231 @@
+"""
+题目批量导入（JSON Lines / CSV 题包）
+
+- 流式逐行读取，按块（chunk_size）校验、去重、批量插入并提交，内存只占一块
+- 每行先经过 QuestionCreate 校验字段，再按 app/utils/question_validation.py 的规则检查（与 validate_question_data.py 一致）
+- 按内容指纹（content_hash）幂等：题库中已有或本次已导入的相同题目跳过，重复导入同一题包不产生新题目
+- 插入后写入查重桶键，并让组卷题库在下次抽题时重建
+
+JSON Lines：每行一个题目对象，字段同 QuestionCreate（兼容旧生成脚本的 text 字段名）
+CSV：表头 content,question_type,category,difficulty,course_id,chapter_id,option_A..option_F,correct_answer,explanation，
+     选择题的正确选项取自 correct_answer（如 "A,C"），也可以用 options 列直接写选项JSON
+"""
+import csv
+import json
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from ..models.exam import Question
+from ..models.question_lsh import QuestionLshBand
+from ..schemas.exam import QuestionCreate
+from ..utils.question_options import flag_correct_options, normalize_options
+from ..utils.question_validation import validate_question
+from . import paper_service, question_dedup_service
+
+IMPORT_FORMATS = ("jsonl", "csv")
+DEFAULT_CHUNK_SIZE = 500
+MAX_REPORTED_ERRORS = 100
+
+CSV_OPTION_LABELS = ("A", "B", "C", "D", "E", "F")
+CSV_NULLABLE_FIELDS = ("category", "difficulty", "course_id", "chapter_id", "correct_answer", "explanation", "is_active")
+
+Record = Tuple[int, Any]  # (行号, 原始记录)
+
+
+def detect_format(filename: Optional[str]) -> str:
+    """按文件扩展名判断题包格式（默认 JSON Lines）"""
+    return "csv" if (filename or "").lower().endswith(".csv") else "jsonl"
+
+
+# ========== 读取 ==========
+
+def read_jsonl(stream: TextIO) -> Iterator[Record]:
+    """逐行读取 JSON Lines（跳过空行，无法解析的行原样返回字符串，由校验报错）"""
+    for line_no, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield line_no, json.loads(line)
+        except json.JSONDecodeError:
+            yield line_no, line
+
+
+def read_csv(stream: TextIO) -> Iterator[Record]:
+    """逐行读取 CSV（行号为文件中的行号）"""
+    reader = csv.DictReader(stream)
+    for row in reader:
+        yield reader.line_num, row
+
+
+def _csv_record(row: Dict[str, Any]) -> Dict[str, Any]:
+    """CSV 行转为题目字段：空单元格视为未填写，option_X 列合并为选项列表"""
+    record = {key.strip(): (value.strip() if isinstance(value, str) else value) for key, value in row.items() if key}
+    for field in CSV_NULLABLE_FIELDS:
+        if record.get(field) == "":
+            record.pop(field)
+
+    if record.get("options"):
+        record["options"] = json.loads(record["options"])
+    else:
+        record.pop("options", None)
+        answer_labels = {label.strip() for label in (record.get("correct_answer") or "").split(",")}
+        options = [
+            {"label": label, "content": record[f"option_{label}"], "is_correct": label in answer_labels}
+            for label in CSV_OPTION_LABELS
+            if record.get(f"option_{label}")
+        ]
+        if options:
+            record["options"] = options
+    for label in CSV_OPTION_LABELS:
+        record.pop(f"option_{label}", None)
+    return record
+
+
+def parse_record(raw: Any, file_format: str = "jsonl") -> Tuple[Optional[Dict[str, Any]], List[str], List[str]]:
+    """
+    原始记录 → (题目字段, 错误列表, 警告列表)
+
+    有错误时题目字段为 None
+    """
+    if not isinstance(raw, dict):
+        return None, ["不是有效的JSON对象"], []
+
+    record = dict(raw)
+    if file_format == "csv":
+        try:
+            record = _csv_record(record)
+        except json.JSONDecodeError:
+            return None, ["options 列不是有效的JSON"], []
+    if "content" not in record and "text" in record:
+        record["content"] = record.pop("text")
+
+    try:
+        if isinstance(record.get("options"), dict):
+            # 字典格式的选项需要按 correct_answer 标记正确答案
+            record["options"] = normalize_options(record["options"], record.get("correct_answer"))
+        data = QuestionCreate.model_validate(record)
+    except (ValueError, ValidationError) as e:
+        if isinstance(e, ValidationError):
+            return None, [f"{'.'.join(map(str, err['loc'])) or '记录'}: {err['msg']}" for err in e.errors()], []
+        return None, [str(e)], []
+
+    fields = data.model_dump()
+    # 与 Question 的写入校验一致：is_correct 以 correct_answer 为准（批量插入不经过模型校验）
+    flag_correct_options(fields["options"], fields.get("correct_answer"))
+    errors, warnings = validate_question(fields["content"], fields["question_type"].value, fields["options"])
+    if errors:
+        return None, errors, warnings
+    return fields, [], warnings
+
+
+# ========== 导入 ==========
+
+def _chunks(records: Iterable[Record], size: int) -> Iterator[List[Record]]:
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _existing_hashes(db: Session, hashes: Iterable[str]) -> set:
+    """题库中已存在的内容指纹（一次索引查询）"""
+    hashes = set(hashes)
+    if not hashes:
+        return set()
+    return {h for (h,) in db.query(Question.content_hash).filter(Question.content_hash.in_(hashes))}
+
+
+def import_questions(
+    db: Session,
+    stream: TextIO,
+    file_format: str = "jsonl",
+    creator_id: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    dry_run: bool = False
+) -> Dict[str, Any]:
+    """
+    导入题目，返回导入报告
+
+    stream 为文本流（逐行读取，不整体载入内存）。每块一次指纹查询、一次批量 INSERT ... RETURNING、一次桶键批量插入，块内提交；
+    中途失败时已提交的块保留，修正题包后重新导入会跳过这些题目。dry_run 只校验和去重，不写库
+
+    导入前先补齐题库中缺失的内容指纹（指纹列上线前的题目、脚本直接写库的题目），保证去重完整
+    """
+    start = time.perf_counter()
+    if not dry_run:
+        question_dedup_service.backfill_content_hashes(db)
+    records = read_csv(stream) if file_format == "csv" else read_jsonl(stream)
+    report = {
+        "format": file_format,
+        "total": 0,
+        "inserted": 0,
+        "duplicates": 0,
+        "invalid": 0,
+        "warnings": 0,
+        "errors": [],
+        "dry_run": dry_run,
+    }
+    seen = set()  # 本次导入已处理的指纹（题包内部重复）
+
+    def add_error(line_no: int, messages: List[str]) -> None:
+        if len(report["errors"]) < MAX_REPORTED_ERRORS:
+            report["errors"].append({"line": line_no, "message": "；".join(messages)})
+
+    for chunk in _chunks(records, max(1, chunk_size)):
+        report["total"] += len(chunk)
+
+        parsed = []
+        for line_no, raw in chunk:
+            fields, errors, warnings = parse_record(raw, file_format)
+            report["warnings"] += len(warnings)
+            if errors:
+                report["invalid"] += 1
+                add_error(line_no, errors)
+                continue
+            fields["content_hash"] = question_dedup_service.content_hash(fields["content"], fields["options"])
+            parsed.append(fields)
+
+        existing = _existing_hashes(db, (fields["content_hash"] for fields in parsed))
+        rows = []
+        for fields in parsed:
+            if fields["content_hash"] in existing or fields["content_hash"] in seen:
+                report["duplicates"] += 1
+                continue
+            seen.add(fields["content_hash"])
+            rows.append({**fields, "created_by": creator_id})
+
+        if not rows:
+            continue
+        if dry_run:
+            report["inserted"] += len(rows)
+            continue
+
+        # 直接对表执行 executemany（不走ORM批量持久化，行数多时开销明显更小）
+        inserted = db.execute(
+            insert(Question.__table__).returning(Question.__table__.c.id, sort_by_parameter_order=True),
+            rows
+        ).all()
+        bands = []
+        for (question_id,), row in zip(inserted, rows):
+            sig = question_dedup_service.question_signature(row["content"], row["options"])
+            if sig is not None:
+                bands.extend(question_dedup_service.band_rows(question_id, sig))
+        if bands:
+            db.execute(insert(QuestionLshBand.__table__), bands)
+        db.commit()
+        report["inserted"] += len(inserted)
+
+    if report["inserted"] and not dry_run:
+        paper_service.invalidate_pools()
+
+    elapsed = time.perf_counter() - start
+    report["elapsed_seconds"] = round(elapsed, 3)
+    report["rows_per_second"] = round(report["total"] / elapsed, 1) if elapsed > 0 else None
+    return report
@@ -0,0 +1,234 @@
+"""
+题目统计（项目分析）
+
+- 难度 p_value：答对率
+- 区分度 discrimination：点二列相关系数（答对/答错与考试总分的相关性，偏低或为负的题目需要复查）
+- 干扰项分析：每个选项被选择的次数
+
+统计表只保存累计量（作答次数、答对次数、总分之和/平方和），每次交卷一条 upsert 原子累加，
+再由返回的累计量计算派生指标，不需要回读历史答卷；历史数据可用 scripts/rebuild_question_stats.py 全量重建
+"""
+import math
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
+from ..core.database import dialect_insert
+from ..models.exam import ExamQuestion, Question
+from ..models.question_stats import QuestionStats, QuestionOptionStats
+from .grading_service import user_answer_labels
+
+STAT_FIELDS = ("attempts", "correct_count", "score_sum", "score_sq_sum", "correct_score_sum")
+SORT_FIELDS = ("p_value", "discrimination", "attempts")
+
+
+# ========== 指标计算 ==========
+
+def p_value(attempts: int, correct_count: int) -> Optional[float]:
+    """难度（答对率）"""
+    return round(correct_count / attempts, 4) if attempts else None
+
+
+def point_biserial(
+    attempts: int, correct_count: int, score_sum: float, score_sq_sum: float, correct_score_sum: float
+) -> Optional[float]:
+    """
+    点二列相关系数 r = (M1 - M0) / s * sqrt(p * q)
+
+    M1/M0 为答对/答错者的平均总分，s 为全体作答者总分的标准差；全对、全错或总分无差异时无法计算
+    """
+    wrong_count = attempts - correct_count
+    if attempts < 2 or correct_count == 0 or wrong_count == 0:
+        return None
+    mean = score_sum / attempts
+    variance = score_sq_sum / attempts - mean * mean
+    if variance <= 1e-9:
+        return None
+    correct_mean = correct_score_sum / correct_count
+    wrong_mean = (score_sum - correct_score_sum) / wrong_count
+    p = correct_count / attempts
+    return round((correct_mean - wrong_mean) / math.sqrt(variance) * math.sqrt(p * (1 - p)), 4)
+
+
+def derive_metrics(row: Dict[str, Any]) -> Dict[str, Any]:
+    """由累计量计算派生指标"""
+    return {
+        "p_value": p_value(row["attempts"], row["correct_count"]),
+        "discrimination": point_biserial(*(row[field] for field in STAT_FIELDS)),
+    }
+
+
+# ========== 累计 ==========
+
+def accumulate(
+    totals: Dict[int, Dict[str, float]],
+    picks: Dict[Tuple[int, str], int],
+    answer_details: List[Dict[str, Any]],
+    total_score: float,
+    question_types: Dict[int, str]
+) -> None:
+    """
+    把一份答卷累加到统计量中（增量更新和全量重建共用）
+
+    - totals: {题目ID: {累计量}}
+    - picks: {(题目ID, 选项标签): 选择次数}
+    - question_types: {题目ID: 题型}，用于按判分口径解析用户答案
+    """
+    score = float(total_score or 0)
+    for detail in answer_details:
+        question_id = detail["question_id"]
+        row = totals.get(question_id)
+        if row is None:
+            row = totals[question_id] = dict.fromkeys(STAT_FIELDS, 0)
+        row["attempts"] += 1
+        row["score_sum"] += score
+        row["score_sq_sum"] += score * score
+        if detail["is_correct"]:
+            row["correct_count"] += 1
+            row["correct_score_sum"] += score
+
+        question_type = question_types.get(question_id)
+        if question_type in ("single_choice", "multiple_choice", "true_false"):
+            for label in user_answer_labels(question_type, detail.get("user_answer")):
+                key = (question_id, label[:20])
+                picks[key] = picks.get(key, 0) + 1
+
+
+def question_types_of(
+    db: Session, question_ids: Iterable[int], snapshot: Optional[Dict[str, Any]] = None
+) -> Dict[int, str]:
+    """题型映射：优先取试卷快照，无快照时按ID查询题型列"""
+    if snapshot:
+        return {item["id"]: item["type"] for item in snapshot.get("items", [])}
+    ids = set(question_ids)
+    if not ids:
+        return {}
+    rows = db.query(Question.id, Question.question_type).filter(Question.id.in_(ids)).all()
+    return {question_id: getattr(question_type, "value", question_type) for question_id, question_type in rows}
+
+
+# ========== 增量更新 ==========
+
+def record_submission(
+    db: Session,
+    answer_details: List[Dict[str, Any]],
+    total_score: float,
+    snapshot: Optional[Dict[str, Any]] = None
+) -> int:
+    """
+    把一份已判分的答卷计入题目统计（不提交事务），返回更新的题目数
+
+    - 累计量一条 INSERT ... ON CONFLICT DO UPDATE 原子累加，RETURNING 新的累计量
+    - 派生指标按主键一次批量 UPDATE
+    - 选项选择次数一条 upsert
+    """
+    if not answer_details:
+        return 0
+
+    totals: Dict[int, Dict[str, float]] = {}
+    picks: Dict[Tuple[int, str], int] = {}
+    question_types = question_types_of(db, (d["question_id"] for d in answer_details), snapshot)
+    accumulate(totals, picks, answer_details, total_score, question_types)
+
+    insert = dialect_insert(db)
+    stmt = insert(QuestionStats).values([
+        {"question_id": question_id, **row} for question_id, row in totals.items()
+    ])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[QuestionStats.question_id],
+        set_={
+            **{field: getattr(QuestionStats, field) + getattr(stmt.excluded, field) for field in STAT_FIELDS},
+            "updated_at": func.now(),
+        }
+    ).returning(QuestionStats.question_id, *(getattr(QuestionStats, field) for field in STAT_FIELDS))
+    updated = db.execute(stmt).all()
+
+    db.execute(update(QuestionStats), [
+        {"question_id": row.question_id, **derive_metrics(row._mapping)} for row in updated
+    ])
+
+    if picks:
+        stmt = insert(QuestionOptionStats).values([
+            {"question_id": question_id, "label": label, "picks": count}
+            for (question_id, label), count in picks.items()
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[QuestionOptionStats.question_id, QuestionOptionStats.label],
+            set_={"picks": QuestionOptionStats.picks + stmt.excluded.picks}
+        )
+        db.execute(stmt)
+
+    return len(updated)
+
+
+def delete_for_question(db: Session, question_id: int) -> None:
+    """删除题目前清除其统计（不提交事务）"""
+    db.query(QuestionOptionStats).filter(QuestionOptionStats.question_id == question_id).delete(synchronize_session=False)
+    db.query(QuestionStats).filter(QuestionStats.question_id == question_id).delete(synchronize_session=False)
+
+
+# ========== 管理后台查询 ==========
+
+def list_question_stats(
+    db: Session,
+    course_id: Optional[int] = None,
+    min_attempts: int = 0,
+    min_p_value: Optional[float] = None,
+    max_p_value: Optional[float] = None,
+    max_discrimination: Optional[float] = None,
+    sort_by: str = "discrimination",
+    descending: bool = False,
+    skip: int = 0,
+    limit: int = 50,
+    exam_id: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    题目统计列表（默认区分度从低到高，便于找出需要停用的题目）
+
+    排序字段均有索引；选项选择次数只查询当前页的题目
+    """
+    query = db.query(QuestionStats, Question).join(Question, Question.id == QuestionStats.question_id)
+    if course_id:
+        query = query.filter(Question.course_id == course_id)
+    if exam_id:
+        query = query.filter(Question.id.in_(
+            db.query(ExamQuestion.question_id).filter(ExamQuestion.exam_id == exam_id)
+        ))
+    if min_attempts:
+        query = query.filter(QuestionStats.attempts >= min_attempts)
+    if min_p_value is not None:
+        query = query.filter(QuestionStats.p_value >= min_p_value)
+    if max_p_value is not None:
+        query = query.filter(QuestionStats.p_value <= max_p_value)
+    if max_discrimination is not None:
+        query = query.filter(QuestionStats.discrimination <= max_discrimination)
+
+    column = getattr(QuestionStats, sort_by)
+    order = column.desc() if descending else column.asc()
+    rows = query.order_by(order.nulls_last(), QuestionStats.question_id).offset(skip).limit(limit).all()
+
+    option_picks: Dict[int, Dict[str, int]] = defaultdict(dict)
+    if rows:
+        for question_id, label, count in db.query(
+            QuestionOptionStats.question_id, QuestionOptionStats.label, QuestionOptionStats.picks
+        ).filter(QuestionOptionStats.question_id.in_([stats.question_id for stats, _ in rows])):
+            option_picks[question_id][label] = count
+
+    return [
+        {
+            "question_id": stats.question_id,
+            "content": question.content,
+            "question_type": question.question_type.value,
+            "course_id": question.course_id,
+            "is_active": question.is_active,
+            "options": question.options,
+            "correct_answer": question.correct_answer,
+            "attempts": stats.attempts,
+            "correct_count": stats.correct_count,
+            "p_value": stats.p_value,
+            "discrimination": stats.discrimination,
+            "option_picks": option_picks.get(stats.question_id, {}),
+            "updated_at": stats.updated_at,
+        }
+        for stats, question in rows
+    ]
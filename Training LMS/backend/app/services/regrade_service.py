@@ -0,0 +1,356 @@
+"""
+重新判分（题目答案修正、考试及格线修改后）
+
+- 修正答案：按 exam_record_questions 反向索引找到包含该题的考试记录，
+  更新记录快照中该题的答案键（进行中的考试交卷时也按新答案判分），已交卷的记录按原答案重新判分
+- 修改及格线/总题数：按 (exam_id, id) 索引分批取该考试已交卷的记录，重新计算成绩和通过状态
+- 任务写入 regrade_jobs，后台线程池执行；每批记录的更新与进度（last_record_id）同一事务提交，
+  进程中断后从进度位置继续，已处理的记录不会重复计算
+- 重新判分后新通过期末考试/试用期考核的记录补发证书；错题本和题目统计不回溯
+  （题目统计可用 scripts/rebuild_question_stats.py 重建）
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+from sqlalchemy import and_, or_, update
+from sqlalchemy.orm import Session
+from ..core.config import settings
+from ..core.database import SessionLocal
+from ..models.exam import Exam, Question
+from ..models.learning import ExamRecord, ExamRecordQuestion, ExamStatus
+from ..models.regrade import RegradeJob, RegradeReason, RegradeStatus
+from . import certificate_service
+from .grading_service import (
+    apply_score, build_snapshot_item, check_answer, load_questions, match_snapshot_item
+)
+
+# 已交卷（需要重新判分）的考试状态
+GRADED_STATUSES = (ExamStatus.PASSED, ExamStatus.FAILED, ExamStatus.PENDING_RETAKE)
+
+RESULT_FIELDS = ("score", "correct_answers", "status", "can_retake", "next_retake_at")
+
+
+# ========== 任务创建 ==========
+
+def create_job(
+    db: Session,
+    reason: RegradeReason,
+    question_id: Optional[int] = None,
+    exam_id: Optional[int] = None,
+    created_by: Optional[int] = None
+) -> RegradeJob:
+    """
+    创建重新判分任务（不提交事务，提交后调用 submit_job 执行）
+
+    同一目标已有等待中的任务时直接复用
+    """
+    pending = db.query(RegradeJob).filter(
+        RegradeJob.status == RegradeStatus.PENDING,
+        RegradeJob.reason == reason,
+        RegradeJob.question_id == question_id if question_id is not None else RegradeJob.question_id.is_(None),
+        RegradeJob.exam_id == exam_id if exam_id is not None else RegradeJob.exam_id.is_(None),
+    ).first()
+    if pending:
+        return pending
+
+    job = RegradeJob(
+        reason=reason,
+        question_id=question_id,
+        exam_id=exam_id,
+        status=RegradeStatus.PENDING,
+        created_by=created_by
+    )
+    db.add(job)
+    db.flush()
+    return job
+
+
+def get_job(db: Session, job_id: int) -> Optional[RegradeJob]:
+    return db.query(RegradeJob).filter(RegradeJob.id == job_id).first()
+
+
+def list_jobs(db: Session, status: Optional[str] = None, skip: int = 0, limit: int = 20) -> List[RegradeJob]:
+    """任务列表（新任务在前）"""
+    query = db.query(RegradeJob)
+    if status:
+        query = query.filter(RegradeJob.status == RegradeStatus(status))
+    return query.order_by(RegradeJob.id.desc()).offset(skip).limit(limit).all()
+
+
+def job_progress(job: RegradeJob) -> Dict[str, Any]:
+    """任务进度"""
+    percent = 100.0 if job.status == RegradeStatus.COMPLETED else (
+        round(job.processed_records * 100 / job.total_records, 1) if job.total_records else 0.0
+    )
+    return {
+        "id": job.id,
+        "reason": job.reason.value,
+        "question_id": job.question_id,
+        "exam_id": job.exam_id,
+        "status": job.status.value,
+        "total_records": job.total_records,
+        "processed_records": job.processed_records,
+        "changed_records": job.changed_records,
+        "percent": percent,
+        "error": job.error,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at,
+    }
+
+
+# ========== 记录查询 ==========
+
+def _records_query(db: Session, job: RegradeJob):
+    """任务涉及的考试记录（按ID递增，走索引）"""
+    query = db.query(ExamRecord)
+    if job.reason == RegradeReason.ANSWER_KEY:
+        # 进行中的记录也要更新快照中的答案键
+        return query.join(
+            ExamRecordQuestion, ExamRecordQuestion.exam_record_id == ExamRecord.id
+        ).filter(
+            ExamRecordQuestion.question_id == job.question_id,
+            ExamRecord.status.in_(GRADED_STATUSES + (ExamStatus.IN_PROGRESS,))
+        )
+    return query.filter(
+        ExamRecord.exam_id == job.exam_id,
+        ExamRecord.status.in_(GRADED_STATUSES)
+    )
+
+
+def count_records(db: Session, job: RegradeJob) -> int:
+    return _records_query(db, job).count()
+
+
+# ========== 判分 ==========
+
+def _refresh_snapshot(snapshot: Dict[str, Any], question: Question) -> Optional[Dict[str, Any]]:
+    """用题目当前答案更新快照中的答案键和正确答案（保留出题时的选项顺序），快照不含该题时返回None"""
+    fresh = build_snapshot_item(question)
+    items = []
+    found = False
+    for item in snapshot.get("items", []):
+        if item["id"] == question.id:
+            item = {**item, **{key: fresh[key] for key in ("type", "keys", "correct", "answer")}}
+            found = True
+        items.append(item)
+    return {**snapshot, "items": items} if found else None
+
+
+def _count_correct(
+    exam_record: ExamRecord, questions: Dict[int, Question]
+) -> Optional[List[Dict[str, Any]]]:
+    """按快照（无快照的旧记录按题目当前答案）重新判定答题详情，无法判定时返回None"""
+    if not exam_record.answers:
+        return None
+    if exam_record.paper_snapshot:
+        items = {item["id"]: item for item in exam_record.paper_snapshot.get("items", [])}
+        return [
+            {**detail, "is_correct": match_snapshot_item(items[detail["question_id"]], detail["user_answer"])}
+            if detail["question_id"] in items else detail
+            for detail in exam_record.answers
+        ]
+    return [
+        {**detail, "is_correct": check_answer(questions[detail["question_id"]], detail["user_answer"])}
+        if detail["question_id"] in questions else detail
+        for detail in exam_record.answers
+    ]
+
+
+def regrade_batch(db: Session, job: RegradeJob, records: List[ExamRecord]) -> int:
+    """
+    重新判分一批记录（不提交事务），返回成绩或状态有变化的记录数
+
+    通过状态新变为通过的期末考试/试用期考核记录补发证书
+    """
+    question = db.query(Question).filter(Question.id == job.question_id).first() if job.question_id else None
+    exams = {exam.id: exam for exam in db.query(Exam).filter(Exam.id.in_({r.exam_id for r in records}))}
+    legacy_ids = {
+        detail["question_id"]
+        for record in records if not record.paper_snapshot
+        for detail in record.answers or []
+    }
+    questions = load_questions(db, legacy_ids)
+
+    changed = 0
+    newly_passed = []
+    for record in records:
+        if question is not None and record.paper_snapshot:
+            snapshot = _refresh_snapshot(record.paper_snapshot, question)
+            if snapshot is not None:
+                record.paper_snapshot = snapshot
+        if record.status not in GRADED_STATUSES:
+            continue  # 进行中的记录只更新快照，交卷时按新答案判分
+
+        answer_details = _count_correct(record, questions)
+        if answer_details is None:
+            continue
+
+        before = tuple(getattr(record, field) for field in RESULT_FIELDS)
+        was_passed = record.status == ExamStatus.PASSED
+        answers_changed = answer_details != record.answers
+        record.answers = answer_details
+        apply_score(
+            exams[record.exam_id], record,
+            sum(1 for detail in answer_details if detail["is_correct"]),
+            record.submitted_at or record.graded_at or datetime.utcnow()
+        )
+        result_changed = tuple(getattr(record, field) for field in RESULT_FIELDS) != before
+        if answers_changed or result_changed:
+            # 成绩详情缓存按 graded_at 区分版本
+            record.graded_at = datetime.utcnow()
+        if result_changed:
+            changed += 1
+            if not was_passed and record.status == ExamStatus.PASSED:
+                newly_passed.append(record)
+
+    certified = [r for r in newly_passed if certificate_service.is_certified_exam(exams[r.exam_id])]
+    if certified:
+        now = datetime.utcnow()
+        certificate_service.reserve_numbers(len(certified))
+        certificate_service.insert_certificates(db, [
+            certificate_service.build_certificate_row(exams[r.exam_id], r, exams[r.exam_id].course.title, now)
+            for r in certified
+        ])
+    return changed
+
+
+# ========== 执行 ==========
+
+def _claim(db: Session, job_id: int) -> bool:
+    """
+    认领任务（条件更新，多进程只有一个执行）
+
+    等待中、失败的任务，以及执行进程已中断（超过 REGRADE_STALE_SECONDS 没有进度）的任务可以认领
+    """
+    now = datetime.utcnow()
+    stale_before = now - timedelta(seconds=settings.REGRADE_STALE_SECONDS)
+    result = db.execute(
+        update(RegradeJob).where(
+            RegradeJob.id == job_id,
+            or_(
+                RegradeJob.status.in_([RegradeStatus.PENDING, RegradeStatus.FAILED]),
+                and_(
+                    RegradeJob.status == RegradeStatus.RUNNING,
+                    or_(RegradeJob.heartbeat_at.is_(None), RegradeJob.heartbeat_at < stale_before)
+                )
+            )
+        ).values(status=RegradeStatus.RUNNING, heartbeat_at=now, error=None)
+    )
+    db.commit()
+    return result.rowcount == 1
+
+
+def run_job(
+    job_id: int,
+    batch_size: Optional[int] = None,
+    stop_event: Optional[threading.Event] = None,
+    on_batch: Optional[Callable[[RegradeJob], None]] = None
+) -> Optional[RegradeJob]:
+    """
+    执行重新判分任务（独立会话），返回结束时的任务；任务已被其他进程执行时返回None
+
+    - 每批记录的判分结果与进度同一事务提交，从 last_record_id 之后继续
+    - on_batch 在每批提交后调用（脚本输出进度）
+    - stop_event 置位时在批次之间停止，任务放回等待状态，重启后由 resume_jobs 继续；
+      进程异常退出时任务停留在执行中，超过 REGRADE_STALE_SECONDS 后可重新认领
+    """
+    batch_size = batch_size or settings.REGRADE_BATCH_SIZE
+    db = SessionLocal()
+    try:
+        if not _claim(db, job_id):
+            return None
+
+        job = get_job(db, job_id)
+        if job.started_at is None:
+            job.started_at = datetime.utcnow()
+            job.total_records = count_records(db, job)
+            db.commit()
+
+        while not (stop_event and stop_event.is_set()):
+            records = _records_query(db, job).filter(
+                ExamRecord.id > job.last_record_id
+            ).order_by(ExamRecord.id).limit(batch_size).all()
+            if not records:
+                job.status = RegradeStatus.COMPLETED
+                job.finished_at = datetime.utcnow()
+                job.total_records = max(job.total_records, job.processed_records)
+                db.commit()
+                break
+
+            job.changed_records += regrade_batch(db, job, records)
+            job.processed_records += len(records)
+            job.last_record_id = records[-1].id
+            job.heartbeat_at = datetime.utcnow()
+            db.commit()
+            db.expunge_all()
+            job = get_job(db, job_id)
+            if on_batch:
+                on_batch(job)
+        else:
+            # 中途停止：放回等待状态，重启后立即继续
+            job.status = RegradeStatus.PENDING
+            job.heartbeat_at = None
+            db.commit()
+        return get_job(db, job_id)
+    except Exception as e:
+        db.rollback()
+        db.execute(
+            update(RegradeJob).where(RegradeJob.id == job_id).values(
+                status=RegradeStatus.FAILED, error=f"{e.__class__.__name__}: {e}"[:2000]
+            )
+        )
+        db.commit()
+        print(f"[重新判分] 任务 {job_id} 失败: {e}")
+        return get_job(db, job_id)
+    finally:
+        db.close()
+
+
+# ========== 后台线程池 ==========
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+_stopping = threading.Event()
+
+
+def submit_job(job_id: int) -> None:
+    """提交任务到后台线程池（事务提交后调用；线程池未启动时由 resume_jobs 或脚本执行）"""
+    with _executor_lock:
+        if _executor is not None and not _stopping.is_set():
+            _executor.submit(run_job, job_id, None, _stopping)
+
+
+def resume_jobs() -> int:
+    """提交所有未完成的任务（启动时调用），返回任务数"""
+    db = SessionLocal()
+    try:
+        job_ids = [job_id for (job_id,) in db.query(RegradeJob.id).filter(
+            RegradeJob.status.in_([RegradeStatus.PENDING, RegradeStatus.RUNNING])
+        ).order_by(RegradeJob.id)]
+    finally:
+        db.close()
+    for job_id in job_ids:
+        submit_job(job_id)
+    return len(job_ids)
+
+
+def start_workers() -> None:
+    """启动重新判分线程池并恢复未完成的任务（应用启动时调用）"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _stopping.clear()
+            _executor = ThreadPoolExecutor(max_workers=settings.REGRADE_WORKERS, thread_name_prefix="regrade")
+    resume_jobs()
+
+
+def stop_workers() -> None:
+    """停止线程池：执行中的任务完成当前批次后停止（应用关闭时调用）"""
+    global _executor
+    _stopping.set()
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
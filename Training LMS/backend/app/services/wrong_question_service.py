@@ -0,0 +1,207 @@
+"""
+错题本业务逻辑
+
+- 交卷时答错的题目批量写入错题本（一条 INSERT ... ON CONFLICT）
+- 间隔复习采用 SM-2：每道错题有难易系数、复习间隔和下次复习时间 due_at
+- 待复习列表走 (user_id, due_at, id) 索引游标分页，每页只读取一页数据
+- 一次复习结束后批量提交评分，一条按主键的批量 UPDATE 写回
+"""
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import and_, or_, update
+from sqlalchemy.orm import Session, joinedload
+from fastapi import HTTPException, status
+from ..core.database import dialect_insert
+from ..models.exam import Question
+from ..models.wrong_question import WrongQuestion
+
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+MASTERED_INTERVAL_DAYS = 21  # 复习间隔达到该天数视为已掌握，移出复习队列
+REVIEW_PAGE_SIZE = 20
+
+
+def record_wrong_answers(
+    db: Session,
+    user_id: int,
+    answer_details: List[Dict[str, Any]],
+    exam_record_id: Optional[int] = None,
+    wrong_at: Optional[datetime] = None
+) -> int:
+    """
+    把答错的题目写入错题本（整卷一条 INSERT ... ON CONFLICT，不逐题查询）
+
+    - 新错题：wrong_count = 1
+    - 已有错题：wrong_count + 1，更新最后答错时间和错误答案，重新标记为未掌握
+    - 复习排期重置：连续答对次数清零，立即进入待复习列表（难易系数不变）
+
+    answer_details 格式与 ExamRecord.answers 一致，不提交事务，返回写入的错题数
+    """
+    wrong_at = wrong_at or datetime.utcnow()
+    rows = {
+        detail["question_id"]: {
+            "user_id": user_id,
+            "question_id": detail["question_id"],
+            "exam_record_id": exam_record_id,
+            "wrong_count": 1,
+            "last_wrong_date": wrong_at,
+            "my_answer": detail["user_answer"] or "",
+            "mastered": False,
+            "mastered_at": None,
+            "ease_factor": DEFAULT_EASE,
+            "interval_days": 0,
+            "repetitions": 0,
+            "due_at": wrong_at,
+            "created_at": wrong_at,
+        }
+        for detail in answer_details
+        if not detail["is_correct"]
+    }
+    if not rows:
+        return 0
+
+    insert = dialect_insert(db)
+    stmt = insert(WrongQuestion).values(list(rows.values()))
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[WrongQuestion.user_id, WrongQuestion.question_id],
+        set_={
+            "wrong_count": WrongQuestion.wrong_count + 1,
+            "last_wrong_date": stmt.excluded.last_wrong_date,
+            "my_answer": stmt.excluded.my_answer,
+            "exam_record_id": stmt.excluded.exam_record_id,
+            "mastered": False,
+            "mastered_at": None,
+            "interval_days": 0,
+            "repetitions": 0,
+            "due_at": stmt.excluded.due_at,
+        }
+    )
+    db.execute(stmt)
+    return len(rows)
+
+
+# ========== 间隔复习（SM-2） ==========
+
+def sm2_schedule(ease: Optional[float], interval: Optional[int], repetitions: Optional[int], quality: int) -> Tuple[float, int, int]:
+    """
+    SM-2 计算下一次复习 → (难易系数, 间隔天数, 连续答对次数)
+
+    - quality 0-5：<3 视为没记住，从头开始（间隔1天，难易系数不变）
+    - 答对时间隔依次为 1天、6天、上次间隔×难易系数
+    """
+    ease = ease or DEFAULT_EASE
+    interval = interval or 0
+    repetitions = repetitions or 0
+
+    if quality < 3:
+        return ease, 1, 0
+
+    repetitions += 1
+    if repetitions == 1:
+        interval = 1
+    elif repetitions == 2:
+        interval = 6
+    else:
+        interval = max(1, round(interval * ease))
+    ease = max(MIN_EASE, ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+    return ease, interval, repetitions
+
+
+def encode_review_cursor(wrong_question: WrongQuestion) -> str:
+    return f"{wrong_question.due_at.isoformat()}_{wrong_question.id}"
+
+
+def decode_review_cursor(cursor: str) -> Tuple[datetime, int]:
+    due_at, _, wrong_question_id = cursor.rpartition("_")
+    try:
+        return datetime.fromisoformat(due_at), int(wrong_question_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="分页游标无效"
+        )
+
+
+def get_due_reviews(
+    db: Session,
+    user_id: int,
+    cursor: Optional[str] = None,
+    limit: int = REVIEW_PAGE_SIZE,
+    now: Optional[datetime] = None
+) -> Tuple[List[WrongQuestion], Optional[str]]:
+    """
+    获取到期待复习的错题（按 due_at 从早到晚），返回 (本页错题, 下一页游标)
+
+    按 (due_at, id) 游标分页，每页在 (user_id, due_at, id) 索引上定位后顺序读取，
+    不统计也不加载全部错题
+    """
+    now = now or datetime.utcnow()
+    query = db.query(WrongQuestion).options(
+        joinedload(WrongQuestion.question).joinedload(Question.course)
+    ).filter(
+        WrongQuestion.user_id == user_id,
+        WrongQuestion.due_at <= now
+    )
+    if cursor:
+        due_at, wrong_question_id = decode_review_cursor(cursor)
+        query = query.filter(or_(
+            WrongQuestion.due_at > due_at,
+            and_(WrongQuestion.due_at == due_at, WrongQuestion.id > wrong_question_id)
+        ))
+
+    items = query.order_by(WrongQuestion.due_at, WrongQuestion.id).limit(limit + 1).all()
+    next_cursor = encode_review_cursor(items[limit - 1]) if len(items) > limit else None
+    return items[:limit], next_cursor
+
+
+def apply_reviews(
+    db: Session,
+    user_id: int,
+    reviews: List[Tuple[int, int]],
+    reviewed_at: Optional[datetime] = None
+) -> Dict[str, Any]:
+    """
+    批量提交一次复习的评分（reviews 为 [(错题ID, 评分0-5), ...]）
+
+    - 一次查询加载本次复习的错题，内存中计算排期，一条按主键的批量 UPDATE 写回
+    - 间隔达到 MASTERED_INTERVAL_DAYS 的错题标记为已掌握并移出复习队列
+    - 同一错题重复评分时以最后一次为准；不属于当前用户的错题忽略
+    """
+    reviewed_at = reviewed_at or datetime.utcnow()
+    qualities = dict(reviews)
+    rows = db.query(
+        WrongQuestion.id, WrongQuestion.ease_factor, WrongQuestion.interval_days, WrongQuestion.repetitions
+    ).filter(
+        WrongQuestion.user_id == user_id,
+        WrongQuestion.id.in_(qualities)
+    ).all()
+    if not rows:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="错题记录不存在"
+        )
+
+    updates = []
+    mastered = 0
+    for wrong_question_id, ease, interval, repetitions in rows:
+        ease, interval, repetitions = sm2_schedule(ease, interval, repetitions, qualities[wrong_question_id])
+        is_mastered = interval >= MASTERED_INTERVAL_DAYS
+        mastered += is_mastered
+        updates.append({
+            "id": wrong_question_id,
+            "ease_factor": ease,
+            "interval_days": interval,
+            "repetitions": repetitions,
+            "last_reviewed_at": reviewed_at,
+            "due_at": None if is_mastered else reviewed_at + timedelta(days=interval),
+            "mastered": is_mastered,
+            "mastered_at": reviewed_at if is_mastered else None,
+        })
+
+    db.execute(update(WrongQuestion), updates)
+    db.commit()
+    return {
+        "reviewed": len(updates),
+        "mastered": mastered,
+        "skipped": len(qualities) - len(updates),
+    }
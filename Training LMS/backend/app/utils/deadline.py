@@ -0,0 +1,187 @@
+"""
+截止时间调度工具
+
+按截止时间维护一个最小堆，后台线程只在最近的截止时间到达时醒来，
+把已到期的键分批交给处理函数，不需要每次轮询扫描整张表：
+- 启动时（以及每隔 resync_seconds）通过 loader 从数据库重建，兜底其他进程创建的任务
+- 取消采用惰性删除：只从索引中移除，出堆时跳过
+- 处理失败的键延后 retry_seconds 重新调度
+"""
+import heapq
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+
+def to_timestamp(moment: datetime) -> float:
+    """时间转为时间戳（无时区的时间按UTC处理，与 datetime.utcnow() 一致）"""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+class DeadlineScheduler:
+    """截止时间最小堆 + 后台批处理线程"""
+
+    def __init__(
+        self,
+        handler: Callable[[List[Hashable]], None],
+        loader: Callable[[], Iterable[Tuple[Hashable, datetime]]],
+        batch_size: int = 200,
+        resync_seconds: float = 300.0,
+        retry_seconds: float = 30.0,
+        name: str = "deadline-scheduler"
+    ):
+        """
+        - handler: 批处理函数，参数为已到期的键列表
+        - loader: 重建函数，返回 [(键, 截止时间), ...]
+        """
+        self.handler = handler
+        self.loader = loader
+        self.batch_size = batch_size
+        self.resync_seconds = resync_seconds
+        self.retry_seconds = retry_seconds
+        self.name = name
+
+        self._heap: List[Tuple[float, Hashable]] = []
+        self._deadlines: Dict[Hashable, float] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._synced_at = 0.0
+
+        self.processed = 0
+        self.batches = 0
+        self.errors = 0
+        self.last_batch_ms = 0.0
+
+    # ---------- 调度 ----------
+
+    def schedule(self, key: Hashable, deadline: datetime) -> None:
+        """添加或更新截止时间"""
+        self._push(key, to_timestamp(deadline))
+
+    def cancel(self, key: Hashable) -> None:
+        """取消（惰性删除）"""
+        with self._lock:
+            self._deadlines.pop(key, None)
+
+    def _push(self, key: Hashable, ts: float) -> None:
+        with self._lock:
+            earliest = self._heap[0][0] if self._heap else None
+            self._deadlines[key] = ts
+            heapq.heappush(self._heap, (ts, key))
+        if earliest is None or ts < earliest:
+            self._wakeup.set()  # 比当前最早的截止时间更早，唤醒线程重新计算等待时间
+
+    def reload(self) -> int:
+        """从数据源重建堆，返回调度的数量"""
+        entries = [(to_timestamp(deadline), key) for key, deadline in self.loader()]
+        heapq.heapify(entries)
+        with self._lock:
+            self._heap = entries
+            self._deadlines = {key: ts for ts, key in entries}
+            self._synced_at = time.monotonic()
+        self._wakeup.set()
+        return len(entries)
+
+    def pop_due(self, now: Optional[float] = None) -> List[Hashable]:
+        """取出已到期的键（最多 batch_size 个）"""
+        now = time.time() if now is None else now
+        due = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now and len(due) < self.batch_size:
+                ts, key = heapq.heappop(self._heap)
+                if self._deadlines.get(key) == ts:
+                    del self._deadlines[key]
+                    due.append(key)
+        return due
+
+    def run_due(self, now: Optional[float] = None) -> int:
+        """处理一批已到期的键，返回处理数量"""
+        due = self.pop_due(now)
+        if not due:
+            return 0
+
+        start = time.perf_counter()
+        try:
+            self.handler(due)
+        except Exception as e:
+            self.errors += 1
+            print(f"[{self.name}] 处理失败，{self.retry_seconds}秒后重试: {e}")
+            retry_at = time.time() + self.retry_seconds
+            for key in due:
+                self._push(key, retry_at)
+            return 0
+
+        self.last_batch_ms = (time.perf_counter() - start) * 1000
+        self.processed += len(due)
+        self.batches += 1
+        return len(due)
+
+    # ---------- 后台线程 ----------
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """重建并启动后台线程（重复调用无副作用）"""
+        if self.running:
+            return
+        self.reload()
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _seconds_until_next(self) -> float:
+        with self._lock:
+            next_due = self._heap[0][0] - time.time() if self._heap else self.resync_seconds
+        until_resync = self._synced_at + self.resync_seconds - time.monotonic()
+        return max(0.0, min(next_due, until_resync))
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wakeup.wait(self._seconds_until_next())
+            self._wakeup.clear()
+            if self._stopping.is_set():
+                break
+            try:
+                if time.monotonic() - self._synced_at >= self.resync_seconds:
+                    self.reload()
+                # 积压较多时连续处理，直到没有到期的键
+                while self.run_due() and not self._stopping.is_set():
+                    pass
+            except Exception as e:
+                self.errors += 1
+                print(f"[{self.name}] 调度异常: {e}")
+                self._stopping.wait(self.retry_seconds)
+
+    # ---------- 指标 ----------
+
+    def stats(self) -> Dict[str, Any]:
+        """调度积压统计"""
+        now = time.time()
+        with self._lock:
+            scheduled = len(self._deadlines)
+            overdue = sum(1 for ts in self._deadlines.values() if ts <= now)
+            next_due = min(self._deadlines.values()) if self._deadlines else None
+        return {
+            "running": self.running,
+            "scheduled": scheduled,
+            "overdue": overdue,
+            "next_due_in_seconds": round(next_due - now, 1) if next_due is not None else None,
+            "processed": self.processed,
+            "batches": self.batches,
+            "errors": self.errors,
+            "last_batch_ms": round(self.last_batch_ms, 3),
+        }
@@ -0,0 +1,124 @@
+"""
+MinHash 近似重复检测工具
+
+- 文本归一化（全角转半角、小写、去掉标点和空白）后按字符 k-gram 切片，中文无需分词
+- 单次哈希 MinHash：每个切片只计算一次 crc32，高位决定分桶、低位作为桶内取最小的值；
+  空桶向右借用最近的非空桶（旋转致密化），签名长度固定为 NUM_HASHES
+- LSH 分段：签名切为 BANDS 段，任意一段完全相同的两条文本成为候选对，
+  再用签名估计的 Jaccard 相似度确认，避免 O(n²) 两两比较
+
+签名只依赖 crc32，跨进程稳定，分段桶键可以落库做索引查询
+"""
+import unicodedata
+import zlib
+from array import array
+from collections import defaultdict
+from typing import Dict, Iterable, List, Set, Tuple
+
+NUM_HASHES = 64
+BANDS = 16
+ROWS = NUM_HASHES // BANDS
+SHINGLE_SIZE = 3
+
+_BIN_BITS = 6                      # 2^6 = NUM_HASHES 个桶
+_VALUE_BITS = 32 - _BIN_BITS
+_VALUE_MASK = (1 << _VALUE_BITS) - 1
+_EMPTY = 0xFFFFFFFF
+_MIX = 0x9E3779B1                  # 乘法散列，打散 crc32 的高位
+
+
+def normalize_text(text: str) -> str:
+    """归一化：NFKC（全角转半角）、小写、去掉标点/空白/控制字符"""
+    text = unicodedata.normalize("NFKC", text or "").lower()
+    return "".join(ch for ch in text if unicodedata.category(ch)[0] not in "PZC")
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[str]:
+    """字符 k-gram 集合（文本短于 k 时整段作为一个切片）"""
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def signature(text: str, normalized: bool = False) -> array:
+    """文本的 MinHash 签名（normalized=False 时先归一化），空文本返回全空签名"""
+    mins = [_EMPTY] * NUM_HASHES
+    for shingle in shingles(text if normalized else normalize_text(text)):
+        h = (zlib.crc32(shingle.encode("utf-8")) * _MIX) & 0xFFFFFFFF
+        b = h >> _VALUE_BITS
+        v = h & _VALUE_MASK
+        if v < mins[b]:
+            mins[b] = v
+
+    original = list(mins)
+    if _EMPTY in original and any(v != _EMPTY for v in original):
+        # 旋转致密化：空桶取右侧最近的非空桶，加上距离偏移以区分
+        for i in range(NUM_HASHES):
+            if original[i] != _EMPTY:
+                continue
+            distance = 1
+            while original[(i + distance) % NUM_HASHES] == _EMPTY:
+                distance += 1
+            mins[i] = original[(i + distance) % NUM_HASHES] + (distance << _VALUE_BITS)
+    return array("I", mins)
+
+
+def similarity(a: array, b: array) -> float:
+    """签名估计的 Jaccard 相似度"""
+    return sum(1 for x, y in zip(a, b) if x == y) / NUM_HASHES
+
+
+def band_keys(sig: array) -> List[int]:
+    """LSH 分段桶键（含段号，不同段的桶键互不冲突）"""
+    return [
+        zlib.crc32(bytes([band]) + sig[band * ROWS:(band + 1) * ROWS].tobytes())
+        for band in range(BANDS)
+    ]
+
+
+def find_clusters(signatures: Dict[int, array], threshold: float) -> List[List[int]]:
+    """
+    找出近似重复的簇（每簇按ID升序，簇按首个ID排序）
+
+    逐段构建桶，同桶的文本验证相似度后用并查集合并；每次只保留一段的桶
+    """
+    parent: Dict[int, int] = {}
+
+    def find(x: int) -> int:
+        root = x
+        while parent.get(root, root) != root:
+            root = parent[root]
+        while x != root:
+            parent[x], x = root, parent.get(x, x)
+        return root
+
+    for band in range(BANDS):
+        buckets: Dict[bytes, List[int]] = defaultdict(list)
+        for item_id, sig in signatures.items():
+            buckets[sig[band * ROWS:(band + 1) * ROWS].tobytes()].append(item_id)
+
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            for i, a in enumerate(members):
+                for b in members[i + 1:]:
+                    root_a, root_b = find(a), find(b)
+                    if root_a != root_b and similarity(signatures[a], signatures[b]) >= threshold:
+                        parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    clusters: Dict[int, List[int]] = defaultdict(list)
+    for item_id in set(parent) | set(parent.values()):
+        clusters[find(item_id)].append(item_id)
+    return sorted((sorted(members) for members in clusters.values() if len(members) > 1), key=lambda c: c[0])
+
+
+def match_similar(
+    sig: array, candidates: Iterable[Tuple[int, array]], threshold: float
+) -> List[Tuple[int, float]]:
+    """候选项中相似度达到阈值的 [(ID, 相似度), ...]，按相似度从高到低"""
+    matches = []
+    for item_id, other in candidates:
+        score = similarity(sig, other)
+        if score >= threshold:
+            matches.append((item_id, score))
+    return sorted(matches, key=lambda m: -m[1])
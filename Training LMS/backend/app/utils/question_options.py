@@ -0,0 +1,126 @@
+"""
+题目选项格式工具
+
+标准格式（写入时统一，读取时原样返回）：
+    [{"label": "A", "content": "选项内容", "is_correct": true}, ...]
+
+兼容的历史格式（写入/迁移时转换，未迁移的旧数据读取时由 read_options 转换）：
+    {"A": "选项内容", "B": "..."}                      字典格式，正确答案取自 correct_answer
+    [{"label": "A", "text": "选项内容", ...}, ...]     使用 text 字段名
+"""
+from typing import Any, Dict, List, Optional
+
+OPTION_KEYS = ("label", "content", "is_correct")
+
+
+def _answer_labels(correct_answer: Optional[str]) -> set:
+    """correct_answer 中的选项标签（"A,C" → {"A", "C"}）"""
+    return {label.strip() for label in (correct_answer or "").split(",") if label.strip()}
+
+
+def normalize_options(options: Any, correct_answer: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+    """
+    把选项转换为标准格式
+
+    - 字典格式转为列表，is_correct 按 correct_answer 标记
+    - text 字段改名为 content，多余字段丢弃
+    - 格式无法识别时抛出 ValueError
+    """
+    if options is None:
+        return None
+
+    if isinstance(options, dict):
+        labels = _answer_labels(correct_answer)
+        options = [
+            {"label": key, "content": value, "is_correct": key in labels}
+            for key, value in options.items()
+        ]
+    elif not isinstance(options, list):
+        raise ValueError("选项必须是列表格式")
+
+    normalized = []
+    seen = set()
+    for index, option in enumerate(options, 1):
+        if not isinstance(option, dict):
+            raise ValueError(f"第{index}个选项不是字典格式")
+
+        label = str(option.get("label") or "").strip()
+        if not label:
+            raise ValueError(f"第{index}个选项缺少label字段")
+        if label in seen:
+            raise ValueError(f"选项标签 {label} 重复")
+        seen.add(label)
+
+        content = option.get("content", option.get("text"))
+        if content is None:
+            raise ValueError(f"第{index}个选项缺少content字段")
+
+        normalized.append({
+            "label": label,
+            "content": str(content),
+            "is_correct": bool(option.get("is_correct", False)),
+        })
+
+    return normalized
+
+
+def flag_correct_options(options: Any, correct_answer: Optional[str]) -> bool:
+    """
+    按 correct_answer 标记标准格式选项的 is_correct（就地修改），返回是否有修改
+
+    correct_answer 为空或不全是选项标签（判断题的 true/false、简答题答案）时不修改
+    """
+    if not options or not is_canonical(options):
+        return False
+    labels = _answer_labels(correct_answer)
+    if not labels or not labels <= {option["label"] for option in options}:
+        return False
+
+    changed = False
+    for option in options:
+        is_correct = option["label"] in labels
+        if option["is_correct"] != is_correct:
+            option["is_correct"] = is_correct
+            changed = True
+    return changed
+
+
+def read_options(options: Any, correct_answer: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+    """
+    读取选项（判分、出卷等读路径使用，不抛异常）
+
+    - 标准格式原样返回
+    - 未迁移的历史格式按 normalize_options 转换，is_correct 按 correct_answer 标记
+    - 无法识别的格式只保留带 label 的选项（缺少的字段取默认值）
+    """
+    if is_canonical(options):
+        return options
+    try:
+        normalized = normalize_options(options, correct_answer)
+    except ValueError:
+        normalized = [
+            {
+                "label": str(option["label"]),
+                "content": str(option.get("content", option.get("text")) or ""),
+                "is_correct": bool(option.get("is_correct", False)),
+            }
+            for option in (options if isinstance(options, list) else [])
+            if isinstance(option, dict) and option.get("label")
+        ]
+    flag_correct_options(normalized, correct_answer)
+    return normalized
+
+
+def is_canonical(options: Any) -> bool:
+    """选项是否已是标准格式"""
+    return options is None or (
+        isinstance(options, list)
+        and all(
+            isinstance(option, dict)
+            and tuple(option) == OPTION_KEYS
+            and isinstance(option["label"], str)
+            and isinstance(option["content"], str)
+            and isinstance(option["is_correct"], bool)
+            for option in options
+        )
+    )
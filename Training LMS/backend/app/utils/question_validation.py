@@ -0,0 +1,67 @@
+"""
+题目数据校验规则
+
+scripts/validate_question_data.py（检查已入库题目）和题目导入共用，
+返回 (错误列表, 警告列表)：错误的题目不能入库，警告只提示
+"""
+from typing import Any, List, Optional, Tuple
+
+CHOICE_TYPES = ("single_choice", "multiple_choice")
+
+
+def validate_question(content: Optional[str], question_type: str, options: Any) -> Tuple[List[str], List[str]]:
+    """校验单道题目（options 为解析后的JSON）"""
+    errors: List[str] = []
+    warnings: List[str] = []
+
+    # 检查1：题目内容不能为空
+    if not content or len(content.strip()) == 0:
+        errors.append("题目内容为空")
+
+    # 检查2：选择题和多选题必须有选项
+    if question_type in CHOICE_TYPES:
+        if not options:
+            errors.append(f"{question_type}类型题目缺少选项")
+            return errors, warnings
+
+        # 检查2.1：选项必须是列表
+        if not isinstance(options, list):
+            errors.append("选项不是列表格式（运行 scripts/normalize_question_options.py --apply 迁移）")
+            return errors, warnings
+
+        # 检查2.2：选项数量至少2个
+        if len(options) < 2:
+            errors.append("选项少于2个")
+
+        # 检查2.3：每个选项必须是字典
+        for i, opt in enumerate(options):
+            if not isinstance(opt, dict):
+                errors.append(f"第{i+1}个选项不是字典格式")
+                continue
+
+            # 检查2.4：必须有label字段
+            if 'label' not in opt:
+                errors.append(f"第{i+1}个选项缺少label字段")
+
+            # 检查2.5：必须有content字段（旧数据的text字段需运行 normalize_question_options.py 迁移）
+            if 'content' not in opt:
+                if 'text' in opt:
+                    errors.append(f"第{i+1}个选项使用了旧字段名'text'，应该是'content'（运行 scripts/normalize_question_options.py --apply 迁移）")
+                else:
+                    errors.append(f"第{i+1}个选项缺少content字段")
+
+            # 检查2.6：必须有is_correct字段
+            if 'is_correct' not in opt:
+                warnings.append(f"第{i+1}个选项缺少is_correct字段")
+
+        # 检查2.7：至少有一个正确答案
+        correct_count = sum(1 for opt in options if isinstance(opt, dict) and opt.get('is_correct', False))
+        if correct_count == 0:
+            warnings.append("没有标记正确答案")
+
+    # 检查3：判断题不应该有选项（允许null）
+    elif question_type == 'true_false':
+        if options:
+            warnings.append("判断题不应该有选项数据")
+
+    return errors, warnings
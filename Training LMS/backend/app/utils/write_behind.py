@@ -0,0 +1,169 @@
+"""
+写缓冲（write-behind）工具
+
+高频的小写入先在内存中按键合并，由后台线程按时间间隔或数量阈值批量落库：
+- 同一个键的多次补丁合并为一次写入（默认后写覆盖先写，可传入 merge_fn 自定义合并，如累加计数）
+- 落库失败时补丁放回缓冲区，下次重试
+- 缓冲区只在当前进程内有效，进程异常退出最多丢失一个刷新间隔内的数据
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional
+
+
+def _overwrite(older: Dict[str, Any], newer: Dict[str, Any]) -> Dict[str, Any]:
+    return {**older, **newer}
+
+
+class WriteBehindBuffer:
+    """按键合并补丁、批量刷新的写缓冲"""
+
+    def __init__(
+        self,
+        flush_fn: Callable[[Dict[Hashable, Dict[str, Any]]], None],
+        interval_seconds: float = 2.0,
+        max_items: int = 500,
+        name: str = "write-behind",
+        merge_fn: Optional[Callable[[Dict[str, Any], Dict[str, Any]], Dict[str, Any]]] = None
+    ):
+        """
+        - flush_fn: 批量落库函数，参数为 {键: 合并后的补丁}
+        - interval_seconds: 定时刷新间隔
+        - max_items: 缓冲的补丁字段数达到该值时立即刷新
+        - merge_fn: 合并同键的 (先写, 后写) 补丁，返回新补丁；默认按字段后写覆盖先写
+        """
+        self.flush_fn = flush_fn
+        self.merge_fn = merge_fn or _overwrite
+        self.interval_seconds = interval_seconds
+        self.max_items = max_items
+        self.name = name
+
+        self._pending: Dict[Hashable, Dict[str, Any]] = {}
+        self._depth = 0  # 缓冲中的补丁字段总数
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # 保证同一时刻只有一次落库
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.flushes = 0
+        self.flushed_items = 0
+        self.errors = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+        self._total_flush_ms = 0.0
+
+    # ---------- 写入 ----------
+
+    def put(self, key: Hashable, patch: Dict[str, Any]) -> None:
+        """写入补丁（与同键未落库的补丁合并）"""
+        with self._lock:
+            pending = self._pending.get(key)
+            merged = self.merge_fn(pending, patch) if pending else dict(patch)
+            self._depth += len(merged) - len(pending or {})
+            self._pending[key] = merged
+            full = self._depth >= self.max_items
+
+        if full:
+            if self.running:
+                self._wakeup.set()
+            else:
+                self.flush()
+
+    def _take(self, keys: Optional[Iterable[Hashable]]) -> Dict[Hashable, Dict[str, Any]]:
+        with self._lock:
+            if keys is None:
+                batch, self._pending = self._pending, {}
+            else:
+                batch = {key: self._pending.pop(key) for key in keys if key in self._pending}
+            self._depth -= sum(len(patch) for patch in batch.values())
+            return batch
+
+    def _restore(self, batch: Dict[Hashable, Dict[str, Any]]) -> None:
+        """落库失败时放回缓冲区（期间新写入的补丁优先）"""
+        with self._lock:
+            for key, patch in batch.items():
+                newer = self._pending.get(key)
+                merged = self.merge_fn(patch, newer) if newer else patch
+                self._depth += len(merged) - len(newer or {})
+                self._pending[key] = merged
+
+    # ---------- 刷新 ----------
+
+    def flush(self, keys: Optional[Iterable[Hashable]] = None) -> int:
+        """
+        立即落库（keys 为空时刷新全部），返回落库的键数量
+
+        会等待正在进行的后台刷新完成，返回时这些键之前写入的补丁都已落库
+        """
+        with self._flush_lock:
+            batch = self._take(keys)
+            if not batch:
+                return 0
+
+            start = time.perf_counter()
+            try:
+                self.flush_fn(batch)
+            except Exception:
+                self.errors += 1
+                self._restore(batch)
+                raise
+
+            elapsed = (time.perf_counter() - start) * 1000
+            self.flushes += 1
+            self.flushed_items += len(batch)
+            self.last_flush_ms = elapsed
+            self.max_flush_ms = max(self.max_flush_ms, elapsed)
+            self._total_flush_ms += elapsed
+            return len(batch)
+
+    # ---------- 后台线程 ----------
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """启动后台刷新线程（重复调用无副作用）"""
+        if self.running:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """停止后台线程并刷新剩余数据"""
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wakeup.wait(self.interval_seconds)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"[{self.name}] 落库失败，稍后重试: {e}")
+
+    # ---------- 指标 ----------
+
+    def stats(self) -> Dict[str, Any]:
+        """缓冲区深度与刷新耗时统计"""
+        with self._lock:
+            pending_keys = len(self._pending)
+            depth = self._depth
+        return {
+            "running": self.running,
+            "pending_keys": pending_keys,
+            "depth": depth,
+            "flushes": self.flushes,
+            "flushed_items": self.flushed_items,
+            "errors": self.errors,
+            "last_flush_ms": round(self.last_flush_ms, 3),
+            "max_flush_ms": round(self.max_flush_ms, 3),
+            "avg_flush_ms": round(self._total_flush_ms / self.flushes, 3) if self.flushes else 0.0,
+        }
@@ -8,17 +8,19 @@ from contextlib import asynccontextmanager
 import os
 
 from app.core.config import settings
-from app.core.database import engine, Base
+from app.core.database import engine, Base, SessionLocal, upgrade_schema
 from app.routers import auth, course, exam, learning, user, stats, feature
+from app.services import exam_service, learning_service, regrade_service
 
 
 # 导入所有模型（确保创建表）
 from app.models import (
     User, Region, Store, Position,
     Course, Chapter, Content,
-    Exam, Question,
-    CourseProgress, ChapterProgress, ExamRecord, DailyQuizRecord, ValueAssessment,
-    Notification, Note, WrongQuestion, Certificate
+    Exam, Question, ExamQuestion,
+    CourseProgress, ChapterProgress, ContentProgress, LearningSummary, ExamRecord, ExamRecordQuestion, DailyQuizRecord, ValueAssessment,
+    Notification, Note, WrongQuestion, Certificate, CertificateSequence,
+    QuestionStats, QuestionOptionStats, QuestionLshBand, RegradeJob
 )
 
 
@@ -29,9 +31,24 @@ async def lifespan(app: FastAPI):
     # 启动时创建表
     print("正在创建数据库表...")
     Base.metadata.create_all(bind=engine)
+    for change in upgrade_schema(engine):
+        print(f"[结构升级] {change}")
+    # 关联表上线前创建的固定考题考试补建 exam_questions（否则开考时试卷为空）
+    with SessionLocal() as db:
+        backfilled = exam_service.backfill_question_links(db)
+    if backfilled:
+        print(f"[结构升级] 已为 {backfilled} 场考试补建固定考题关联")
     print("数据库表创建完成！")
+    exam_service.start_autosave()
+    learning_service.start_heartbeats()
+    exam_service.start_deadline_scheduler()
+    regrade_service.start_workers()
     yield
-    # 关闭时清理（如果需要）
+    # 关闭时停止自动交卷和重新判分（未完成的任务下次启动继续），并落库缓冲中的自动保存答案和观看心跳
+    regrade_service.stop_workers()
+    exam_service.stop_deadline_scheduler()
+    exam_service.stop_autosave()
+    learning_service.stop_heartbeats()
 
 
 # 创建FastAPI应用
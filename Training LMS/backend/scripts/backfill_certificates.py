@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+补发证书（可重复执行）
+
+为历史上已通过期末考试/试用期考核、但还没有对应课程证书的考试记录补发证书：
+- 按考试记录ID分批读取，每批先预留编号，再一条INSERT批量写入
+- 同一用户同一课程只发一张（取最早通过的记录），已有证书的跳过
+- 发证时间取交卷时间
+
+运行方式:
+cd backend
+python3 scripts/backfill_certificates.py                  # 预览
+python3 scripts/backfill_certificates.py --apply          # 执行
+python3 scripts/backfill_certificates.py --apply --batch-size 1000
+"""
+
+import sys
+import os
+import argparse
+from datetime import datetime
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import exists
+from app.core.database import SessionLocal
+from app import models  # noqa: F401  确保所有模型已注册
+from app.models.certificate import Certificate
+from app.models.course import Course
+from app.models.exam import Exam
+from app.models.learning import ExamRecord, ExamStatus
+from app.services import certificate_service
+
+
+def main():
+    parser = argparse.ArgumentParser(description="补发证书")
+    parser.add_argument("--apply", action="store_true", help="执行补发（默认只预览）")
+    parser.add_argument("--batch-size", type=int, default=500, help="每批处理的考试记录数")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("SmartIce LMS - 补发证书")
+    print("=" * 60)
+
+    db = SessionLocal()
+    scanned = 0
+    issued = 0
+    last_id = 0
+    seen = set()
+
+    try:
+        while True:
+            rows = db.query(ExamRecord, Exam, Course.title).join(
+                Exam, Exam.id == ExamRecord.exam_id
+            ).join(
+                Course, Course.id == Exam.course_id
+            ).filter(
+                ExamRecord.id > last_id,
+                ExamRecord.status == ExamStatus.PASSED,
+                Exam.exam_type.in_(certificate_service.CERTIFIED_EXAM_TYPES),
+                ~exists().where(
+                    Certificate.user_id == ExamRecord.user_id,
+                    Certificate.course_id == Exam.course_id
+                )
+            ).order_by(ExamRecord.id).limit(args.batch_size).all()
+            if not rows:
+                break
+
+            # 同一用户同一课程只保留最早通过的记录
+            pending = {}
+            for record, exam, course_title in rows:
+                key = (record.user_id, exam.course_id)
+                if key not in seen:
+                    seen.add(key)
+                    pending[key] = (record, exam, course_title)
+
+            if args.apply:
+                certificate_service.reserve_numbers(len(pending))
+                certificate_service.insert_certificates(db, [
+                    certificate_service.build_certificate_row(
+                        exam, record, course_title, record.submitted_at or record.created_at or datetime.utcnow()
+                    )
+                    for record, exam, course_title in pending.values()
+                ])
+                db.commit()
+
+            scanned += len(rows)
+            issued += len(pending)
+            last_id = rows[-1][0].id
+            print(f"  已扫描 {scanned} 条通过记录，{'已补发' if args.apply else '待补发'} {issued} 张证书")
+    finally:
+        db.close()
+
+    print()
+    if not args.apply:
+        print(f"⚠️ 预览模式：{issued} 张证书待补发，加 --apply 执行")
+    else:
+        print(f"✅ 已补发 {issued} 张证书")
+
+
+if __name__ == "__main__":
+    main()
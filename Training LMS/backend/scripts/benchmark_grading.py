@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+判分性能基准测试：逐题查询 vs 批量判分引擎
+
+统计每次交卷的数据库往返次数和判分耗时（10/30/100题）
+
+运行方式:
+cd backend
+python3 scripts/benchmark_grading.py
+python3 scripts/benchmark_grading.py --rounds 500 --latency-ms 0.5   # 模拟每次往返0.5ms网络延迟
+"""
+
+import sys
+import os
+import time
+import random
+import argparse
+import statistics
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app import models  # noqa: F401  确保所有模型已注册
+from app.models.exam import Question, QuestionType, QuestionCategory
+from app.schemas.exam import AnswerSubmit
+from app.services.grading_service import grade_answer_sheet, check_answer
+
+
+QUESTION_SIZES = [10, 30, 100]
+
+
+def create_bench_session(latency_ms: float):
+    """创建内存数据库，并统计每次SQL往返"""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+
+    counter = {"round_trips": 0}
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count_round_trip(conn, cursor, statement, parameters, context, executemany):
+        counter["round_trips"] += 1
+        if latency_ms:
+            time.sleep(latency_ms / 1000)
+
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)(), counter
+
+
+def seed_questions(db, count: int):
+    """生成混合题型的题目"""
+    questions = []
+    for i in range(count):
+        kind = i % 3
+        if kind == 0:
+            question = Question(
+                content=f"单选题 {i}",
+                question_type=QuestionType.SINGLE_CHOICE,
+                category=QuestionCategory.SKILL,
+                options=[
+                    {"label": label, "content": f"选项{label}", "is_correct": label == "B"}
+                    for label in "ABCD"
+                ],
+            )
+        elif kind == 1:
+            question = Question(
+                content=f"多选题 {i}",
+                question_type=QuestionType.MULTIPLE_CHOICE,
+                category=QuestionCategory.SKILL,
+                options=[
+                    {"label": label, "content": f"选项{label}", "is_correct": label in "AC"}
+                    for label in "ABCD"
+                ],
+            )
+        else:
+            question = Question(
+                content=f"判断题 {i}",
+                question_type=QuestionType.TRUE_FALSE,
+                category=QuestionCategory.VALUE_CUSTOMER,
+                correct_answer="true",
+            )
+        questions.append(question)
+
+    db.add_all(questions)
+    db.commit()
+    return questions
+
+
+def build_answer_sheet(questions):
+    """随机作答（约一半正确）"""
+    answers = []
+    for q in questions:
+        if q.question_type == QuestionType.SINGLE_CHOICE:
+            user_answer = random.choice(["A", "B"])
+        elif q.question_type == QuestionType.MULTIPLE_CHOICE:
+            user_answer = random.choice(["A,C", "C,A", "A,B"])
+        else:
+            user_answer = random.choice(["true", "false"])
+        answers.append(AnswerSubmit(question_id=q.id, user_answer=user_answer))
+    return answers
+
+
+def grade_one_by_one(db, answers):
+    """旧实现：每道题单独查询一次"""
+    correct_count = 0
+    for answer in answers:
+        question = db.query(Question).filter(Question.id == answer.question_id).first()
+        if question and check_answer(question, answer.user_answer):
+            correct_count += 1
+    return correct_count
+
+
+def grade_batched(db, answers):
+    """新实现：一次批量加载，内存判分"""
+    correct_count, _ = grade_answer_sheet(db, answers)
+    return correct_count
+
+
+def run_case(db, counter, answers, grader, rounds: int):
+    """执行多轮判分，返回 (每次往返数, 耗时列表ms, 正确题数)"""
+    latencies = []
+    round_trips = 0
+    correct = None
+    for _ in range(rounds):
+        db.expire_all()  # 清空身份映射，模拟每个请求都是新会话
+        counter["round_trips"] = 0
+        start = time.perf_counter()
+        correct = grader(db, answers)
+        latencies.append((time.perf_counter() - start) * 1000)
+        round_trips = counter["round_trips"]
+        db.rollback()
+    return round_trips, latencies, correct
+
+
+def percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="判分引擎性能基准测试")
+    parser.add_argument("--rounds", type=int, default=200, help="每个场景执行轮数")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="模拟每次数据库往返的网络延迟（毫秒）")
+    args = parser.parse_args()
+
+    random.seed(42)
+
+    print("=" * 78)
+    print("SmartIce LMS - 判分性能基准测试")
+    print(f"轮数: {args.rounds}  模拟往返延迟: {args.latency_ms}ms")
+    print("=" * 78)
+    print(f"{'题数':>6} {'实现':<10} {'往返次数':>8} {'平均(ms)':>10} {'p50(ms)':>10} {'p99(ms)':>10}")
+    print("-" * 78)
+
+    for size in QUESTION_SIZES:
+        db, counter = create_bench_session(args.latency_ms)
+        try:
+            questions = seed_questions(db, size)
+            answers = build_answer_sheet(questions)
+
+            results = {}
+            for name, grader in [("逐题查询", grade_one_by_one), ("批量判分", grade_batched)]:
+                round_trips, latencies, correct = run_case(db, counter, answers, grader, args.rounds)
+                results[name] = correct
+                print(
+                    f"{size:>6} {name:<10} {round_trips:>8} "
+                    f"{statistics.mean(latencies):>10.3f} "
+                    f"{percentile(latencies, 50):>10.3f} "
+                    f"{percentile(latencies, 99):>10.3f}"
+                )
+
+            # 两种实现判分结果必须一致
+            if len(set(results.values())) != 1:
+                print(f"❌ 判分结果不一致: {results}")
+                sys.exit(1)
+        finally:
+            db.close()
+        print("-" * 78)
+
+    print("✅ 两种实现判分结果一致")
+
+
+if __name__ == "__main__":
+    main()
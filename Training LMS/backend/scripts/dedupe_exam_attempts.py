@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+清理重复的进行中考试记录（可重复执行）
+
+旧版本开考时没有并发保护，重复点击可能为同一用户同一场考试创建多条 IN_PROGRESS 记录，
+导致唯一索引 uq_exam_records_user_exam_in_progress 无法创建。
+本脚本保留每组中最新的一条，其余标记为 NOT_TAKEN（未作答的幽灵记录），然后补建索引。
+
+运行方式:
+cd backend
+python3 scripts/dedupe_exam_attempts.py            # 预览
+python3 scripts/dedupe_exam_attempts.py --apply    # 执行
+"""
+
+import sys
+import os
+import argparse
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import func
+from app.core.database import SessionLocal, engine, upgrade_schema
+from app import models  # noqa: F401  确保所有模型已注册
+from app.models.learning import ExamRecord, ExamStatus
+
+
+def main():
+    parser = argparse.ArgumentParser(description="清理重复的进行中考试记录")
+    parser.add_argument("--apply", action="store_true", help="执行清理（默认只预览）")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("SmartIce LMS - 清理重复的进行中考试记录")
+    print("=" * 60)
+
+    db = SessionLocal()
+    try:
+        groups = db.query(
+            ExamRecord.user_id, ExamRecord.exam_id, func.max(ExamRecord.id)
+        ).filter(
+            ExamRecord.status == ExamStatus.IN_PROGRESS
+        ).group_by(
+            ExamRecord.user_id, ExamRecord.exam_id
+        ).having(func.count(ExamRecord.id) > 1).all()
+
+        if not groups:
+            print("✅ 没有重复的进行中考试记录")
+        else:
+            ghost_count = 0
+            for user_id, exam_id, keep_id in groups:
+                ghosts = db.query(ExamRecord).filter(
+                    ExamRecord.user_id == user_id,
+                    ExamRecord.exam_id == exam_id,
+                    ExamRecord.status == ExamStatus.IN_PROGRESS,
+                    ExamRecord.id != keep_id
+                ).all()
+                ghost_count += len(ghosts)
+                print(f"  用户#{user_id} 考试#{exam_id}: 保留记录#{keep_id}，清理 {[g.id for g in ghosts]}")
+                if args.apply:
+                    for ghost in ghosts:
+                        ghost.status = ExamStatus.NOT_TAKEN
+
+            if not args.apply:
+                print(f"\n⚠️ 预览模式：共 {len(groups)} 组、{ghost_count} 条重复记录，加 --apply 执行清理")
+                return
+
+            db.commit()
+            print(f"\n✅ 已清理 {ghost_count} 条重复记录")
+    finally:
+        db.close()
+
+    for change in upgrade_schema(engine):
+        print(f"  • {change}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+合并重复的学习进度（可重复执行）
+
+旧版本“获取或创建”进度时先查后插，并发请求可能为同一用户同一章节/课程创建多条进度，
+导致唯一索引 uq_chapter_progress_user_chapter、uq_course_progress_user_course 无法创建。
+本脚本把每组合并到ID最小的一条，其余删除，然后补建索引：
+- 章节进度：状态取最靠后的（已完成 > 学习中 > 未开始），开始时间、完成时间取最早，
+  已完成内容数、测验成绩取最大，测验任一通过即通过
+- 课程进度：开始时间、完成时间取最早，最后访问时间取最晚，状态取最靠后的；
+  已完成章节数和进度百分比按合并后的章节进度重新统计
+
+运行方式:
+cd backend
+python3 scripts/dedupe_learning_progress.py            # 预览
+python3 scripts/dedupe_learning_progress.py --apply    # 执行
+"""
+
+import sys
+import os
+import argparse
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import func
+from app.core.database import SessionLocal, engine, upgrade_schema
+from app import models  # noqa: F401  确保所有模型已注册
+from app.models.course import Chapter
+from app.models.learning import ChapterProgress, CourseProgress, LearningStatus
+
+STATUS_ORDER = [LearningStatus.NOT_STARTED, LearningStatus.IN_PROGRESS, LearningStatus.COMPLETED]
+
+
+def latest_status(rows) -> LearningStatus:
+    return max((row.status for row in rows), key=STATUS_ORDER.index)
+
+
+def earliest(values):
+    values = [value for value in values if value is not None]
+    return min(values) if values else None
+
+
+def latest(values):
+    values = [value for value in values if value is not None]
+    return max(values) if values else None
+
+
+def duplicate_groups(db, model, key_column):
+    """重复的 (user_id, key) 分组"""
+    return db.query(model.user_id, key_column).group_by(
+        model.user_id, key_column
+    ).having(func.count(model.id) > 1).all()
+
+
+def merge_chapter_progress(db, apply: bool) -> int:
+    """合并重复的章节进度，返回删除的行数"""
+    removed = 0
+    for user_id, chapter_id in duplicate_groups(db, ChapterProgress, ChapterProgress.chapter_id):
+        rows = db.query(ChapterProgress).filter(
+            ChapterProgress.user_id == user_id,
+            ChapterProgress.chapter_id == chapter_id
+        ).order_by(ChapterProgress.id).all()
+        keep, extra = rows[0], rows[1:]
+        removed += len(extra)
+        print(f"  用户#{user_id} 章节#{chapter_id}: 保留进度#{keep.id}，合并 {[row.id for row in extra]}")
+        if not apply:
+            continue
+
+        keep.status = latest_status(rows)
+        keep.started_at = earliest(row.started_at for row in rows)
+        keep.completed_at = earliest(row.completed_at for row in rows)
+        keep.completed_contents = max(row.completed_contents or 0 for row in rows)
+        keep.quiz_passed = any(row.quiz_passed for row in rows)
+        keep.quiz_score = latest(row.quiz_score for row in rows)
+        for row in extra:
+            db.delete(row)
+    return removed
+
+
+def merge_course_progress(db, apply: bool) -> int:
+    """合并重复的课程进度（在章节进度合并之后执行），返回删除的行数"""
+    removed = 0
+    for user_id, course_id in duplicate_groups(db, CourseProgress, CourseProgress.course_id):
+        rows = db.query(CourseProgress).filter(
+            CourseProgress.user_id == user_id,
+            CourseProgress.course_id == course_id
+        ).order_by(CourseProgress.id).all()
+        keep, extra = rows[0], rows[1:]
+        removed += len(extra)
+        print(f"  用户#{user_id} 课程#{course_id}: 保留进度#{keep.id}，合并 {[row.id for row in extra]}")
+        if not apply:
+            continue
+
+        total_chapters = db.query(func.count(Chapter.id)).filter(Chapter.course_id == course_id).scalar()
+        completed_chapters = db.query(func.count(ChapterProgress.id)).filter(
+            ChapterProgress.user_id == user_id,
+            ChapterProgress.course_id == course_id,
+            ChapterProgress.status == LearningStatus.COMPLETED
+        ).scalar()
+
+        keep.status = latest_status(rows)
+        keep.started_at = earliest(row.started_at for row in rows)
+        keep.completed_at = earliest(row.completed_at for row in rows)
+        keep.last_accessed_at = latest(row.last_accessed_at for row in rows)
+        keep.total_chapters = total_chapters
+        keep.completed_chapters = completed_chapters
+        keep.progress_percentage = completed_chapters / total_chapters * 100 if total_chapters else keep.progress_percentage
+        for row in extra:
+            db.delete(row)
+    return removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="合并重复的学习进度")
+    parser.add_argument("--apply", action="store_true", help="执行合并（默认只预览）")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("SmartIce LMS - 合并重复的学习进度")
+    print("=" * 60)
+
+    db = SessionLocal()
+    try:
+        print("\n📋 章节进度")
+        chapter_removed = merge_chapter_progress(db, args.apply)
+        if args.apply:
+            db.flush()
+        print("\n📋 课程进度")
+        course_removed = merge_course_progress(db, args.apply)
+
+        if not chapter_removed and not course_removed:
+            print("\n✅ 没有重复的学习进度")
+        elif not args.apply:
+            print(f"\n⚠️ 预览模式：{chapter_removed} 条章节进度、{course_removed} 条课程进度待合并，加 --apply 执行")
+            return
+        else:
+            db.commit()
+            print(f"\n✅ 已合并 {chapter_removed} 条章节进度、{course_removed} 条课程进度")
+    finally:
+        db.close()
+
+    for change in upgrade_schema(engine):
+        print(f"  • {change}")
+
+
+if __name__ == "__main__":
+    main()
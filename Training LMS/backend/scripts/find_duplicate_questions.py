@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+题库近似重复检测（MinHash + LSH，可重复执行）
+
+- 按题干 + 选项内容计算 MinHash 签名，分段分桶后只比较同桶题目，并查集聚成重复簇；
+  答案不同的题目（如选项相同、正确选项不同）不会归为一组
+- 默认只报告，近似重复需人工确认后在管理后台处理
+- --deactivate 配合 --apply 时只停用完全重复的题目（内容指纹和答案都与簇内更早的题目相同），
+  保留ID最小的一道（不删除，历史答卷不受影响）
+- --rebuild-index 重建新建题目查重用的桶键表（首次上线或直接写库导入题目后执行）
+
+运行方式:
+cd backend
+python3 scripts/find_duplicate_questions.py                          # 报告重复簇
+python3 scripts/find_duplicate_questions.py --threshold 0.9
+python3 scripts/find_duplicate_questions.py --rebuild-index
+python3 scripts/find_duplicate_questions.py --deactivate --apply
+"""
+
+import sys
+import os
+import time
+import argparse
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import update
+from app.core.database import SessionLocal
+from app import models  # noqa: F401  确保所有模型已注册
+from app.models.exam import Question
+from app.services import question_dedup_service
+
+
+def main():
+    parser = argparse.ArgumentParser(description="题库近似重复检测")
+    parser.add_argument("--threshold", type=float, default=question_dedup_service.DUPLICATE_THRESHOLD, help="相似度阈值（0-1）")
+    parser.add_argument("--rebuild-index", action="store_true", help="重建新建题目查重用的桶键表")
+    parser.add_argument("--deactivate", action="store_true", help="停用完全重复的题目（保留ID最小的一道）")
+    parser.add_argument("--apply", action="store_true", help="执行停用（默认只预览）")
+    parser.add_argument("--show", type=int, default=20, help="显示的重复簇数量")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("SmartIce LMS - 题库近似重复检测")
+    print("=" * 60)
+
+    db = SessionLocal()
+    try:
+        start = time.perf_counter()
+        # 桶键表包含停用的题目（重新启用时无需重建）
+        fingerprints = question_dedup_service.load_fingerprints(db, active_only=False)
+        active_ids = {row.id for row in db.query(Question.id).filter(Question.is_active == True)}
+        signed_at = time.perf_counter()
+
+        clusters = question_dedup_service.cluster_fingerprints(
+            {question_id: fp for question_id, fp in fingerprints.items() if question_id in active_ids},
+            args.threshold
+        )
+        clustered_at = time.perf_counter()
+
+        print(f"  题目 {len(fingerprints)} 道（启用 {len(active_ids)} 道）")
+        print(f"  签名耗时 {signed_at - start:.2f} 秒，聚类耗时 {clustered_at - signed_at:.2f} 秒")
+
+        if args.rebuild_index:
+            question_dedup_service.rebuild_index(db, {question_id: fp.signature for question_id, fp in fingerprints.items()})
+            print(f"✅ 已重建桶键表（{len(fingerprints)} 道题目，耗时 {time.perf_counter() - clustered_at:.2f} 秒）")
+
+        print()
+        if not clusters:
+            print(f"✅ 未发现相似度 ≥ {args.threshold:.0%} 的重复题目")
+            return
+
+        exact = {cluster[0]: question_dedup_service.exact_duplicates(cluster, fingerprints) for cluster in clusters}
+        duplicate_ids = [question_id for ids in exact.values() for question_id in ids]
+        print(f"⚠️ 发现 {len(clusters)} 组近似重复题目（相似度 ≥ {args.threshold:.0%}，答案相同），"
+              f"其中完全重复 {len(duplicate_ids)} 道：")
+        shown = clusters[:args.show]
+        contents = dict(db.query(Question.id, Question.content).filter(
+            Question.id.in_([question_id for cluster in shown for question_id in cluster])
+        ))
+        for cluster in shown:
+            print(f"  • {cluster}")
+            for question_id in cluster:
+                marker = "（完全重复）" if question_id in exact[cluster[0]] else ""
+                print(f"      {question_id}: {(contents.get(question_id) or '')[:40]}{marker}")
+        if len(clusters) > args.show:
+            print(f"  ... 还有{len(clusters) - args.show}组")
+
+        if args.deactivate:
+            print()
+            if not duplicate_ids:
+                print("✅ 没有完全重复的题目，近似重复请人工确认后处理")
+            elif args.apply:
+                db.execute(update(Question).where(Question.id.in_(duplicate_ids)).values(is_active=False))
+                db.commit()
+                print(f"✅ 已停用 {len(duplicate_ids)} 道重复题目（运行中的服务最长10分钟后刷新组卷题库）")
+            else:
+                print(f"⚠️ 预览模式：{len(duplicate_ids)} 道重复题目待停用，加 --apply 执行")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+预生成每日随堂检测（夜间定时任务，可重复执行）
+
+为所有在职学员生成指定日期的5道题，已生成的跳过：
+- 错题本优先（按答错次数加权），其余取自本部门课程题库
+- 按用户ID分批，一批一条INSERT
+
+运行方式:
+cd backend
+python3 scripts/generate_daily_quizzes.py                      # 生成今天（UTC日期）
+python3 scripts/generate_daily_quizzes.py --date 2025-01-02
+python3 scripts/generate_daily_quizzes.py --batch-size 1000
+
+crontab 示例（每天UTC 00:05生成当天题目）:
+5 0 * * * cd /path/to/backend && python3 scripts/generate_daily_quizzes.py
+"""
+
+import sys
+import os
+import time
+import argparse
+from datetime import date
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core.database import SessionLocal
+from app import models  # noqa: F401  确保所有模型已注册
+from app.services import daily_quiz_service
+
+
+def main():
+    parser = argparse.ArgumentParser(description="预生成每日随堂检测")
+    parser.add_argument("--date", type=date.fromisoformat, default=None, help="检测日期（YYYY-MM-DD，默认今天）")
+    parser.add_argument("--batch-size", type=int, default=None, help="每批生成的用户数")
+    args = parser.parse_args()
+
+    quiz_date = daily_quiz_service.quiz_day(args.date)
+
+    print("=" * 60)
+    print(f"SmartIce LMS - 预生成每日随堂检测（{quiz_date:%Y-%m-%d}）")
+    print("=" * 60)
+
+    db = SessionLocal()
+    start = time.perf_counter()
+    try:
+        result = daily_quiz_service.generate_daily_quizzes(db, quiz_date, batch_size=args.batch_size)
+    finally:
+        db.close()
+    elapsed = time.perf_counter() - start
+
+    print()
+    print(f"✅ 已为 {result['generated']} 名学员生成随堂检测（扫描 {result['users']} 人，耗时 {elapsed:.1f} 秒）")
+    if result["insufficient"]:
+        print(f"⚠️ {result['insufficient']} 名学员可用题目不足 {daily_quiz_service.DAILY_QUIZ_SIZE} 道，已跳过")
+
+
+if __name__ == "__main__":
+    main()
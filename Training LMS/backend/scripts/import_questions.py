@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+批量导入题目（JSON Lines / CSV 题包，可重复执行）
+
+- 校验规则同 validate_question_data.py，无效行报告行号后跳过
+- 按内容指纹去重：题库中已有的题目跳过，重复导入同一题包不会产生重复题目
+- 默认只预览（校验、去重并统计），加 --apply 写入
+- 题包格式见 app/services/question_import_service.py，示例题包在 data/question_packs/
+
+运行方式:
+cd backend
+python3 scripts/import_questions.py data/question_packs/*.jsonl                 # 预览
+python3 scripts/import_questions.py data/question_packs/*.jsonl --apply
+python3 scripts/import_questions.py questions.csv --apply --chunk-size 2000
+"""
+
+import sys
+import os
+import argparse
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core.database import SessionLocal
+from app import models  # noqa: F401  确保所有模型已注册
+from app.services import question_import_service
+
+
+def print_report(path: str, report: dict, show_errors: int) -> None:
+    """输出单个题包的导入报告"""
+    action = "新增" if not report["dry_run"] else "待新增"
+    marker = "✅" if not report["invalid"] else "⚠️"
+    print(f"{marker} {os.path.basename(path)}（{report['format']}）")
+    print(f"  共 {report['total']} 行：{action} {report['inserted']}，"
+          f"重复跳过 {report['duplicates']}，无效 {report['invalid']}，警告 {report['warnings']}")
+    print(f"  耗时 {report['elapsed_seconds']:.2f} 秒，{report['rows_per_second'] or 0:.0f} 行/秒")
+    for error in report["errors"][:show_errors]:
+        print(f"    ❌ 第{error['line']}行: {error['message']}")
+    if report["invalid"] > show_errors:
+        print(f"    ... 还有{report['invalid'] - show_errors}行无效")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="批量导入题目")
+    parser.add_argument("paths", nargs="+", help="题包文件（.jsonl 或 .csv）")
+    parser.add_argument("--format", choices=question_import_service.IMPORT_FORMATS, help="题包格式，默认按扩展名判断")
+    parser.add_argument("--chunk-size", type=int, default=question_import_service.DEFAULT_CHUNK_SIZE, help="每批插入的题目数")
+    parser.add_argument("--creator-id", type=int, default=None, help="记录为创建者的用户ID")
+    parser.add_argument("--apply", action="store_true", help="写入数据库（默认只预览）")
+    parser.add_argument("--show-errors", type=int, default=20, help="每个题包显示的错误行数")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("SmartIce LMS - 批量导入题目")
+    print("=" * 60)
+
+    db = SessionLocal()
+    totals = {"total": 0, "inserted": 0, "duplicates": 0, "invalid": 0, "elapsed_seconds": 0.0}
+    try:
+        for path in args.paths:
+            file_format = args.format or question_import_service.detect_format(path)
+            with open(path, encoding="utf-8-sig", newline="") as stream:
+                report = question_import_service.import_questions(
+                    db, stream, file_format,
+                    creator_id=args.creator_id,
+                    chunk_size=args.chunk_size,
+                    dry_run=not args.apply
+                )
+            print_report(path, report, args.show_errors)
+            for key in totals:
+                totals[key] += report[key]
+    finally:
+        db.close()
+
+    elapsed = totals["elapsed_seconds"]
+    print()
+    print(f"📊 合计 {totals['total']} 行：{'新增' if args.apply else '待新增'} {totals['inserted']}，"
+          f"重复跳过 {totals['duplicates']}，无效 {totals['invalid']}")
+    print(f"   耗时 {elapsed:.2f} 秒，{totals['total'] / elapsed if elapsed > 0 else 0:.0f} 行/秒")
+    if not args.apply:
+        print("⚠️ 预览模式：未写入数据库，加 --apply 执行")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+固定考题迁移到 exam_questions 关联表（一次性，可重复执行）
+
+关联表上线前创建的考试只有 Exam.question_ids（JSON），没有关联表数据（应用启动时会自动补建完全缺失的，本脚本做全量校对）：
+- 按ID分批读取有固定考题的考试，关联表与JSON不一致（缺失、顺序不同）的重新同步
+- 关联表按JSON重建，JSON保持不变（之后由写入时自动同步）
+- JSON中已删除的题目不写入关联表，只报告出来（开考时本来也只下发存在的题目）
+
+运行方式:
+cd backend
+python3 scripts/migrate_exam_questions.py                  # 预览
+python3 scripts/migrate_exam_questions.py --apply          # 执行
+"""
+
+import sys
+import os
+import argparse
+from collections import defaultdict
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core.database import SessionLocal
+from app import models  # noqa: F401  确保所有模型已注册
+from app.models.exam import Exam, ExamQuestion, Question
+
+
+def main():
+    parser = argparse.ArgumentParser(description="固定考题迁移到关联表")
+    parser.add_argument("--apply", action="store_true", help="执行迁移（默认只预览）")
+    parser.add_argument("--batch-size", type=int, default=500, help="每批处理的考试数")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("SmartIce LMS - 固定考题迁移到关联表")
+    print("=" * 60)
+
+    db = SessionLocal()
+    checked = 0
+    synced = 0
+    missing = {}
+    last_id = 0
+
+    try:
+        while True:
+            exams = db.query(Exam).filter(
+                Exam.id > last_id,
+                Exam.question_ids.isnot(None)
+            ).order_by(Exam.id).limit(args.batch_size).all()
+            if not exams:
+                break
+
+            exam_ids = [exam.id for exam in exams]
+            linked = defaultdict(list)
+            for exam_id, question_id in db.query(ExamQuestion.exam_id, ExamQuestion.question_id).filter(
+                ExamQuestion.exam_id.in_(exam_ids)
+            ).order_by(ExamQuestion.exam_id, ExamQuestion.position):
+                linked[exam_id].append(question_id)
+
+            referenced = {question_id for exam in exams for question_id in exam.question_ids or []}
+            existing = {question_id for (question_id,) in db.query(Question.id).filter(Question.id.in_(referenced))}
+
+            for exam in exams:
+                question_ids = list(exam.question_ids or [])
+                absent = [question_id for question_id in question_ids if question_id not in existing]
+                if absent:
+                    missing[exam.id] = absent
+                present = [question_id for question_id in question_ids if question_id in existing]
+                if linked.get(exam.id, []) != present:
+                    synced += 1
+                    if args.apply:
+                        exam.question_links = [
+                            ExamQuestion(position=position, question_id=question_id)
+                            for position, question_id in enumerate(present)
+                        ]
+
+            if args.apply:
+                db.commit()
+            db.expunge_all()
+
+            checked += len(exams)
+            last_id = exam_ids[-1]
+            print(f"  已检查 {checked} 场考试，{'已同步' if args.apply else '待同步'} {synced} 场")
+    finally:
+        db.close()
+
+    print()
+    if missing:
+        print(f"⚠️ {len(missing)} 场考试引用了不存在的题目：")
+        for exam_id, question_ids in list(missing.items())[:20]:
+            print(f"  • 考试 {exam_id}: {question_ids}")
+    if not args.apply:
+        print(f"⚠️ 预览模式：{synced} 场考试待同步到关联表，加 --apply 执行")
+    else:
+        print(f"✅ 已同步 {synced} 场考试的固定考题")
+
+
+if __name__ == "__main__":
+    main()
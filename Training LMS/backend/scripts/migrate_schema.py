@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+数据库结构升级脚本（可重复执行）
+
+Base.metadata.create_all 只会创建缺失的表，不会给已有表补列/补索引。
+本脚本创建缺失的表，并为已有表补充模型中新增的列和索引。
+应用启动时也会自动执行同样的升级。
+
+运行方式:
+cd backend
+python3 scripts/migrate_schema.py
+"""
+
+import sys
+import os
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core.database import engine, Base, upgrade_schema
+from app import models  # noqa: F401  确保所有模型已注册
+
+
+def main():
+    print("=" * 60)
+    print("SmartIce LMS - 数据库结构升级")
+    print("=" * 60)
+
+    Base.metadata.create_all(bind=engine)
+    changes = upgrade_schema(engine)
+
+    if not changes:
+        print("✅ 数据库结构已是最新")
+        return
+
+    for change in changes:
+        print(f"  • {change}")
+    print(f"\n✅ 完成 {len(changes)} 项变更")
+
+
+if __name__ == "__main__":
+    main()
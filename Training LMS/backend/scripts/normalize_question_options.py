@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+题目选项格式迁移（一次性，可重复执行）
+
+把历史数据中的选项统一为标准格式：
+    [{"label": "A", "content": "选项内容", "is_correct": true}, ...]
+
+- 字典格式 {"A": "..."} 转为列表，is_correct 按 correct_answer 标记
+- text 字段改名为 content
+- 按ID分批读取和批量更新，不一次性加载整个题库
+- 无法自动转换的题目只报告，不修改
+
+运行方式:
+cd backend
+python3 scripts/normalize_question_options.py                  # 预览
+python3 scripts/normalize_question_options.py --apply          # 执行
+python3 scripts/normalize_question_options.py --apply --batch-size 1000
+"""
+
+import sys
+import os
+import argparse
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import update
+from app.core.database import SessionLocal
+from app import models  # noqa: F401  确保所有模型已注册
+from app.models.exam import Question
+from app.utils.question_options import normalize_options, is_canonical
+
+
+def main():
+    parser = argparse.ArgumentParser(description="题目选项格式迁移")
+    parser.add_argument("--apply", action="store_true", help="执行迁移（默认只预览）")
+    parser.add_argument("--batch-size", type=int, default=500, help="每批处理的题目数")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("SmartIce LMS - 题目选项格式迁移")
+    print("=" * 60)
+
+    db = SessionLocal()
+    scanned = 0
+    changed = 0
+    failed = []
+    last_id = 0
+
+    try:
+        while True:
+            rows = db.query(
+                Question.id, Question.options, Question.correct_answer
+            ).filter(
+                Question.id > last_id
+            ).order_by(Question.id).limit(args.batch_size).all()
+            if not rows:
+                break
+
+            updates = []
+            for question_id, options, correct_answer in rows:
+                if is_canonical(options):
+                    continue
+                try:
+                    updates.append({"id": question_id, "options": normalize_options(options, correct_answer)})
+                except ValueError as e:
+                    failed.append((question_id, str(e)))
+
+            if updates and args.apply:
+                # 按主键批量更新（一批一条语句）
+                db.execute(update(Question), updates)
+                db.commit()
+
+            scanned += len(rows)
+            changed += len(updates)
+            last_id = rows[-1].id
+            print(f"  已扫描 {scanned} 道，需转换 {changed} 道")
+    finally:
+        db.close()
+
+    print()
+    if failed:
+        print(f"❌ {len(failed)} 道题目无法自动转换，请手工修正：")
+        for question_id, reason in failed[:20]:
+            print(f"  • 题目 {question_id}: {reason}")
+        if len(failed) > 20:
+            print(f"  ... 还有{len(failed) - 20}道")
+
+    if not args.apply:
+        print(f"⚠️ 预览模式：{changed} 道题目需要转换，加 --apply 执行迁移")
+    else:
+        print(f"✅ 已转换 {changed} 道题目")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+重建用户学习汇总（学习统计，可重复执行）
+
+learning_summaries 由进度写入时增量更新，脚本直接改库、合并重复进度等情况会使计数与进度表不一致：
+- 按用户ID分批读取已有的汇总行，与进度表的条件聚合统计比较，输出不一致的用户
+- 加 --apply 把不一致的汇总行改为统计值；重建期间的进度写入可能被覆盖，建议在低峰期执行
+- 没有汇总行的用户不处理（首次读取或写入进度时按进度表统计写入）
+
+运行方式:
+cd backend
+python3 scripts/rebuild_learning_summaries.py                  # 预览
+python3 scripts/rebuild_learning_summaries.py --apply          # 执行
+python3 scripts/rebuild_learning_summaries.py --user-id 12 --apply
+"""
+
+import sys
+import os
+import argparse
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import update
+from app.core.database import SessionLocal
+from app import models  # noqa: F401  确保所有模型已注册
+from app.models.learning import LearningSummary
+from app.services import learning_service
+from app.services.learning_service import SUMMARY_FIELDS
+
+
+def main():
+    parser = argparse.ArgumentParser(description="重建用户学习汇总")
+    parser.add_argument("--user-id", type=int, help="只检查该用户")
+    parser.add_argument("--apply", action="store_true", help="修正不一致的汇总（默认只预览）")
+    parser.add_argument("--batch-size", type=int, default=1000, help="每批检查的用户数")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("SmartIce LMS - 重建用户学习汇总")
+    print("=" * 60)
+
+    db = SessionLocal()
+    checked = 0
+    drifted = 0
+    last_id = 0
+
+    try:
+        while True:
+            query = db.query(LearningSummary).filter(LearningSummary.user_id > last_id)
+            if args.user_id:
+                query = query.filter(LearningSummary.user_id == args.user_id)
+            summaries = query.order_by(LearningSummary.user_id).limit(args.batch_size).all()
+            if not summaries:
+                break
+
+            counts = learning_service.count_learning_summaries(db, [summary.user_id for summary in summaries])
+            rows = []
+            for summary in summaries:
+                expected = counts[summary.user_id]
+                stored = {field: getattr(summary, field) for field in SUMMARY_FIELDS}
+                if stored == expected:
+                    continue
+                diff = "，".join(
+                    f"{field} {stored[field]}→{expected[field]}" for field in SUMMARY_FIELDS if stored[field] != expected[field]
+                )
+                if drifted < 50:
+                    print(f"  • 用户#{summary.user_id}: {diff}")
+                rows.append({"user_id": summary.user_id, **expected})
+
+            drifted += len(rows)
+            checked += len(summaries)
+            last_id = summaries[-1].user_id
+            if rows and args.apply:
+                db.execute(update(LearningSummary), rows)
+                db.commit()
+            db.expunge_all()
+            print(f"  已检查 {checked} 个用户，{'已修正' if args.apply else '不一致'} {drifted} 个")
+    finally:
+        db.close()
+
+    print()
+    if not drifted:
+        print(f"✅ {checked} 个用户的学习汇总与进度一致")
+    elif not args.apply:
+        print(f"⚠️ 预览模式：{drifted} 个用户的学习汇总与进度不一致，加 --apply 修正")
+    else:
+        print(f"✅ 已修正 {drifted} 个用户的学习汇总")
+
+
+if __name__ == "__main__":
+    main()
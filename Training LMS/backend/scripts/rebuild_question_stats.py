@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+重建题目统计（难度、区分度、选项选择次数）
+
+从历史考试记录全量重建 question_stats / question_option_stats：
+- 按考试记录ID分批读取已判分的答卷，在内存中按题目累加（只保存累计量，内存占用与题目数成正比）
+- 累加口径与交卷时的增量更新相同
+- 清空后批量写入；重建期间交卷产生的增量会被覆盖，建议在低峰期执行
+
+运行方式:
+cd backend
+python3 scripts/rebuild_question_stats.py                  # 预览
+python3 scripts/rebuild_question_stats.py --apply          # 执行
+python3 scripts/rebuild_question_stats.py --apply --batch-size 2000
+"""
+
+import sys
+import os
+import argparse
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import insert
+from app.core.database import SessionLocal
+from app import models  # noqa: F401  确保所有模型已注册
+from app.models.exam import Question
+from app.models.learning import ExamRecord
+from app.models.question_stats import QuestionStats, QuestionOptionStats
+from app.services import question_stats_service
+from app.services.exam_service import SUBMITTED_STATUSES
+
+INSERT_CHUNK_SIZE = 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="重建题目统计")
+    parser.add_argument("--apply", action="store_true", help="写入统计表（默认只预览）")
+    parser.add_argument("--batch-size", type=int, default=1000, help="每批读取的考试记录数")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("SmartIce LMS - 重建题目统计")
+    print("=" * 60)
+
+    db = SessionLocal()
+    totals = {}
+    picks = {}
+    scanned = 0
+    last_id = 0
+
+    try:
+        # 无快照的旧记录按题目表的题型解析答案
+        question_types = {
+            question_id: question_type.value
+            for question_id, question_type in db.query(Question.id, Question.question_type)
+        }
+
+        while True:
+            rows = db.query(
+                ExamRecord.id, ExamRecord.score, ExamRecord.answers, ExamRecord.paper_snapshot
+            ).filter(
+                ExamRecord.id > last_id,
+                ExamRecord.status.in_(SUBMITTED_STATUSES),
+                ExamRecord.answers.isnot(None)
+            ).order_by(ExamRecord.id).limit(args.batch_size).all()
+            if not rows:
+                break
+
+            for _, score, answers, snapshot in rows:
+                types = question_stats_service.question_types_of(db, (), snapshot) if snapshot else question_types
+                # 已删除的题目不计入
+                details = [detail for detail in answers if detail.get("question_id") in question_types]
+                question_stats_service.accumulate(totals, picks, details, score, types)
+
+            scanned += len(rows)
+            last_id = rows[-1].id
+            print(f"  已扫描 {scanned} 份答卷，涉及 {len(totals)} 道题目")
+
+        if args.apply:
+            db.query(QuestionOptionStats).delete(synchronize_session=False)
+            db.query(QuestionStats).delete(synchronize_session=False)
+
+            stats_rows = [
+                {"question_id": question_id, **row, **question_stats_service.derive_metrics(row)}
+                for question_id, row in totals.items()
+            ]
+            option_rows = [
+                {"question_id": question_id, "label": label, "picks": count}
+                for (question_id, label), count in picks.items()
+            ]
+            for table, table_rows in ((QuestionStats, stats_rows), (QuestionOptionStats, option_rows)):
+                for start in range(0, len(table_rows), INSERT_CHUNK_SIZE):
+                    db.execute(insert(table), table_rows[start:start + INSERT_CHUNK_SIZE])
+            db.commit()
+    finally:
+        db.close()
+
+    print()
+    if not args.apply:
+        print(f"⚠️ 预览模式：{len(totals)} 道题目的统计待重建，加 --apply 执行")
+    else:
+        print(f"✅ 已重建 {len(totals)} 道题目的统计（{scanned} 份答卷）")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+重新判分：补建考试记录题目索引、在前台执行重新判分任务（可重复执行）
+
+- 题目索引（exam_record_questions）上线前的考试记录没有索引行，修正答案时找不到这些记录；
+  按ID分批补建（有快照的取快照中的题目，旧记录取答题详情中的题目）
+- 执行等待中、失败和中断（超过 REGRADE_STALE_SECONDS 没有进度）的任务，每批提交后输出进度，
+  中途中断后重新运行会从进度位置继续
+- --question-id / --exam-id 手动创建任务（按题目当前答案 / 考试当前设置重新判分）
+- 默认只预览，加 --apply 执行
+
+运行方式:
+cd backend
+python3 scripts/regrade_exam_records.py                          # 预览
+python3 scripts/regrade_exam_records.py --apply                  # 补建索引并执行未完成的任务
+python3 scripts/regrade_exam_records.py --question-id 12 --apply
+python3 scripts/regrade_exam_records.py --exam-id 3 --apply
+"""
+
+import sys
+import os
+import argparse
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import insert
+from app.core.database import SessionLocal
+from app import models  # noqa: F401  确保所有模型已注册
+from app.models.exam import Question
+from app.models.learning import ExamRecord, ExamRecordQuestion
+from app.models.regrade import RegradeJob, RegradeReason, RegradeStatus
+from app.services import regrade_service
+from app.services.grading_service import snapshot_question_ids
+
+
+def record_question_ids(exam_record: ExamRecord) -> list:
+    """考试记录包含的题目ID"""
+    if exam_record.paper_snapshot:
+        return snapshot_question_ids(exam_record.paper_snapshot)
+    return [detail["question_id"] for detail in exam_record.answers or []]
+
+
+def backfill_index(db, apply: bool, batch_size: int) -> int:
+    """补建缺失的题目索引，返回需要补建的记录数"""
+    missing = 0
+    last_id = 0
+    while True:
+        records = db.query(ExamRecord).filter(
+            ExamRecord.id > last_id
+        ).order_by(ExamRecord.id).limit(batch_size).all()
+        if not records:
+            break
+
+        record_ids = [record.id for record in records]
+        indexed = {record_id for (record_id,) in db.query(ExamRecordQuestion.exam_record_id).filter(
+            ExamRecordQuestion.exam_record_id.in_(record_ids)
+        ).distinct()}
+        pending = {
+            record.id: list(dict.fromkeys(record_question_ids(record)))
+            for record in records if record.id not in indexed
+        }
+        pending = {record_id: question_ids for record_id, question_ids in pending.items() if question_ids}
+
+        if pending and apply:
+            # 已删除的题目不写入（外键）
+            existing = {question_id for (question_id,) in db.query(Question.id).filter(
+                Question.id.in_({question_id for ids in pending.values() for question_id in ids})
+            )}
+            rows = [
+                {"question_id": question_id, "exam_record_id": record_id}
+                for record_id, question_ids in pending.items()
+                for question_id in question_ids if question_id in existing
+            ]
+            if rows:
+                db.execute(insert(ExamRecordQuestion.__table__), rows)
+            db.commit()
+        db.expunge_all()
+
+        missing += len(pending)
+        last_id = record_ids[-1]
+        print(f"  已检查到记录 {last_id}，{'已补建' if apply else '待补建'} {missing} 条")
+    return missing
+
+
+def print_progress(job: RegradeJob) -> None:
+    progress = regrade_service.job_progress(job)
+    print(f"  任务 {job.id}: {progress['processed_records']}/{progress['total_records']}"
+          f"（{progress['percent']}%），变化 {progress['changed_records']} 条")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="重新判分")
+    parser.add_argument("--question-id", type=int, help="按该题目当前答案重新判分")
+    parser.add_argument("--exam-id", type=int, help="按该考试当前设置重新判分")
+    parser.add_argument("--skip-index", action="store_true", help="不检查题目索引")
+    parser.add_argument("--apply", action="store_true", help="执行（默认只预览）")
+    parser.add_argument("--batch-size", type=int, default=500, help="补建索引每批处理的记录数")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("SmartIce LMS - 重新判分")
+    print("=" * 60)
+
+    db = SessionLocal()
+    try:
+        if not args.skip_index:
+            print("\n📋 考试记录题目索引")
+            missing = backfill_index(db, args.apply, args.batch_size)
+            print(f"{'✅' if args.apply or not missing else '⚠️'} {missing} 条记录{'已补建' if args.apply else '缺少'}索引")
+
+        if args.apply:
+            if args.question_id:
+                regrade_service.create_job(db, RegradeReason.ANSWER_KEY, question_id=args.question_id)
+            if args.exam_id:
+                regrade_service.create_job(db, RegradeReason.PASS_SCORE, exam_id=args.exam_id)
+            db.commit()
+
+        jobs = db.query(RegradeJob).filter(
+            RegradeJob.status != RegradeStatus.COMPLETED
+        ).order_by(RegradeJob.id).all()
+        print(f"\n📋 未完成的任务 {len(jobs)} 个")
+        for job in jobs:
+            target = f"题目 {job.question_id}" if job.reason == RegradeReason.ANSWER_KEY else f"考试 {job.exam_id}"
+            print(f"  • 任务 {job.id}: {target}，{job.status.value}，"
+                  f"已处理 {job.processed_records}/{job.total_records}" + (f"，错误: {job.error}" if job.error else ""))
+        job_ids = [job.id for job in jobs]
+    finally:
+        db.close()
+
+    if not args.apply:
+        if args.question_id or args.exam_id:
+            print("\n⚠️ 预览模式：未创建任务")
+        print("\n⚠️ 预览模式：加 --apply 执行")
+        return
+
+    print()
+    for job_id in job_ids:
+        job = regrade_service.run_job(job_id, on_batch=print_progress)
+        if job is None:
+            print(f"⚠️ 任务 {job_id} 正在其他进程中执行，跳过")
+        elif job.status == RegradeStatus.COMPLETED:
+            print(f"✅ 任务 {job_id} 完成：处理 {job.processed_records} 条，变化 {job.changed_records} 条")
+        else:
+            print(f"❌ 任务 {job_id} {job.status.value}：{job.error or ''}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+历史错题加入复习队列（一次性，可重复执行）
+
+间隔复习上线前的错题没有下次复习时间（due_at 为空），不会出现在待复习列表中：
+- 未掌握的错题按最后答错时间排期（立即到期），难易系数、间隔等取初始值
+- 已掌握的错题保持不排期
+- 按ID分批读取和更新
+
+运行方式:
+cd backend
+python3 scripts/schedule_wrong_questions.py                  # 预览
+python3 scripts/schedule_wrong_questions.py --apply          # 执行
+python3 scripts/schedule_wrong_questions.py --apply --batch-size 5000
+"""
+
+import sys
+import os
+import argparse
+from datetime import datetime
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import func, update
+from app.core.database import SessionLocal
+from app import models  # noqa: F401  确保所有模型已注册
+from app.models.wrong_question import WrongQuestion
+from app.services import wrong_question_service
+
+
+def main():
+    parser = argparse.ArgumentParser(description="历史错题加入复习队列")
+    parser.add_argument("--apply", action="store_true", help="执行排期（默认只预览）")
+    parser.add_argument("--batch-size", type=int, default=1000, help="每批处理的错题数")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("SmartIce LMS - 历史错题加入复习队列")
+    print("=" * 60)
+
+    db = SessionLocal()
+    scheduled = 0
+    last_id = 0
+    now = datetime.utcnow()
+
+    try:
+        while True:
+            ids = [row.id for row in db.query(WrongQuestion.id).filter(
+                WrongQuestion.id > last_id,
+                WrongQuestion.mastered == False,
+                WrongQuestion.due_at.is_(None)
+            ).order_by(WrongQuestion.id).limit(args.batch_size).all()]
+            if not ids:
+                break
+
+            if args.apply:
+                db.execute(
+                    update(WrongQuestion).where(WrongQuestion.id.in_(ids)).values(
+                        due_at=func.coalesce(WrongQuestion.last_wrong_date, WrongQuestion.created_at, now),
+                        ease_factor=func.coalesce(WrongQuestion.ease_factor, wrong_question_service.DEFAULT_EASE),
+                        interval_days=0,
+                        repetitions=0
+                    )
+                )
+                db.commit()
+
+            scheduled += len(ids)
+            last_id = ids[-1]
+            print(f"  {'已排期' if args.apply else '待排期'} {scheduled} 道错题")
+    finally:
+        db.close()
+
+    print()
+    if not args.apply:
+        print(f"⚠️ 预览模式：{scheduled} 道错题待加入复习队列，加 --apply 执行")
+    else:
+        print(f"✅ 已将 {scheduled} 道错题加入复习队列")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,29 +3,59 @@ Pytest配置文件
 提供测试夹具(fixtures)和共享配置
 """
 
+import os
+import tempfile
+
+# 应用导入时读取配置：测试使用临时文件SQLite数据库
+# （后台线程——自动保存、观看心跳、自动交卷、重新判分——用 SessionLocal 自行建会话，需要与请求共用同一个库）
+_TEST_DB_DIR = tempfile.mkdtemp(prefix="training-lms-test-")
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_TEST_DB_DIR, 'test.db')}"
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
 
-from app.core.database import Base, get_db
+from app.core.database import Base, get_db, engine, SessionLocal
 from app.models.user import User
 from app.models.organization import Store, Region
 from app.models.position import Position
 from app.core.security import get_password_hash
+from app.services import (
+    certificate_service, course_service, exam_service, grading_service,
+    learning_service, paper_service
+)
 from main import app
 
 
-# 测试数据库引擎(使用内存SQLite)
-SQLALCHEMY_TEST_DATABASE_URL = "sqlite:///:memory:"
+# 测试数据库会话工厂（与应用共用引擎）
+TestingSessionLocal = SessionLocal
 
-engine = create_engine(
-    SQLALCHEMY_TEST_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
-)
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+@pytest.fixture(autouse=True)
+def reset_process_state():
+    """
+    清空进程内缓存、题库、写缓冲和自动交卷调度
+
+    每个测试重建表后ID会复用，上一个测试缓存的答案键、试卷、章节数等会串到下一个测试
+    """
+    for cache in (
+        grading_service._answer_key_cache,
+        paper_service._question_render_cache,
+        paper_service._paper_cache,
+        exam_service._result_detail_cache,
+        course_service._chapter_count_cache,
+        course_service._content_info_cache,
+    ):
+        cache.clear()
+    paper_service._pools.invalidate()
+    exam_service._autosave_buffer._take(None)
+    with exam_service._deadline_scheduler._lock:
+        exam_service._deadline_scheduler._heap = []
+        exam_service._deadline_scheduler._deadlines = {}
+    learning_service._heartbeat_buffer._take(None)
+    # 序列表随表一起删除，号段需要重新分配
+    certificate_service._certificate_numbers._next = certificate_service._certificate_numbers._end = 0
+    yield
 
 
 @pytest.fixture(scope="function")
@@ -194,6 +224,139 @@ def admin_headers(client, admin_user):
     return {"Authorization": f"Bearer {token}"}
 
 
+@pytest.fixture(scope="function")
+def test_course(db_session):
+    """创建测试课程（前厅，已发布，3个章节，每章1个视频）"""
+    from app.models.user import DepartmentType
+    from app.models.course import Course, Chapter, Content, ContentType
+
+    course = Course(
+        title="前厅服务基础",
+        code="FH_TEST_001",
+        department_type=DepartmentType.FRONT_HALL,
+        is_published=True
+    )
+    db_session.add(course)
+    db_session.flush()
+
+    for order in range(1, 4):
+        chapter = Chapter(course_id=course.id, title=f"第{order}章", order=order)
+        db_session.add(chapter)
+        db_session.flush()
+        db_session.add(Content(
+            chapter_id=chapter.id,
+            title=f"第{order}章视频",
+            content_type=ContentType.VIDEO,
+            order=1,
+            duration=120
+        ))
+
+    db_session.commit()
+    db_session.refresh(course)
+    return course
+
+
+@pytest.fixture(scope="function")
+def test_questions(db_session, test_course):
+    """
+    创建测试题目（单选、多选、判断各2道，均属于测试课程第1章）
+
+    单选答案 B，多选答案 A,C，判断题答案“对”
+    """
+    from app.models.exam import Question, QuestionType, QuestionCategory
+
+    chapter_id = test_course.chapters[0].id
+    questions = []
+    for index in range(2):
+        questions.append(Question(
+            content=f"单选题{index + 1}：迎宾时应站在什么位置？",
+            question_type=QuestionType.SINGLE_CHOICE,
+            category=QuestionCategory.SKILL,
+            course_id=test_course.id,
+            chapter_id=chapter_id,
+            options=[
+                {"label": "A", "content": "门内", "is_correct": False},
+                {"label": "B", "content": "门口一侧", "is_correct": True},
+                {"label": "C", "content": "吧台后", "is_correct": False},
+            ],
+            correct_answer="B",
+            explanation="迎宾站在门口一侧"
+        ))
+        questions.append(Question(
+            content=f"多选题{index + 1}：点餐时需要确认哪些信息？",
+            question_type=QuestionType.MULTIPLE_CHOICE,
+            category=QuestionCategory.SKILL,
+            course_id=test_course.id,
+            chapter_id=chapter_id,
+            options=[
+                {"label": "A", "content": "忌口", "is_correct": True},
+                {"label": "B", "content": "年龄", "is_correct": False},
+                {"label": "C", "content": "用餐人数", "is_correct": True},
+            ],
+            correct_answer="A,C"
+        ))
+        questions.append(Question(
+            content=f"判断题{index + 1}：上菜前需要核对桌号。",
+            question_type=QuestionType.TRUE_FALSE,
+            category=QuestionCategory.VALUE_CUSTOMER,
+            course_id=test_course.id,
+            chapter_id=chapter_id,
+            correct_answer="对"
+        ))
+
+    db_session.add_all(questions)
+    db_session.commit()
+    for question in questions:
+        db_session.refresh(question)
+    return questions
+
+
+@pytest.fixture(scope="function")
+def test_exam(db_session, test_course, test_questions):
+    """创建测试考试（周测，已发布，固定考题为全部测试题目，及格线60分）"""
+    from app.models.exam import Exam, ExamType
+
+    exam = Exam(
+        title="前厅服务周测",
+        exam_type=ExamType.WEEKLY_TEST,
+        course_id=test_course.id,
+        total_questions=len(test_questions),
+        pass_score=60,
+        question_ids=[q.id for q in test_questions],
+        max_attempts=3,
+        retake_cooldown_days=3,
+        is_published=True
+    )
+    db_session.add(exam)
+    db_session.commit()
+    db_session.refresh(exam)
+    return exam
+
+
+@pytest.fixture(scope="function")
+def answer_sheet(test_questions):
+    """
+    按测试题目生成提交的答案列表
+
+    answer_sheet(correct=4) 前4题答对、其余答错；默认全部答对
+    """
+    right = {"single_choice": "B", "multiple_choice": "A,C", "true_false": "对"}
+    wrong = {"single_choice": "A", "multiple_choice": "A", "true_false": "错"}
+
+    def build(correct=None, questions=None):
+        questions = questions or test_questions
+        correct = len(questions) if correct is None else correct
+        return [
+            {
+                "question_id": q.id,
+                "user_answer": (right if index < correct else wrong)[q.question_type.value]
+            }
+            for index, q in enumerate(questions)
+        ]
+
+    return build
+
+
 # 测试数据常量
 TEST_USER_DATA = {
     "username": "newuser",
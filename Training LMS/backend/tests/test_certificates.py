@@ -0,0 +1,204 @@
+"""
+证书测试：通过期末考试自动发证、每人每门课程一张、号段分配编号、补发脚本
+"""
+
+import importlib.util
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core.database import SessionLocal
+from app.models.certificate import Certificate, CertificateSequence
+from app.models.exam import Exam, ExamType
+from app.models.learning import ExamRecord, ExamStatus
+from app.services import certificate_service
+from app.services.certificate_service import BlockSequence
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(__file__), "..", "scripts")
+
+
+@pytest.fixture
+def final_exam(db_session, test_course, test_questions):
+    """测试课程的期末考试（固定考题为全部测试题目）"""
+    exam = Exam(
+        title="前厅服务期末考试",
+        exam_type=ExamType.FINAL_EXAM,
+        course_id=test_course.id,
+        total_questions=len(test_questions),
+        pass_score=60,
+        question_ids=[q.id for q in test_questions],
+        is_published=True
+    )
+    db_session.add(exam)
+    db_session.commit()
+    db_session.refresh(exam)
+    return exam
+
+
+def _take_exam(client, headers, exam, answers):
+    assert client.post(f"/api/exams/{exam.id}/start", headers=headers).status_code == 200
+    response = client.post("/api/exams/submit", headers=headers, json={"exam_id": exam.id, "answers": answers})
+    assert response.status_code == 200
+    return response.json()
+
+
+def _certificates():
+    with SessionLocal() as db:
+        return db.query(Certificate).order_by(Certificate.id).all()
+
+
+@pytest.mark.exam
+@pytest.mark.integration
+class TestIssueOnPass:
+    """判分后自动发证"""
+
+    def test_passing_final_exam_issues_certificate(self, client, auth_headers, test_user, test_course, final_exam, answer_sheet):
+        result = _take_exam(client, auth_headers, final_exam, answer_sheet())
+
+        certificates = _certificates()
+        assert len(certificates) == 1
+        certificate = certificates[0]
+        assert certificate.user_id == test_user.id
+        assert certificate.course_id == test_course.id
+        assert certificate.exam_record_id == result["exam_record_id"]
+        assert certificate.title == "前厅服务基础结业证书"
+        assert certificate.score == 100
+        assert certificate.certificate_number == f"SC{datetime.utcnow():%Y}00000001"
+
+    def test_failing_final_exam_issues_nothing(self, client, auth_headers, final_exam, answer_sheet):
+        _take_exam(client, auth_headers, final_exam, answer_sheet(correct=1))
+        assert _certificates() == []
+
+    def test_non_certified_exam_issues_nothing(self, client, auth_headers, test_exam, answer_sheet):
+        _take_exam(client, auth_headers, test_exam, answer_sheet())
+        assert _certificates() == []
+
+    def test_one_certificate_per_course(self, client, auth_headers, db_session, final_exam, answer_sheet):
+        """同一课程再次通过期末考试（另一场考试）不重复发证"""
+        second = Exam(
+            title="前厅服务期末考试（B卷）",
+            exam_type=ExamType.FINAL_EXAM,
+            course_id=final_exam.course_id,
+            total_questions=final_exam.total_questions,
+            pass_score=60,
+            question_ids=list(final_exam.question_ids),
+            is_published=True
+        )
+        db_session.add(second)
+        db_session.commit()
+
+        first_result = _take_exam(client, auth_headers, final_exam, answer_sheet())
+        _take_exam(client, auth_headers, second, answer_sheet())
+
+        certificates = _certificates()
+        assert len(certificates) == 1
+        assert certificates[0].exam_record_id == first_result["exam_record_id"]
+
+    def test_insert_conflict_does_nothing(self, db_session, test_user, final_exam):
+        row = {
+            "user_id": test_user.id,
+            "course_id": final_exam.course_id,
+            "certificate_number": "SC202600000001",
+            "title": "证书",
+            "issued_at": datetime.utcnow(),
+        }
+        certificate_service.insert_certificates(db_session, [row])
+        certificate_service.insert_certificates(db_session, [{**row, "certificate_number": "SC202600000002"}])
+        db_session.commit()
+
+        assert [c.certificate_number for c in db_session.query(Certificate)] == ["SC202600000001"]
+
+
+@pytest.mark.unit
+class TestBlockSequence:
+    """号段分配"""
+
+    def test_numbers_within_block(self, db_session):
+        sequence = BlockSequence("test", block_size=3)
+
+        assert [sequence.next() for _ in range(3)] == [1, 2, 3]
+        assert sequence.blocks_allocated == 1
+        assert sequence.next() == 4
+        assert sequence.blocks_allocated == 2
+        assert db_session.get(CertificateSequence, "test").next_value == 7
+
+    def test_two_sequences_get_disjoint_blocks(self, db_session):
+        """两个进程（两个序列对象）各自预留号段，发出的号码不重复"""
+        first = BlockSequence("test", block_size=5)
+        second = BlockSequence("test", block_size=5)
+
+        numbers = [first.next(), second.next(), first.next(), second.next()]
+
+        assert numbers == [1, 6, 2, 7]
+        assert first.stats()["remaining"] == 3
+        assert second.stats()["remaining"] == 3
+
+    def test_reserve_allocates_enough(self, db_session):
+        """批量发证前预留：剩余号码不足时一次分配 max(号段大小, 需要数量)"""
+        sequence = BlockSequence("test", block_size=3)
+        sequence.next()
+
+        sequence.reserve(2)
+        assert sequence.blocks_allocated == 1
+
+        sequence.reserve(10)
+        assert sequence.blocks_allocated == 2
+        assert sequence.stats()["remaining"] == 10
+        assert [sequence.next() for _ in range(10)] == list(range(4, 14))
+
+
+def _load_backfill_script():
+    path = os.path.join(SCRIPTS_DIR, "backfill_certificates.py")
+    spec = importlib.util.spec_from_file_location("backfill_certificates", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.integration
+class TestBackfillScript:
+    """scripts/backfill_certificates.py"""
+
+    @pytest.fixture
+    def passed_records(self, db_session, test_user, admin_user, final_exam):
+        """发证功能上线前通过的记录：测试用户两条（取最早的一条）、管理员一条"""
+        submitted_at = datetime(2025, 6, 1, 10, 0)
+        records = [
+            ExamRecord(user_id=user.id, exam_id=final_exam.id, attempt_number=attempt, status=ExamStatus.PASSED,
+                       score=score, total_questions=6, correct_answers=6,
+                       submitted_at=submitted_at + timedelta(days=attempt))
+            for user, attempt, score in ((test_user, 1, 83.3), (test_user, 2, 100.0), (admin_user, 1, 66.7))
+        ]
+        records.append(ExamRecord(user_id=admin_user.id, exam_id=final_exam.id, attempt_number=2,
+                                  status=ExamStatus.FAILED, score=10.0))
+        db_session.add_all(records)
+        db_session.commit()
+        return records
+
+    def _run(self, monkeypatch, *args):
+        monkeypatch.setattr(sys, "argv", ["backfill_certificates.py", *args])
+        _load_backfill_script().main()
+
+    def test_preview_writes_nothing(self, monkeypatch, capsys, passed_records):
+        self._run(monkeypatch)
+
+        assert "2 张证书待补发" in capsys.readouterr().out
+        assert _certificates() == []
+
+    def test_apply_and_rerun(self, monkeypatch, capsys, passed_records, test_user, admin_user):
+        self._run(monkeypatch, "--apply", "--batch-size", "2")
+
+        certificates = {c.user_id: c for c in _certificates()}
+        assert set(certificates) == {test_user.id, admin_user.id}
+        assert certificates[test_user.id].exam_record_id == passed_records[0].id
+        assert certificates[test_user.id].score == 83
+        assert certificates[test_user.id].issued_at.replace(tzinfo=None) == passed_records[0].submitted_at
+        assert certificates[test_user.id].certificate_number.startswith("SC2025")
+        assert len({c.certificate_number for c in certificates.values()}) == 2
+
+        capsys.readouterr()
+        self._run(monkeypatch, "--apply")
+        assert "已补发 0 张证书" in capsys.readouterr().out
+        assert len(_certificates()) == 2
@@ -0,0 +1,120 @@
+"""
+课程进度测试：完成章节时增量更新已完成章节数和进度百分比、章节数缓存
+"""
+
+import pytest
+from sqlalchemy import event
+
+from app.core.database import SessionLocal, engine
+from app.models.learning import CourseProgress, LearningStatus
+from app.schemas.course import ChapterCreate
+from app.schemas.learning import ChapterProgressUpdate
+from app.services import course_service, learning_service
+
+
+def _course_progress(user_id, course_id):
+    with SessionLocal() as db:
+        return db.query(CourseProgress).filter_by(user_id=user_id, course_id=course_id).one()
+
+
+@pytest.mark.learning
+@pytest.mark.integration
+class TestCompleteChapter:
+
+    def test_counters_follow_completed_chapters(self, db_session, test_user, test_course):
+        chapters = test_course.chapters
+        expected = [
+            (1, 33.3, LearningStatus.IN_PROGRESS),
+            (2, 66.7, LearningStatus.IN_PROGRESS),
+            (3, 100.0, LearningStatus.COMPLETED),
+        ]
+
+        for chapter, (completed, percentage, course_status) in zip(chapters, expected):
+            learning_service.complete_chapter(db_session, test_user.id, chapter.id)
+            progress = _course_progress(test_user.id, test_course.id)
+            assert progress.completed_chapters == completed
+            assert progress.total_chapters == 3
+            assert round(progress.progress_percentage, 1) == percentage
+            assert progress.status == course_status
+
+        assert progress.started_at is not None
+        assert progress.completed_at is not None
+
+    def test_recomplete_not_counted_twice(self, db_session, test_user, test_course):
+        chapter_id = test_course.chapters[0].id
+
+        learning_service.complete_chapter(db_session, test_user.id, chapter_id)
+        learning_service.complete_chapter(db_session, test_user.id, chapter_id)
+
+        assert _course_progress(test_user.id, test_course.id).completed_chapters == 1
+
+    def test_one_commit_and_one_course_update(self, db_session, test_user, test_course):
+        """章节和课程进度同一事务提交；课程进度只有一条UPDATE，不重新读取章节进度"""
+        commits = []
+        statements = []
+
+        def commit(session):
+            commits.append(session)
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(" ".join(statement.split()).upper())
+
+        event.listen(db_session, "after_commit", commit)
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            learning_service.complete_chapter(db_session, test_user.id, test_course.chapters[0].id)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+            event.remove(db_session, "after_commit", commit)
+
+        assert len(commits) == 1
+        assert len([s for s in statements if s.startswith("UPDATE COURSE_PROGRESS")]) == 1
+        # 不再按课程重新读取全部章节进度
+        assert not [s for s in statements if s.startswith("SELECT") and "CHAPTER_PROGRESS.COURSE_ID =" in s]
+
+    def test_uncomplete_chapter(self, db_session, test_user, test_course):
+        """章节改回学习中：已完成章节数减1，已完成的课程回到学习中"""
+        for chapter in test_course.chapters:
+            learning_service.complete_chapter(db_session, test_user.id, chapter.id)
+
+        learning_service.update_chapter_progress(
+            db_session, test_user.id, test_course.chapters[2].id,
+            ChapterProgressUpdate(status=LearningStatus.IN_PROGRESS)
+        )
+
+        progress = _course_progress(test_user.id, test_course.id)
+        assert progress.completed_chapters == 2
+        assert round(progress.progress_percentage, 1) == 66.7
+        assert progress.status == LearningStatus.IN_PROGRESS
+
+
+@pytest.mark.learning
+@pytest.mark.integration
+class TestChapterCount:
+    """课程章节数缓存"""
+
+    def test_cached(self, db_session, test_course):
+        assert course_service.get_chapter_count(db_session, test_course.id) == 3
+        hits = course_service.get_chapter_count_cache_stats()["hits"]
+
+        assert course_service.get_chapter_count(db_session, test_course.id) == 3
+        assert course_service.get_chapter_count_cache_stats()["hits"] == hits + 1
+
+    def test_invalidated_on_create_and_delete(self, db_session, test_user, test_course):
+        """新增/删除章节后，再完成章节时按新的章节总数计算进度"""
+        learning_service.complete_chapter(db_session, test_user.id, test_course.chapters[0].id)
+
+        chapter = course_service.create_chapter(db_session, ChapterCreate(
+            course_id=test_course.id, title="第4章", order=4
+        ))
+        assert course_service.get_chapter_count(db_session, test_course.id) == 4
+        learning_service.complete_chapter(db_session, test_user.id, test_course.chapters[1].id)
+        progress = _course_progress(test_user.id, test_course.id)
+        assert (progress.completed_chapters, progress.total_chapters, progress.progress_percentage) == (2, 4, 50.0)
+
+        course_service.delete_chapter(db_session, chapter.id)
+        assert course_service.get_chapter_count(db_session, test_course.id) == 3
+        learning_service.complete_chapter(db_session, test_user.id, test_course.chapters[2].id)
+        progress = _course_progress(test_user.id, test_course.id)
+        assert (progress.completed_chapters, progress.total_chapters) == (3, 3)
+        assert progress.status == LearningStatus.COMPLETED
@@ -0,0 +1,79 @@
+"""
+每日随堂检测批量预生成测试
+"""
+
+import pytest
+from sqlalchemy import delete
+
+from app.models.exam import Question
+from app.models.learning import DailyQuizRecord
+from app.services import daily_quiz_service, paper_service
+
+
+def _hard_delete(db_session, question_ids):
+    """其他进程直接删除题目：本进程的题库ID池仍保留这些ID"""
+    db_session.execute(delete(Question).where(Question.id.in_(question_ids)))
+    db_session.commit()
+
+
+@pytest.mark.learning
+@pytest.mark.integration
+class TestGenerateDailyQuizzes:
+
+    def test_generate_and_rerun(self, db_session, test_user, test_questions):
+        result = daily_quiz_service.generate_daily_quizzes(db_session)
+
+        assert result == {"users": 1, "generated": 1, "insufficient": 0}
+        record = daily_quiz_service.get_daily_quiz(db_session, test_user.id)
+        assert len(record.question_ids) == daily_quiz_service.DAILY_QUIZ_SIZE
+        assert [item["id"] for item in record.paper_snapshot["items"]] == record.question_ids
+
+        # 已生成的跳过
+        assert daily_quiz_service.generate_daily_quizzes(db_session)["generated"] == 0
+        assert db_session.query(DailyQuizRecord).count() == 1
+
+    def test_deleted_question_in_pool_is_resampled(self, db_session, test_user, test_questions, monkeypatch):
+        """抽到题库ID池中已删除的题目：移出ID池并补抽，不中断整批"""
+        paper_service.sample_questions(db_session, 1)  # 加载ID池
+        deleted = test_questions[0].id
+        remaining = [q.id for q in test_questions[1:]]
+        _hard_delete(db_session, [deleted])
+
+        monkeypatch.setattr(
+            daily_quiz_service, "pick_questions",
+            lambda db, wrong_items, course_ids: [deleted] + remaining[:4]
+        )
+        result = daily_quiz_service.generate_daily_quizzes(db_session)
+
+        assert result == {"users": 1, "generated": 1, "insufficient": 0}
+        record = daily_quiz_service.get_daily_quiz(db_session, test_user.id)
+        assert sorted(record.question_ids) == sorted(remaining)
+        assert deleted not in [item["id"] for item in record.paper_snapshot["items"]]
+        assert paper_service.get_pool_stats()["questions"] == len(remaining)
+
+    def test_user_skipped_when_paper_cannot_be_completed(self, db_session, test_user, admin_user, test_questions):
+        """删除后题库不足5道：跳过这些学员，计入题库不足"""
+        paper_service.sample_questions(db_session, 1)
+        _hard_delete(db_session, [q.id for q in test_questions[:2]])
+
+        result = daily_quiz_service.generate_daily_quizzes(db_session)
+
+        assert result == {"users": 2, "generated": 0, "insufficient": 2}
+        assert db_session.query(DailyQuizRecord).count() == 0
+
+    def test_deactivated_question_not_used(self, db_session, test_user, test_questions, monkeypatch):
+        """ID池尚未同步的停用题目同样补抽替换"""
+        paper_service.sample_questions(db_session, 1)
+        inactive = test_questions[0].id
+        db_session.query(Question).filter(Question.id == inactive).update({"is_active": False})
+        db_session.commit()
+
+        monkeypatch.setattr(
+            daily_quiz_service, "pick_questions",
+            lambda db, wrong_items, course_ids: [q.id for q in test_questions[:5]]
+        )
+        daily_quiz_service.generate_daily_quizzes(db_session)
+
+        record = daily_quiz_service.get_daily_quiz(db_session, test_user.id)
+        assert inactive not in record.question_ids
+        assert len(record.question_ids) == daily_quiz_service.DAILY_QUIZ_SIZE
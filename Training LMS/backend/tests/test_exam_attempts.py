@@ -0,0 +1,133 @@
+"""
+考试次数与补考测试：重复开考继续同一场、并发开考、补考冷却期、最大次数
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.learning import ExamRecord, ExamStatus
+from app.services import exam_service
+
+
+def _start(client, headers, exam):
+    return client.post(f"/api/exams/{exam.id}/start", headers=headers)
+
+
+def _submit(client, headers, exam, answers):
+    return client.post("/api/exams/submit", headers=headers, json={"exam_id": exam.id, "answers": answers})
+
+
+@pytest.mark.exam
+@pytest.mark.integration
+class TestStartExam:
+    """开考与继续考试"""
+
+    def test_start_twice_resumes_same_record(self, client, auth_headers, db_session, test_exam):
+        """重复点击开始考试：返回同一条记录和同一份试卷"""
+        first = _start(client, auth_headers, test_exam)
+        second = _start(client, auth_headers, test_exam)
+
+        assert first.status_code == second.status_code == 200
+        assert first.json()["exam_record_id"] == second.json()["exam_record_id"]
+        assert first.json()["attempt_number"] == second.json()["attempt_number"] == 1
+        assert [q["id"] for q in first.json()["questions"]] == [q["id"] for q in second.json()["questions"]]
+        assert db_session.query(ExamRecord).count() == 1
+
+    def test_concurrent_start_resumes_on_unique_index(self, db_session, test_user, test_exam, monkeypatch):
+        """
+        并发开考：另一个请求已插入进行中的记录，本请求读到的统计还是旧的，
+        提交时被 uq_exam_records_user_exam_in_progress 拦截，回滚后继续那一场
+        """
+        existing = exam_service.start_exam(db_session, test_user.id, test_exam.id)
+
+        stale = {"submitted_count": 0, "next_retake_at": None, "in_progress_id": None}
+        monkeypatch.setattr(exam_service, "get_attempt_summary", lambda db, user_id, exam_id: stale)
+
+        record, paper = exam_service.start_exam_with_paper(db_session, test_user.id, test_exam.id)
+
+        assert record.id == existing.id
+        assert paper.question_ids == exam_service.snapshot_question_ids(existing.paper_snapshot)
+        assert db_session.query(ExamRecord).filter(ExamRecord.status == ExamStatus.IN_PROGRESS).count() == 1
+
+    def test_attempt_summary(self, client, auth_headers, db_session, test_user, test_exam, answer_sheet):
+        _start(client, auth_headers, test_exam)
+        summary = exam_service.get_attempt_summary(db_session, test_user.id, test_exam.id)
+        assert summary["submitted_count"] == 0
+        assert summary["in_progress_id"] is not None
+
+        _submit(client, auth_headers, test_exam, answer_sheet(correct=0))
+        summary = exam_service.get_attempt_summary(db_session, test_user.id, test_exam.id)
+        assert summary["submitted_count"] == 1
+        assert summary["in_progress_id"] is None
+        assert summary["next_retake_at"] is not None
+
+
+@pytest.mark.exam
+@pytest.mark.integration
+class TestRetake:
+    """补考冷却期与最大次数"""
+
+    def test_failed_attempt_enters_cooldown(self, client, auth_headers, db_session, test_exam, answer_sheet):
+        """未通过且还有次数：等待补考，冷却期内不能开考"""
+        _start(client, auth_headers, test_exam)
+        before = datetime.utcnow()
+        result = _submit(client, auth_headers, test_exam, answer_sheet(correct=2)).json()
+
+        assert result["passed"] is False
+        assert result["can_retake"] is True
+        next_retake_at = datetime.fromisoformat(result["next_retake_at"]).replace(tzinfo=None)
+        assert next_retake_at - before >= timedelta(days=test_exam.retake_cooldown_days)
+
+        record = db_session.get(ExamRecord, result["exam_record_id"])
+        assert record.status == ExamStatus.PENDING_RETAKE
+
+        response = _start(client, auth_headers, test_exam)
+        assert response.status_code == 400
+        assert "冷却期" in response.json()["detail"]
+
+    def test_retake_after_cooldown(self, client, auth_headers, db_session, test_exam, answer_sheet):
+        """冷却期过后开始第2次考试，通过后不再可补考"""
+        _start(client, auth_headers, test_exam)
+        first = _submit(client, auth_headers, test_exam, answer_sheet(correct=0)).json()
+
+        record = db_session.get(ExamRecord, first["exam_record_id"])
+        record.next_retake_at = datetime.utcnow() - timedelta(minutes=1)
+        db_session.commit()
+
+        response = _start(client, auth_headers, test_exam)
+        assert response.status_code == 200
+        assert response.json()["attempt_number"] == 2
+        assert response.json()["exam_record_id"] != first["exam_record_id"]
+
+        second = _submit(client, auth_headers, test_exam, answer_sheet()).json()
+        assert second["passed"] is True
+        assert second["can_retake"] is False
+        assert second["next_retake_at"] is None
+        assert db_session.get(ExamRecord, second["exam_record_id"]).status == ExamStatus.PASSED
+
+    def test_last_attempt_fails_without_retake(self, client, auth_headers, db_session, test_exam, answer_sheet):
+        """最后一次仍未通过：未通过（不再等待补考），不能再开考"""
+        test_exam.max_attempts = 1
+        db_session.commit()
+
+        _start(client, auth_headers, test_exam)
+        result = _submit(client, auth_headers, test_exam, answer_sheet(correct=0)).json()
+
+        assert result["can_retake"] is False
+        assert result["next_retake_at"] is None
+        assert db_session.get(ExamRecord, result["exam_record_id"]).status == ExamStatus.FAILED
+
+        response = _start(client, auth_headers, test_exam)
+        assert response.status_code == 400
+        assert "最大考试次数" in response.json()["detail"]
+
+    def test_no_retake_when_disabled(self, client, auth_headers, db_session, test_exam, answer_sheet):
+        test_exam.allow_retake = False
+        db_session.commit()
+
+        _start(client, auth_headers, test_exam)
+        result = _submit(client, auth_headers, test_exam, answer_sheet(correct=0)).json()
+
+        assert result["can_retake"] is False
+        assert db_session.get(ExamRecord, result["exam_record_id"]).status == ExamStatus.FAILED
@@ -0,0 +1,122 @@
+"""
+答题自动保存测试：写缓冲合并、交卷时与提交的答案合并、批量落库
+"""
+
+import pytest
+
+from app.core.database import SessionLocal
+from app.models.learning import ExamRecord
+from app.schemas.exam import AnswerSubmit, ExamSubmit
+from app.services import exam_service
+
+
+def _patch(client, headers, exam, answers):
+    return client.patch(f"/api/exams/{exam.id}/answers", headers=headers, json={
+        "answers": [{"question_id": qid, "user_answer": answer} for qid, answer in answers.items()]
+    })
+
+
+def _stored_draft(record_id):
+    """用独立会话读取已落库的草稿（不经过缓冲区）"""
+    with SessionLocal() as db:
+        return db.get(ExamRecord, record_id).draft_answers
+
+
+@pytest.mark.exam
+@pytest.mark.integration
+class TestAutosaveApi:
+    """PATCH/GET /api/exams/{exam_id}/answers"""
+
+    def test_patches_merge_by_question(self, client, auth_headers, test_exam, test_questions):
+        """多次保存按题目合并，同一题以最后一次为准"""
+        first, second, third = test_questions[:3]
+        client.post(f"/api/exams/{test_exam.id}/start", headers=auth_headers)
+
+        response = _patch(client, auth_headers, test_exam, {first.id: "A", second.id: "A"})
+        assert response.status_code == 200
+        assert response.json()["saved"] == 2
+        _patch(client, auth_headers, test_exam, {first.id: "B", third.id: "对"})
+
+        response = client.get(f"/api/exams/{test_exam.id}/answers", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json()["answers"] == {str(first.id): "B", str(second.id): "A", str(third.id): "对"}
+
+    def test_submit_merges_saved_answers(self, client, auth_headers, test_exam, test_questions, answer_sheet):
+        """交卷时合并已保存的答案，本次提交的答案优先"""
+        right = {a["question_id"]: a["user_answer"] for a in answer_sheet()}
+        wrong = {a["question_id"]: a["user_answer"] for a in answer_sheet(correct=0)}
+        saved, submitted = test_questions[:4], test_questions[2:]
+        client.post(f"/api/exams/{test_exam.id}/start", headers=auth_headers)
+
+        # 前4题保存正确答案，其中第3、4题随后提交错误答案；第5、6题只在提交时作答
+        _patch(client, auth_headers, test_exam, {q.id: right[q.id] for q in saved})
+        response = client.post("/api/exams/submit", headers=auth_headers, json={
+            "exam_id": test_exam.id,
+            "answers": [
+                {"question_id": q.id, "user_answer": wrong[q.id] if q in saved else right[q.id]}
+                for q in submitted
+            ]
+        })
+
+        assert response.status_code == 200
+        assert response.json()["correct_count"] == 4
+
+    def test_submit_with_saved_answers_only(self, client, auth_headers, test_exam, answer_sheet):
+        """只有自动保存的答案也可以交卷（掉线后重新进入直接交卷）"""
+        client.post(f"/api/exams/{test_exam.id}/start", headers=auth_headers)
+        _patch(client, auth_headers, test_exam, {a["question_id"]: a["user_answer"] for a in answer_sheet()})
+
+        response = client.post("/api/exams/submit", headers=auth_headers, json={"exam_id": test_exam.id, "answers": []})
+
+        assert response.status_code == 200
+        assert response.json()["score"] == 100
+
+    def test_requires_in_progress_exam(self, client, auth_headers, test_exam, test_questions):
+        response = _patch(client, auth_headers, test_exam, {test_questions[0].id: "B"})
+        assert response.status_code == 400
+
+        response = client.get(f"/api/exams/{test_exam.id}/answers", headers=auth_headers)
+        assert response.status_code == 404
+
+
+@pytest.mark.exam
+@pytest.mark.unit
+class TestAutosaveBuffer:
+    """写缓冲批量落库（不启动后台线程，手动刷新）"""
+
+    def test_write_behind_flush(self, db_session, test_user, test_exam, test_questions):
+        buffer = exam_service._autosave_buffer
+        record = exam_service.start_exam(db_session, test_user.id, test_exam.id)
+        flushes = buffer.flushes
+
+        for question in test_questions:
+            exam_service.autosave_answers(
+                db_session, test_user.id, test_exam.id, [AnswerSubmit(question_id=question.id, user_answer="A")]
+            )
+
+        # 同一场考试的补丁合并为一个键，尚未落库
+        assert buffer.stats()["pending_keys"] == 1
+        assert buffer.stats()["depth"] == len(test_questions)
+        assert _stored_draft(record.id) is None
+
+        assert buffer.flush() == 1
+        assert buffer.flushes == flushes + 1
+        assert _stored_draft(record.id) == {str(q.id): "A" for q in test_questions}
+
+        # 落库时与已保存的草稿合并
+        exam_service.autosave_answers(
+            db_session, test_user.id, test_exam.id, [AnswerSubmit(question_id=test_questions[0].id, user_answer="B")]
+        )
+        buffer.flush()
+        assert _stored_draft(record.id)[str(test_questions[0].id)] == "B"
+        assert len(_stored_draft(record.id)) == len(test_questions)
+
+    def test_patches_for_submitted_record_dropped(self, db_session, test_user, test_exam, test_questions, answer_sheet):
+        """交卷后才落库的补丁直接丢弃，不改动已交卷记录"""
+        record = exam_service.start_exam(db_session, test_user.id, test_exam.id)
+        exam_service.submit_exam(db_session, test_user.id, ExamSubmit(exam_id=test_exam.id, answers=answer_sheet()))
+        exam_service._autosave_buffer.put(record.id, {str(test_questions[0].id): "A"})
+
+        exam_service._autosave_buffer.flush()
+
+        assert not _stored_draft(record.id)
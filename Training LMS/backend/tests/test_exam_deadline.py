@@ -0,0 +1,99 @@
+"""
+限时考试到时自动交卷测试（截止时间堆 + 按已保存答案判分）
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.learning import ExamRecord, ExamStatus
+from app.schemas.exam import AnswerSubmit, ExamSubmit
+from app.services import exam_service
+from app.utils.deadline import to_timestamp
+
+
+@pytest.fixture
+def timed_exam(db_session, test_exam):
+    """限时10分钟的测试考试"""
+    test_exam.time_limit = 10
+    db_session.commit()
+    return test_exam
+
+
+def _record(record_id):
+    with SessionLocal() as db:
+        return db.get(ExamRecord, record_id)
+
+
+@pytest.mark.exam
+@pytest.mark.integration
+class TestAutoSubmit:
+
+    def test_deadline_scheduled_on_start(self, db_session, test_user, timed_exam):
+        record = exam_service.start_exam(db_session, test_user.id, timed_exam.id)
+
+        deadline = exam_service.get_exam_deadline(timed_exam, record)
+        assert deadline == record.started_at + timedelta(minutes=10, seconds=settings.EXAM_AUTO_SUBMIT_GRACE_SECONDS)
+        assert exam_service._deadline_scheduler._deadlines[record.id] == to_timestamp(deadline)
+
+    def test_untimed_exam_not_scheduled(self, db_session, test_user, test_exam):
+        record = exam_service.start_exam(db_session, test_user.id, test_exam.id)
+
+        assert exam_service.get_exam_deadline(test_exam, record) is None
+        assert record.id not in exam_service._deadline_scheduler._deadlines
+
+    def test_expired_attempt_graded_from_saved_answers(self, db_session, test_user, timed_exam, answer_sheet):
+        """到时按已自动保存（含缓冲区中未落库）的答案判分"""
+        record = exam_service.start_exam(db_session, test_user.id, timed_exam.id)
+        exam_service.autosave_answers(
+            db_session, test_user.id, timed_exam.id, [AnswerSubmit(**a) for a in answer_sheet()[:4]]
+        )
+
+        deadline = exam_service.get_exam_deadline(timed_exam, record)
+        assert exam_service._deadline_scheduler.run_due(to_timestamp(deadline) - 1) == 0
+        assert exam_service._deadline_scheduler.run_due(to_timestamp(deadline)) == 1
+
+        graded = _record(record.id)
+        assert graded.correct_answers == 4
+        assert graded.submitted_at is not None
+        assert graded.status == ExamStatus.PASSED
+        assert round(graded.score, 1) == 66.7
+
+    def test_submitted_attempt_skipped(self, db_session, test_user, timed_exam, answer_sheet):
+        """交卷时取消截止时间；已交卷的记录即使到期也不会重复判分"""
+        record = exam_service.start_exam(db_session, test_user.id, timed_exam.id)
+        exam_service.submit_exam(db_session, test_user.id, ExamSubmit(exam_id=timed_exam.id, answers=answer_sheet()))
+        assert record.id not in exam_service._deadline_scheduler._deadlines
+
+        graded_at = _record(record.id).graded_at
+        exam_service.auto_submit_expired([record.id])
+
+        graded = _record(record.id)
+        assert graded.status == ExamStatus.PASSED
+        assert graded.score == 100
+        assert graded.graded_at == graded_at
+
+    def test_deadlines_reloaded_from_database(self, db_session, test_user, timed_exam):
+        """重启后从数据库重建：只加载限时考试中进行中的记录"""
+        record = exam_service.start_exam(db_session, test_user.id, timed_exam.id)
+
+        deadlines = dict(exam_service.load_exam_deadlines())
+
+        assert deadlines == {record.id: exam_service.get_exam_deadline(timed_exam, record)}
+
+    def test_expired_before_restart(self, db_session, test_user, timed_exam):
+        """停机期间已到期的考试，启动重建后立即自动交卷"""
+        record = exam_service.start_exam(db_session, test_user.id, timed_exam.id)
+        record.started_at = datetime.utcnow() - timedelta(hours=1)
+        db_session.commit()
+        scheduler = exam_service._deadline_scheduler
+
+        assert scheduler.reload() == 1
+        assert scheduler.stats()["overdue"] == 1
+        assert scheduler.run_due() == 1
+
+        graded = _record(record.id)
+        assert graded.status == ExamStatus.PENDING_RETAKE
+        assert graded.correct_answers == 0
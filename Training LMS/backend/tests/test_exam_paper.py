@@ -0,0 +1,95 @@
+"""
+试卷缓存测试：不含答案的预编码试卷、ETag/304、编辑题目后缓存失效
+"""
+
+import json
+
+import pytest
+
+from app.models.exam import Question
+from app.services import paper_service
+
+
+def _start(client, headers, exam):
+    return client.post(f"/api/exams/{exam.id}/start", headers=headers)
+
+
+def _paper(client, headers, exam, etag=None):
+    return client.get(
+        f"/api/exams/{exam.id}/paper",
+        headers={**headers, "If-None-Match": etag} if etag else headers
+    )
+
+
+@pytest.mark.exam
+@pytest.mark.integration
+class TestExamPaper:
+    """GET /api/exams/{exam_id}/paper"""
+
+    def test_paper_has_no_answers(self, client, auth_headers, test_exam, test_questions):
+        response = _start(client, auth_headers, test_exam)
+        assert response.status_code == 200
+
+        data = response.json()
+        assert [q["id"] for q in data["questions"]] == [q.id for q in test_questions]
+        for key in ("correct_answer", "is_correct"):
+            assert key not in response.text
+        assert all(q["explanation"] is None for q in data["questions"])
+        assert data["questions"][0]["options"][0] == {"label": "A", "content": "门内"}
+
+    def test_etag_and_not_modified(self, client, auth_headers, test_exam):
+        etag = _start(client, auth_headers, test_exam).headers["ETag"]
+
+        response = _paper(client, auth_headers, test_exam)
+        assert response.status_code == 200
+        assert response.headers["ETag"] == etag
+        assert response.json()["message"] == "考试进行中"
+
+        response = _paper(client, auth_headers, test_exam, etag)
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+
+        response = _paper(client, auth_headers, test_exam, '"stale"')
+        assert response.status_code == 200
+
+    def test_no_in_progress_exam(self, client, auth_headers, test_exam):
+        response = _paper(client, auth_headers, test_exam)
+        assert response.status_code == 404
+
+    def test_fixed_paper_cached_across_users(self, client, auth_headers, admin_headers, test_exam):
+        """固定考题所有考生共用同一份编码好的试卷"""
+        first = _start(client, auth_headers, test_exam)
+        hits = paper_service._paper_cache.hits
+        second = _start(client, admin_headers, test_exam)
+
+        assert second.headers["ETag"] == first.headers["ETag"]
+        assert paper_service._paper_cache.hits > hits
+
+    def test_question_edit_invalidates_paper(self, client, auth_headers, admin_headers, test_exam, test_questions):
+        """通过API编辑题目：缓存的试卷字节失效，ETag变化"""
+        etag = _start(client, auth_headers, test_exam).headers["ETag"]
+        question = test_questions[0]
+
+        response = client.put(f"/api/exams/questions/{question.id}", headers=admin_headers, json={
+            "content": "修改后的题干"
+        })
+        assert response.status_code == 200
+
+        response = _paper(client, auth_headers, test_exam, etag)
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        rendered = next(q for q in response.json()["questions"] if q["id"] == question.id)
+        assert rendered["content"] == "修改后的题干"
+
+    def test_direct_edit_changes_revision(self, client, auth_headers, db_session, test_exam, test_questions):
+        """直接改库（未调用失效函数）：按题目 updated_at 计算的版本号变化，同样重新编码"""
+        etag = _start(client, auth_headers, test_exam).headers["ETag"]
+
+        question = db_session.get(Question, test_questions[1].id)
+        question.content = "脚本修改的题干"
+        db_session.commit()
+
+        response = _paper(client, auth_headers, test_exam, etag)
+        assert response.status_code == 200
+        assert "脚本修改的题干" in json.dumps(response.json(), ensure_ascii=False)
@@ -0,0 +1,102 @@
+"""
+试卷快照测试：开考时冻结答案，考试中编辑题目不影响本场判分和成绩详情
+"""
+
+import pytest
+
+from app.models.learning import ExamRecord
+from app.services import grading_service
+
+
+def _single_choice(questions):
+    return next(q for q in questions if q.question_type.value == "single_choice")
+
+
+def _edit_answer(db_session, question):
+    """直接改库修改答案（脚本/后台改题，不触发重新判分），同时修改题干、选项内容和解析"""
+    question.content = "修改后的题干"
+    question.options = [
+        {"label": "A", "content": "门内（改）", "is_correct": False},
+        {"label": "B", "content": "门口一侧（改）", "is_correct": False},
+        {"label": "C", "content": "吧台后（改）", "is_correct": True},
+    ]
+    question.correct_answer = "C"
+    question.explanation = "修改后的解析"
+    db_session.commit()
+
+
+@pytest.mark.exam
+@pytest.mark.integration
+class TestPaperSnapshot:
+    """开考冻结的试卷快照"""
+
+    def test_snapshot_records_answer(self, client, auth_headers, db_session, test_exam, test_questions):
+        response = client.post(f"/api/exams/{test_exam.id}/start", headers=auth_headers)
+        assert response.status_code == 200
+
+        record = db_session.get(ExamRecord, response.json()["exam_record_id"])
+        snapshot = record.paper_snapshot
+        assert snapshot["version"] == grading_service.SNAPSHOT_VERSION
+        assert [item["id"] for item in snapshot["items"]] == [q.id for q in test_questions]
+
+        item = next(item for item in snapshot["items"] if item["id"] == _single_choice(test_questions).id)
+        assert item["options"] == ["A", "B", "C"]
+        assert item["correct"] == ["B"]
+        assert item["answer"] == "B"
+
+    def test_edit_mid_attempt_uses_snapshot(self, client, auth_headers, db_session, test_exam, test_questions, answer_sheet):
+        """考试中修改答案：交卷成绩和成绩详情都按开考时的答案"""
+        response = client.post(f"/api/exams/{test_exam.id}/start", headers=auth_headers)
+        assert response.status_code == 200
+
+        question = _single_choice(test_questions)
+        _edit_answer(db_session, question)
+
+        response = client.post("/api/exams/submit", headers=auth_headers, json={
+            "exam_id": test_exam.id,
+            "answers": answer_sheet()
+        })
+        assert response.status_code == 200
+        result = response.json()
+        assert result["correct_count"] == len(test_questions)
+        assert result["score"] == 100
+
+        response = client.get(f"/api/exams/{test_exam.id}/result", headers=auth_headers)
+        assert response.status_code == 200
+        detail = next(d for d in response.json()["question_details"] if d["question_id"] == question.id)
+
+        assert detail["is_correct"] is True
+        assert detail["correct_answer"] == "B"
+        assert [(opt["label"], opt["is_correct"]) for opt in detail["options"]] == [
+            ("A", False), ("B", True), ("C", False)
+        ]
+        # 题干、选项内容和解析取题目当前内容
+        assert detail["content"] == "修改后的题干"
+        assert detail["options"][1]["content"] == "门口一侧（改）"
+        assert detail["explanation"] == "修改后的解析"
+
+    def test_legacy_snapshot_uses_live_answer(self, client, auth_headers, db_session, test_exam, test_questions, answer_sheet):
+        """版本1快照没有记录答案，成绩详情按题目当前答案展示"""
+        response = client.post(f"/api/exams/{test_exam.id}/start", headers=auth_headers)
+        record = db_session.get(ExamRecord, response.json()["exam_record_id"])
+        record.paper_snapshot = {
+            "version": 1,
+            "items": [
+                {key: value for key, value in item.items() if key not in ("correct", "answer")}
+                for item in record.paper_snapshot["items"]
+            ]
+        }
+        db_session.commit()
+
+        response = client.post("/api/exams/submit", headers=auth_headers, json={
+            "exam_id": test_exam.id,
+            "answers": answer_sheet()
+        })
+        assert response.json()["score"] == 100
+
+        question = _single_choice(test_questions)
+        _edit_answer(db_session, question)
+
+        response = client.get(f"/api/exams/{test_exam.id}/result", headers=auth_headers)
+        detail = next(d for d in response.json()["question_details"] if d["question_id"] == question.id)
+        assert detail["correct_answer"] == "C"
@@ -0,0 +1,133 @@
+"""
+判分引擎测试（grading_service）
+"""
+
+import pytest
+from sqlalchemy import event
+
+from app.core.database import engine
+from app.schemas.exam import AnswerSubmit
+from app.services import grading_service
+
+
+def _sheet(*pairs):
+    return [AnswerSubmit(question_id=question_id, user_answer=answer) for question_id, answer in pairs]
+
+
+def _by_type(questions, question_type):
+    return [q for q in questions if q.question_type.value == question_type]
+
+
+@pytest.mark.exam
+@pytest.mark.unit
+class TestGradeAnswerSheet:
+    """整卷判分"""
+
+    def test_single_choice(self, db_session, test_questions):
+        """单选题：去除首尾空格后与答案标签比较"""
+        first, second = _by_type(test_questions, "single_choice")
+
+        correct, details = grading_service.grade_answer_sheet(db_session, _sheet((first.id, " B "), (second.id, "A")))
+
+        assert correct == 1
+        assert [d["is_correct"] for d in details] == [True, False]
+
+    @pytest.mark.parametrize("answer,expected", [
+        ("A,C", True),
+        ("C,A", True),
+        (" A , C ", True),
+        ("A", False),
+        ("A,B,C", False),
+        ("", False),
+    ])
+    def test_multiple_choice(self, db_session, test_questions, answer, expected):
+        """多选题：选项集合完全一致才算对，与顺序、空格无关"""
+        question = _by_type(test_questions, "multiple_choice")[0]
+
+        correct, details = grading_service.grade_answer_sheet(db_session, _sheet((question.id, answer)))
+
+        assert correct == int(expected)
+        assert details[0]["is_correct"] is expected
+
+    @pytest.mark.parametrize("answer,expected", [
+        ("对", True), ("√", True), ("yes", True), ("TRUE", True), ("正确", True),
+        ("错", False), ("×", False), ("no", False), ("false", False), ("不知道", False),
+    ])
+    def test_true_false_tokens(self, db_session, test_questions, answer, expected):
+        """判断题：中英文写法统一归一化（题目答案存的是“对”）"""
+        question = _by_type(test_questions, "true_false")[0]
+
+        correct, details = grading_service.grade_answer_sheet(db_session, _sheet((question.id, answer)))
+
+        assert correct == int(expected)
+        assert details[0]["is_correct"] is expected
+
+    def test_unknown_question_ids_skipped(self, db_session, test_questions):
+        """不存在的题目不计分，也不出现在答题详情中"""
+        question = _by_type(test_questions, "single_choice")[0]
+
+        correct, details = grading_service.grade_answer_sheet(db_session, _sheet((question.id, "B"), (999999, "B")))
+
+        assert correct == 1
+        assert [d["question_id"] for d in details] == [question.id]
+
+    def test_details_keep_submission_order(self, db_session, test_questions):
+        """答题详情按提交顺序返回，格式与 ExamRecord.answers 一致"""
+        pairs = [(q.id, "B") for q in reversed(test_questions)]
+
+        _, details = grading_service.grade_answer_sheet(db_session, _sheet(*pairs))
+
+        assert [d["question_id"] for d in details] == [question_id for question_id, _ in pairs]
+        assert set(details[0]) == {"question_id", "user_answer", "is_correct"}
+
+    def test_whole_sheet_loaded_in_one_query(self, db_session, test_questions):
+        """整卷题目一次查询批量加载"""
+        db_session.expunge_all()
+        statements = []
+
+        def count(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            correct, _ = grading_service.grade_answer_sheet(
+                db_session, _sheet(*[(q.id, "B") for q in test_questions])
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+
+        assert correct == 2
+        assert len(statements) == 1
+
+    def test_empty_sheet(self, db_session):
+        assert grading_service.grade_answer_sheet(db_session, []) == (0, [])
+
+
+@pytest.mark.exam
+@pytest.mark.unit
+class TestAnswerKeyCache:
+    """答案键缓存"""
+
+    def test_cached_by_question_version(self, db_session, test_questions):
+        """同一版本只编译一次；题目编辑后 updated_at 变化，重新编译"""
+        question = _by_type(test_questions, "single_choice")[0]
+        hits = grading_service._answer_key_cache.hits
+
+        assert grading_service.check_answer(question, "B")
+        assert grading_service.check_answer(question, "B")
+        assert grading_service._answer_key_cache.hits == hits + 1
+
+        question.correct_answer = "C"
+        db_session.commit()
+        db_session.refresh(question)
+
+        assert grading_service.check_answer(question, "C")
+        assert not grading_service.check_answer(question, "B")
+
+    def test_invalidate_answer_key(self, db_session, test_questions):
+        question = _by_type(test_questions, "single_choice")[0]
+        grading_service.check_answer(question, "B")
+
+        assert grading_service.invalidate_answer_key(question.id) == 1
+        assert grading_service.invalidate_answer_key(question.id) == 0
@@ -0,0 +1,161 @@
+"""
+学习事件批量同步测试：乱序到达、重传幂等、不存在的对象跳过；进度行获取或创建
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.database import SessionLocal
+from app.models.learning import ChapterProgress, CourseProgress, LearningStatus
+from app.schemas.learning import LearningEvent
+from app.services import learning_service
+
+
+def _event(type, target, target_id, occurred_at=None):
+    return LearningEvent(type=type, target=target, target_id=target_id, occurred_at=occurred_at)
+
+
+def _progress(model, **filters):
+    with SessionLocal() as db:
+        return db.query(model).filter_by(**filters).all()
+
+
+@pytest.mark.learning
+@pytest.mark.integration
+class TestSyncLearningEvents:
+
+    def test_out_of_order_events(self, db_session, test_user, test_course):
+        """按客户端时间应用：完成事件先到、开始事件后到，结果与按顺序到达一致"""
+        chapter_id = test_course.chapters[0].id
+        t0 = datetime.utcnow().replace(microsecond=0) - timedelta(hours=1)
+        events = [
+            _event("complete", "chapter", chapter_id, t0 + timedelta(minutes=10)),
+            _event("start", "chapter", chapter_id, t0 + timedelta(minutes=5)),
+            _event("start", "course", test_course.id, t0),
+        ]
+
+        result = learning_service.sync_learning_events(db_session, test_user.id, events)
+
+        assert (result["accepted"], result["rejected"]) == (3, [])
+        (chapter,) = _progress(ChapterProgress, user_id=test_user.id, chapter_id=chapter_id)
+        assert chapter.status == LearningStatus.COMPLETED
+        assert chapter.started_at == t0 + timedelta(minutes=5)
+        assert chapter.completed_at == t0 + timedelta(minutes=10)
+        (course,) = _progress(CourseProgress, user_id=test_user.id, course_id=test_course.id)
+        assert course.started_at == t0
+        assert course.completed_chapters == 1
+        assert course.status == LearningStatus.IN_PROGRESS
+
+    def test_resend_is_idempotent(self, db_session, test_user, test_course):
+        chapter_id = test_course.chapters[0].id
+        events = [_event("start", "chapter", chapter_id), _event("complete", "chapter", chapter_id)]
+
+        learning_service.sync_learning_events(db_session, test_user.id, events)
+        result = learning_service.sync_learning_events(db_session, test_user.id, events)
+
+        assert result["accepted"] == 2
+        assert [c.completed_chapters for c in result["courses"]] == [1]
+        assert len(result["chapters"]) == 1
+
+    def test_future_time_uses_server_time(self, db_session, test_user, test_course):
+        before = datetime.utcnow()
+        learning_service.sync_learning_events(db_session, test_user.id, [
+            _event("start", "course", test_course.id, before + timedelta(days=1))
+        ])
+
+        (course,) = _progress(CourseProgress, user_id=test_user.id, course_id=test_course.id)
+        assert before <= course.started_at <= datetime.utcnow()
+
+    def test_missing_target_rejected_without_aborting_batch(self, db_session, test_user, test_course):
+        """不存在的章节返回 rejected，同批其他事件照常应用并提交"""
+        events = [
+            _event("start", "course", test_course.id),
+            _event("complete", "chapter", 99999),
+            _event("start", "course", 99999),
+            _event("complete", "chapter", test_course.chapters[0].id),
+        ]
+
+        result = learning_service.sync_learning_events(db_session, test_user.id, events)
+
+        assert result["accepted"] == 2
+        assert result["rejected"] == [
+            {"index": 1, "detail": "章节 ID 99999 不存在"},
+            {"index": 2, "detail": "课程 ID 99999 不存在"},
+        ]
+        (course,) = _progress(CourseProgress, user_id=test_user.id)
+        assert course.completed_chapters == 1
+
+    def test_complete_course(self, db_session, test_user, test_course):
+        """完成课程事件逐个完成剩余章节"""
+        learning_service.sync_learning_events(db_session, test_user.id, [
+            _event("complete", "chapter", test_course.chapters[0].id),
+            _event("complete", "course", test_course.id),
+        ])
+
+        chapters = _progress(ChapterProgress, user_id=test_user.id)
+        assert len(chapters) == 3
+        assert all(c.status == LearningStatus.COMPLETED for c in chapters)
+        (course,) = _progress(CourseProgress, user_id=test_user.id)
+        assert (course.completed_chapters, course.progress_percentage, course.status) == (3, 100.0, LearningStatus.COMPLETED)
+
+    def test_sync_api(self, client, auth_headers, test_course):
+        response = client.post("/api/learning/events/sync", headers=auth_headers, json={"events": [
+            {"type": "start", "target": "chapter", "target_id": test_course.chapters[0].id},
+            {"type": "start", "target": "chapter", "target_id": 99999},
+        ]})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["accepted"] == 1
+        assert data["rejected"] == [{"index": 1, "detail": "章节 ID 99999 不存在"}]
+        assert [c["course_id"] for c in data["courses"]] == [test_course.id]
+        assert data["courses"][0]["status"] == "in_progress"
+
+
+@pytest.mark.learning
+@pytest.mark.integration
+class TestGetOrCreateProgress:
+    """INSERT ... ON CONFLICT ... RETURNING 获取或创建进度行"""
+
+    def test_course_progress_single_row(self, db_session, test_user, test_course):
+        first = learning_service.get_or_create_course_progress(db_session, test_user.id, test_course.id)
+        second = learning_service.get_or_create_course_progress(db_session, test_user.id, test_course.id)
+
+        assert first.id == second.id
+        assert (first.status, first.total_chapters, first.completed_chapters) == (LearningStatus.NOT_STARTED, 3, 0)
+        assert len(_progress(CourseProgress, user_id=test_user.id)) == 1
+
+    def test_existing_progress_returned_unchanged(self, db_session, test_user, test_course):
+        learning_service.start_course(db_session, test_user.id, test_course.id)
+
+        progress = learning_service.get_or_create_course_progress(db_session, test_user.id, test_course.id)
+
+        assert progress.status == LearningStatus.IN_PROGRESS
+        assert progress.started_at is not None
+
+    def test_chapter_progress_single_row(self, db_session, test_user, test_course):
+        chapter = test_course.chapters[1]
+
+        first = learning_service.get_or_create_chapter_progress(db_session, test_user.id, chapter.id)
+        second = learning_service.get_or_create_chapter_progress(db_session, test_user.id, chapter.id)
+
+        assert first.id == second.id
+        assert (first.course_id, first.total_contents, first.completed_contents) == (test_course.id, 1, 0)
+        assert len(_progress(ChapterProgress, user_id=test_user.id)) == 1
+
+    def test_missing_course_404(self, db_session, test_user):
+        with pytest.raises(HTTPException) as exc_info:
+            learning_service.get_or_create_course_progress(db_session, test_user.id, 99999)
+
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.detail == "课程 ID 99999 不存在"
+        assert _progress(CourseProgress, user_id=test_user.id) == []
+
+    def test_missing_chapter_404(self, client, auth_headers, test_user):
+        response = client.post("/api/learning/chapters/99999/start", headers=auth_headers)
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == "章节 ID 99999 不存在"
+        assert _progress(ChapterProgress, user_id=test_user.id) == []
@@ -0,0 +1,178 @@
+"""
+学习汇总测试：增量更新的计数与按进度表重新统计的结果一致、重建脚本
+"""
+
+import importlib.util
+import os
+import sys
+
+import pytest
+from sqlalchemy import update
+
+from app.core.database import SessionLocal
+from app.models.course import Course
+from app.models.learning import LearningStatus, LearningSummary
+from app.models.user import DepartmentType
+from app.schemas.learning import ChapterProgressUpdate, CourseProgressUpdate, LearningEvent
+from app.services import learning_service
+from app.services.learning_service import SUMMARY_FIELDS
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(__file__), "..", "scripts")
+
+
+def _summary(user_id):
+    """(汇总行中的计数, 按进度表重新统计的计数)"""
+    with SessionLocal() as db:
+        summary = db.get(LearningSummary, user_id)
+        stored = {field: getattr(summary, field) for field in SUMMARY_FIELDS} if summary else None
+        return stored, learning_service.count_learning_summaries(db, [user_id])[user_id]
+
+
+def _assert_consistent(user_id, **expected):
+    stored, counted = _summary(user_id)
+    assert stored == counted
+    for field, value in expected.items():
+        assert stored[field] == value, field
+
+
+@pytest.fixture
+def empty_course(db_session):
+    """没有章节的课程（完成课程时直接标记为已完成）"""
+    course = Course(
+        title="服务礼仪",
+        code="FH_TEST_002",
+        department_type=DepartmentType.FRONT_HALL,
+        is_published=True
+    )
+    db_session.add(course)
+    db_session.commit()
+    return course
+
+
+@pytest.mark.learning
+@pytest.mark.integration
+class TestSummaryDeltas:
+    """每次进度写入后汇总行都与重新统计的结果一致"""
+
+    def test_chapter_and_course_completion(self, db_session, test_user, test_course):
+        user_id = test_user.id
+        chapters = test_course.chapters
+
+        learning_service.start_chapter(db_session, user_id, chapters[0].id)
+        _assert_consistent(user_id, total_courses=1, in_progress_courses=1, total_chapters=1, completed_chapters=0)
+
+        learning_service.complete_chapter(db_session, user_id, chapters[0].id)
+        _assert_consistent(user_id, total_chapters=1, completed_chapters=1)
+
+        learning_service.complete_chapter(db_session, user_id, chapters[1].id)
+        learning_service.complete_chapter(db_session, user_id, chapters[2].id)
+        _assert_consistent(user_id, total_courses=1, in_progress_courses=0, completed_courses=1,
+                           total_chapters=3, completed_chapters=3)
+
+    def test_recomplete_not_counted_twice(self, db_session, test_user, test_course):
+        user_id = test_user.id
+        for chapter in test_course.chapters:
+            learning_service.complete_chapter(db_session, user_id, chapter.id)
+
+        learning_service.complete_chapter(db_session, user_id, test_course.chapters[0].id)
+        learning_service.sync_learning_events(db_session, user_id, [
+            LearningEvent(type="complete", target="course", target_id=test_course.id),
+            LearningEvent(type="start", target="course", target_id=test_course.id),
+        ])
+
+        _assert_consistent(user_id, total_courses=1, completed_courses=1, total_chapters=3, completed_chapters=3)
+
+    def test_uncomplete_and_status_update(self, db_session, test_user, test_course):
+        """章节改回学习中、直接修改课程状态：计数随之增减"""
+        user_id = test_user.id
+        for chapter in test_course.chapters:
+            learning_service.complete_chapter(db_session, user_id, chapter.id)
+
+        learning_service.update_chapter_progress(
+            db_session, user_id, test_course.chapters[0].id,
+            ChapterProgressUpdate(status=LearningStatus.IN_PROGRESS)
+        )
+        _assert_consistent(user_id, in_progress_courses=1, completed_courses=0, completed_chapters=2)
+
+        learning_service.update_course_progress(
+            db_session, user_id, test_course.id, CourseProgressUpdate(status=LearningStatus.COMPLETED)
+        )
+        _assert_consistent(user_id, in_progress_courses=0, completed_courses=1)
+
+    def test_course_without_chapters(self, db_session, test_user, test_course, empty_course):
+        user_id = test_user.id
+        learning_service.start_course(db_session, user_id, test_course.id)
+
+        learning_service.sync_learning_events(db_session, user_id, [
+            LearningEvent(type="complete", target="course", target_id=empty_course.id),
+            LearningEvent(type="complete", target="course", target_id=empty_course.id),
+        ])
+
+        _assert_consistent(user_id, total_courses=2, in_progress_courses=1, completed_courses=1, total_chapters=0)
+
+    def test_seeded_from_existing_progress(self, db_session, test_user, test_course):
+        """汇总上线前已有进度：首次写入时按进度表统计写入，本次修改不重复累加"""
+        user_id = test_user.id
+        learning_service.complete_chapter(db_session, user_id, test_course.chapters[0].id)
+        db_session.query(LearningSummary).delete()
+        db_session.commit()
+
+        learning_service.complete_chapter(db_session, user_id, test_course.chapters[1].id)
+
+        _assert_consistent(user_id, total_courses=1, in_progress_courses=1, total_chapters=2, completed_chapters=2)
+
+    def test_stats_api(self, client, auth_headers, db_session, test_user, test_course, empty_course):
+        """没有汇总行时读取统计也会写入汇总行"""
+        assert _summary(test_user.id)[0] is None
+
+        response = client.get("/api/learning/stats", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json()["total_courses"] == 0
+        _assert_consistent(test_user.id)
+
+        learning_service.complete_chapter(db_session, test_user.id, test_course.chapters[0].id)
+        learning_service.sync_learning_events(db_session, test_user.id, [
+            LearningEvent(type="complete", target="course", target_id=empty_course.id)
+        ])
+        data = client.get("/api/learning/stats", headers=auth_headers).json()
+        assert (data["total_courses"], data["completed_courses"], data["overall_progress"]) == (2, 1, 50.0)
+
+
+def _load_rebuild_script():
+    path = os.path.join(SCRIPTS_DIR, "rebuild_learning_summaries.py")
+    spec = importlib.util.spec_from_file_location("rebuild_learning_summaries", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.integration
+class TestRebuildScript:
+    """scripts/rebuild_learning_summaries.py"""
+
+    @pytest.fixture
+    def drifted(self, db_session, test_user, test_course):
+        """直接改库造成汇总行与进度不一致"""
+        learning_service.complete_chapter(db_session, test_user.id, test_course.chapters[0].id)
+        db_session.execute(update(LearningSummary).values(completed_chapters=5, total_courses=0))
+        db_session.commit()
+
+    def _run(self, monkeypatch, *args):
+        monkeypatch.setattr(sys, "argv", ["rebuild_learning_summaries.py", *args])
+        _load_rebuild_script().main()
+
+    def test_preview_writes_nothing(self, monkeypatch, capsys, test_user, drifted):
+        self._run(monkeypatch)
+
+        out = capsys.readouterr().out
+        assert f"用户#{test_user.id}: total_courses 0→1，completed_chapters 5→1" in out
+        assert "1 个用户的学习汇总与进度不一致" in out
+        assert _summary(test_user.id)[0]["completed_chapters"] == 5
+
+    def test_apply_and_rerun(self, monkeypatch, capsys, test_user, drifted):
+        self._run(monkeypatch, "--apply", "--user-id", str(test_user.id))
+        assert "已修正 1 个用户的学习汇总" in capsys.readouterr().out
+        _assert_consistent(test_user.id, completed_chapters=1)
+
+        self._run(monkeypatch, "--apply")
+        assert "1 个用户的学习汇总与进度一致" in capsys.readouterr().out
@@ -0,0 +1,113 @@
+"""
+题目选项格式测试：写入时统一为标准格式，未迁移的旧数据读取时兼容
+"""
+
+import pytest
+from sqlalchemy import update
+
+from app.models.exam import Question
+from app.services import grading_service
+from app.utils.question_options import normalize_options, read_options
+
+
+LEGACY_OPTIONS = [
+    # 字典格式，正确答案只在 correct_answer 中
+    ({"A": "门内", "B": "门口一侧", "C": "吧台后"}, "B"),
+    # 列表格式但缺少 is_correct、使用 text 字段名
+    ([{"label": "A", "text": "门内"}, {"label": "B", "text": "门口一侧"}, {"label": "C", "text": "吧台后"}], "B"),
+]
+
+
+def _write_raw_options(db_session, question, options, correct_answer):
+    """绕过模型校验直接改库（模拟格式统一之前写入的旧数据）"""
+    db_session.execute(
+        update(Question).where(Question.id == question.id).values(options=options, correct_answer=correct_answer)
+    )
+    db_session.commit()
+    db_session.expire_all()
+
+
+def _single_choice(questions):
+    return next(q for q in questions if q.question_type.value == "single_choice")
+
+
+@pytest.mark.unit
+class TestReadOptions:
+
+    def test_canonical_returned_as_is(self):
+        options = normalize_options([{"label": "A", "content": "x", "is_correct": True}])
+        assert read_options(options, "A") is options
+
+    @pytest.mark.parametrize("options,correct_answer", LEGACY_OPTIONS)
+    def test_legacy_formats(self, options, correct_answer):
+        assert read_options(options, correct_answer) == [
+            {"label": "A", "content": "门内", "is_correct": False},
+            {"label": "B", "content": "门口一侧", "is_correct": True},
+            {"label": "C", "content": "吧台后", "is_correct": False},
+        ]
+
+    def test_unrecognized_items_skipped(self):
+        options = [{"label": "A"}, "B", {"content": "无标签"}, {"label": "C", "is_correct": True}]
+        assert read_options(options) == [
+            {"label": "A", "content": "", "is_correct": False},
+            {"label": "C", "content": "", "is_correct": True},
+        ]
+
+    def test_none_and_garbage(self):
+        assert read_options(None) is None
+        assert read_options("A,B") == []
+
+
+@pytest.mark.exam
+@pytest.mark.integration
+class TestLegacyOptionRows:
+    """未迁移的旧题目：判分、出卷、成绩详情不报错"""
+
+    @pytest.mark.parametrize("options,correct_answer", LEGACY_OPTIONS)
+    def test_answer_key_and_snapshot(self, db_session, test_questions, options, correct_answer):
+        question = _single_choice(test_questions)
+        _write_raw_options(db_session, question, options, correct_answer)
+        question = db_session.get(Question, question.id)
+
+        assert grading_service.compile_answer_key(question).labels == frozenset(["B"])
+        item = grading_service.build_snapshot_item(question)
+        assert item["options"] == ["A", "B", "C"]
+        assert item["correct"] == ["B"]
+
+    def test_flags_without_correct_answer(self, db_session, test_questions):
+        """旧数据只有 is_correct 标记、没有 correct_answer"""
+        question = _single_choice(test_questions)
+        _write_raw_options(db_session, question, [
+            {"label": "A", "text": "门内", "is_correct": False},
+            {"label": "B", "text": "门口一侧", "is_correct": True},
+        ], None)
+        question = db_session.get(Question, question.id)
+
+        assert grading_service.check_answer(question, "B")
+
+    @pytest.mark.parametrize("options,correct_answer", LEGACY_OPTIONS)
+    def test_exam_round_trip(self, client, auth_headers, db_session, test_exam, test_questions, answer_sheet,
+                             options, correct_answer):
+        question = _single_choice(test_questions)
+        _write_raw_options(db_session, question, options, correct_answer)
+
+        response = client.post(f"/api/exams/{test_exam.id}/start", headers=auth_headers)
+        assert response.status_code == 200
+        rendered = next(q for q in response.json()["questions"] if q["id"] == question.id)
+        assert rendered["options"] == [
+            {"label": "A", "content": "门内"},
+            {"label": "B", "content": "门口一侧"},
+            {"label": "C", "content": "吧台后"},
+        ]
+
+        response = client.post("/api/exams/submit", headers=auth_headers, json={
+            "exam_id": test_exam.id,
+            "answers": answer_sheet()
+        })
+        assert response.status_code == 200
+        assert response.json()["score"] == 100
+
+        response = client.get(f"/api/exams/{test_exam.id}/result", headers=auth_headers)
+        assert response.status_code == 200
+        detail = next(d for d in response.json()["question_details"] if d["question_id"] == question.id)
+        assert [opt["is_correct"] for opt in detail["options"]] == [False, True, False]
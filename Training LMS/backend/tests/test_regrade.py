@@ -0,0 +1,204 @@
+"""
+重新判分测试：任务状态流转、按 last_record_id 续跑、成绩与补考字段
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core.database import SessionLocal
+from app.models.exam import Exam, ExamType
+from app.models.learning import ExamRecord, ExamStatus
+from app.models.regrade import RegradeJob, RegradeReason, RegradeStatus
+from app.models.user import User, DepartmentType
+from app.schemas.exam import AnswerSubmit, ExamSubmit, ExamUpdate, QuestionUpdate
+from app.services import exam_service, regrade_service
+from app.services.grading_service import apply_score
+
+
+@pytest.fixture
+def graded_records(db_session, test_exam, answer_sheet):
+    """3名学员交卷：分别答对6、5、4题（第1题单选题都答B）"""
+    records = []
+    for index, correct in enumerate((6, 5, 4)):
+        user = User(
+            username=f"learner{index}",
+            full_name=f"学员{index}",
+            hashed_password="x",
+            department_type=DepartmentType.FRONT_HALL
+        )
+        db_session.add(user)
+        db_session.commit()
+        record = exam_service.start_exam(db_session, user.id, test_exam.id)
+        exam_service.submit_exam(db_session, user.id, ExamSubmit(
+            exam_id=test_exam.id,
+            answers=[AnswerSubmit(**a) for a in answer_sheet(correct=correct)]
+        ))
+        records.append(record.id)
+    return records
+
+
+def _records(record_ids):
+    with SessionLocal() as db:
+        return [db.get(ExamRecord, record_id) for record_id in record_ids]
+
+
+def _correct_first_question(db_session, test_questions):
+    """把第1题（单选）的答案从B修正为C，返回创建的任务ID"""
+    exam_service.update_question(db_session, test_questions[0].id, QuestionUpdate(correct_answer="C"))
+    job = db_session.query(RegradeJob).one()
+    assert job.reason == RegradeReason.ANSWER_KEY
+    assert job.status == RegradeStatus.PENDING
+    return job.id
+
+
+@pytest.mark.exam
+@pytest.mark.integration
+class TestRegradeJob:
+
+    def test_answer_key_lifecycle(self, db_session, test_questions, graded_records):
+        """pending → running（每批提交进度）→ completed"""
+        job_id = _correct_first_question(db_session, test_questions)
+        graded_at_before = [r.graded_at for r in _records(graded_records)]
+        progress = []
+
+        job = regrade_service.run_job(
+            job_id, batch_size=2,
+            on_batch=lambda job: progress.append((job.status, job.processed_records, job.last_record_id))
+        )
+
+        assert progress == [
+            (RegradeStatus.RUNNING, 2, graded_records[1]),
+            (RegradeStatus.RUNNING, 3, graded_records[2]),
+        ]
+        assert job.status == RegradeStatus.COMPLETED
+        assert (job.total_records, job.processed_records, job.changed_records) == (3, 3, 3)
+        assert job.started_at is not None and job.finished_at is not None
+        assert regrade_service.job_progress(job)["percent"] == 100.0
+
+        records = _records(graded_records)
+        assert [r.correct_answers for r in records] == [5, 4, 3]
+        assert [r.status for r in records] == [ExamStatus.PASSED, ExamStatus.PASSED, ExamStatus.PENDING_RETAKE]
+        assert all(r.answers[0]["is_correct"] is False for r in records)
+        assert all(r.paper_snapshot["items"][0]["answer"] == "C" for r in records)  # 成绩详情显示修正后的答案
+        assert all(after > before for after, before in zip([r.graded_at for r in records], graded_at_before))
+
+    def test_resume_from_watermark(self, db_session, test_questions, graded_records):
+        """中途停止放回等待状态，再次执行从 last_record_id 之后继续，已处理的记录不重复计算"""
+        job_id = _correct_first_question(db_session, test_questions)
+        stop = threading.Event()
+
+        job = regrade_service.run_job(job_id, batch_size=2, stop_event=stop, on_batch=lambda job: stop.set())
+
+        assert job.status == RegradeStatus.PENDING
+        assert job.heartbeat_at is None
+        assert (job.processed_records, job.last_record_id) == (2, graded_records[1])
+        assert _records(graded_records)[2].correct_answers == 4  # 第3条尚未处理
+
+        job = regrade_service.run_job(job_id, batch_size=2)
+
+        assert job.status == RegradeStatus.COMPLETED
+        assert (job.total_records, job.processed_records, job.changed_records) == (3, 3, 3)
+        assert [r.correct_answers for r in _records(graded_records)] == [5, 4, 3]
+
+    def test_running_job_not_claimed_twice(self, db_session, test_questions, graded_records):
+        """执行中且有心跳的任务不能被其他进程认领；心跳超时后可以"""
+        job_id = _correct_first_question(db_session, test_questions)
+        job = db_session.get(RegradeJob, job_id)
+        job.status = RegradeStatus.RUNNING
+        job.heartbeat_at = datetime.utcnow()
+        db_session.commit()
+
+        assert regrade_service.run_job(job_id) is None
+
+        job.heartbeat_at = datetime.utcnow() - timedelta(hours=1)
+        db_session.commit()
+        assert regrade_service.run_job(job_id).status == RegradeStatus.COMPLETED
+
+    def test_in_progress_snapshot_updated(self, db_session, test_user, test_exam, test_questions, answer_sheet):
+        """进行中的考试只更新快照中的答案键，交卷时按修正后的答案判分"""
+        record = exam_service.start_exam(db_session, test_user.id, test_exam.id)
+        job_id = _correct_first_question(db_session, test_questions)
+
+        job = regrade_service.run_job(job_id)
+        assert (job.processed_records, job.changed_records) == (1, 0)
+
+        db_session.expire_all()
+        result = exam_service.submit_exam(db_session, test_user.id, ExamSubmit(
+            exam_id=test_exam.id, answers=[AnswerSubmit(**a) for a in answer_sheet()]
+        ))
+        assert result["correct_count"] == len(test_questions) - 1
+        assert _records([record.id])[0].paper_snapshot["items"][0]["answer"] == "C"
+
+    def test_pass_score_change(self, db_session, test_exam, graded_records):
+        """修改及格线：按原交卷时间计算补考冷却"""
+        exam_service.update_exam(db_session, test_exam.id, ExamUpdate(pass_score=90))
+        job = db_session.query(RegradeJob).one()
+        assert job.reason == RegradeReason.PASS_SCORE
+
+        job = regrade_service.run_job(job.id)
+
+        assert job.changed_records == 2
+        records = _records(graded_records)
+        assert [r.status for r in records] == [ExamStatus.PASSED, ExamStatus.PENDING_RETAKE, ExamStatus.PENDING_RETAKE]
+        for record in records[1:]:
+            assert record.can_retake is True
+            assert record.next_retake_at == record.submitted_at + timedelta(days=test_exam.retake_cooldown_days)
+
+
+@pytest.mark.exam
+@pytest.mark.integration
+def test_regrade_api_runs_in_background(client, admin_headers, db_session, test_exam, graded_records):
+    """POST /api/exams/{exam_id}/regrade 返回202，后台线程池执行完成"""
+    response = client.post(f"/api/exams/{test_exam.id}/regrade", headers=admin_headers)
+    assert response.status_code == 202
+    job_id = response.json()["id"]
+
+    for _ in range(100):
+        progress = client.get(f"/api/exams/regrade-jobs/{job_id}", headers=admin_headers).json()
+        if progress["status"] == "completed":
+            break
+        time.sleep(0.05)
+
+    assert progress["status"] == "completed"
+    assert progress["processed_records"] == 3
+    assert progress["changed_records"] == 0
+
+
+@pytest.mark.exam
+@pytest.mark.unit
+class TestApplyScore:
+    """成绩、通过状态与补考字段"""
+
+    def _apply(self, correct, attempt_number=1, **exam_fields):
+        fields = dict(total_questions=10, pass_score=60, allow_retake=True, max_attempts=3, retake_cooldown_days=3)
+        fields.update(exam_fields)
+        exam = Exam(title="考试", exam_type=ExamType.WEEKLY_TEST, **fields)
+        record = ExamRecord(attempt_number=attempt_number)
+        graded_at = datetime(2026, 1, 1, 9, 0)
+        apply_score(exam, record, correct, graded_at)
+        return record, graded_at
+
+    def test_passed(self):
+        record, _ = self._apply(6)
+        assert (record.score, record.status, record.can_retake, record.next_retake_at) == (60, ExamStatus.PASSED, False, None)
+
+    def test_failed_with_attempts_left(self):
+        record, graded_at = self._apply(5, attempt_number=2)
+        assert record.status == ExamStatus.PENDING_RETAKE
+        assert record.can_retake is True
+        assert record.next_retake_at == graded_at + timedelta(days=3)
+
+    def test_failed_on_last_attempt(self):
+        record, _ = self._apply(5, attempt_number=3)
+        assert (record.status, record.can_retake, record.next_retake_at) == (ExamStatus.FAILED, False, None)
+
+    def test_failed_without_retake(self):
+        record, _ = self._apply(0, allow_retake=False)
+        assert (record.score, record.status, record.can_retake) == (0, ExamStatus.FAILED, False)
+
+    def test_no_questions(self):
+        record, _ = self._apply(0, total_questions=0, pass_score=0)
+        assert (record.score, record.status) == (0, ExamStatus.PASSED)